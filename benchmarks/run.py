@@ -0,0 +1,194 @@
+"""Benchmark payload generation, decoding and end-to-end reads and compare them with a JSON baseline."""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Awaitable
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from typing import Final
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.endpoints import BaseEndpoints
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.endpoints import Response
+from keba_keenergy_api.registry import SECTIONS
+from keba_keenergy_api.registry import VARIABLES
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+BASELINE: Final[Path] = Path(__file__).parent / "baseline.json"
+POSITIONS: Final[tuple[int, ...]] = (1, 10, 100)
+REPEAT: Final[int] = 5
+
+Benchmark = Callable[[], Any]
+
+
+def _measure(benchmark: Benchmark) -> float:
+    """Get the best time per call in seconds."""
+    timer: timeit.Timer = timeit.Timer(benchmark)
+    # Calls per repeat, so one repeat takes at least 0.2 seconds
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def _measure_async(loop: asyncio.AbstractEventLoop, benchmark: Callable[[], Awaitable[Any]]) -> float:
+    return _measure(lambda: loop.run_until_complete(benchmark()))
+
+
+def _response(items: list[tuple[Section, int | None]]) -> Response:
+    """Create a response with attributes for all items."""
+    attributes: dict[str, Any] = {
+        "formatId": "fmtTemp",
+        "longText": "Benchmark",
+        "lowerLimit": "0",
+        "upperLimit": "100",
+        "dynLowerLimit": 0,
+        "dynUpperLimit": 100,
+    }
+
+    # Decode the response like a real one
+    response: Response = json.loads(
+        json.dumps(
+            [
+                {
+                    "name": VARIABLES[section].name(idx),
+                    "attributes": attributes,
+                    "value": str(next(iter(section.value.human_readable)).value if section.value.human_readable else 1),
+                }
+                for section, idx in items
+            ],
+        ),
+    )
+
+    return response
+
+
+def run_payload_benchmarks(positions: int) -> dict[str, float]:
+    """Benchmark payload generation and decoding without requests."""
+    endpoints: BaseEndpoints = BaseEndpoints(base_url="http://127.0.0.1", ssl=False)
+    position: Position = Position(heat_pump=positions, heat_circuit=positions, hot_water_tank=positions)
+    items: list[tuple[Section, int | None]] = endpoints._get_read_items(  # noqa: SLF001
+        request=SECTIONS,
+        position=position,
+        allowed_type=None,
+    )
+    response: Response = _response(items)
+    write_request: dict[Section, list[Any]] = {
+        section: [1] * positions for section in SECTIONS if not section.value.read_only
+    }
+
+    def convert() -> None:
+        for (section, _), _response in zip(items, response, strict=True):
+            endpoints._convert_value(section, _response, human_readable=True)  # noqa: SLF001
+            endpoints._clean_attributes(_response)  # noqa: SLF001
+
+    return {
+        "generate_read_payload": _measure(
+            lambda: endpoints._generate_read_payload(  # noqa: SLF001
+                request=SECTIONS,
+                position=position,
+                allowed_type=None,
+                extra_attributes=True,
+            ),
+        ),
+        "generate_write_payload": _measure(
+            lambda: endpoints._generate_write_payload(write_request),  # noqa: SLF001
+        ),
+        "decode_response": _measure(
+            lambda: endpoints._decode_response(items, response, extra_attributes=True),  # noqa: SLF001
+        ),
+        "convert_value_clean_attributes": _measure(convert),
+    }
+
+
+def run_read_benchmarks(positions: int) -> dict[str, float]:
+    """Benchmark full read_data() snapshots against the local simulator."""
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    simulator: KebaKeEnergySimulator = KebaKeEnergySimulator(
+        heat_pumps=positions,
+        heat_circuits=positions,
+        hot_water_tanks=positions,
+    )
+    host: str = loop.run_until_complete(simulator.start())
+    client: KebaKeEnergyAPI = KebaKeEnergyAPI(host=host)
+    position: Position = Position(heat_pump=positions, heat_circuit=positions, hot_water_tank=positions)
+
+    try:
+        loop.run_until_complete(client.connect())
+
+        return {
+            "read_data": _measure_async(
+                loop,
+                lambda: client.read_data(request=SECTIONS, position=position, extra_attributes=True),
+            ),
+        }
+    finally:
+        loop.run_until_complete(client.close())
+        loop.run_until_complete(simulator.stop())
+        loop.close()
+
+
+def run(positions: tuple[int, ...] = POSITIONS) -> dict[str, float]:
+    """Run all benchmarks for all numbers of positions."""
+    results: dict[str, float] = {}
+
+    for _positions in positions:
+        for benchmarks in (run_payload_benchmarks, run_read_benchmarks):
+            for name, seconds in benchmarks(_positions).items():
+                results[f"{name}[{_positions}]"] = seconds
+
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], *, threshold: float) -> list[str]:
+    """Get the names of all benchmarks which are slower than the baseline plus threshold."""
+    return [
+        name for name, seconds in results.items() if name in baseline and seconds > baseline[name] * (1 + threshold)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--positions", type=int, nargs="+", default=list(POSITIONS))
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="Save the results as new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    results: dict[str, float] = run(tuple(args.positions))
+    baseline: dict[str, float] = (
+        json.loads(args.baseline.read_text())["results"] if args.baseline.exists() and not args.save else {}
+    )
+
+    for name, seconds in results.items():
+        change: str = f"{seconds / baseline[name] - 1:+.1%}" if name in baseline else ""
+        print(f"{name:<45} {seconds * 1e6:>12.1f} us {change:>8}")  # noqa: T201
+
+    if args.save:
+        args.baseline.write_text(
+            json.dumps(
+                {"python": platform.python_version(), "machine": platform.machine(), "results": results},
+                indent=2,
+            )
+            + "\n",
+        )
+        return 0
+
+    regressions: list[str] = compare(results, baseline, threshold=args.threshold)
+
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}")  # noqa: T201
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,3 @@
 from keba_keenergy_api.version import __version__  # noqa: F401
 from .api import KebaKeEnergyAPI  # noqa: F401
+from .fleet import KebaKeEnergyFleet  # noqa: F401
@@ -1,78 +1,303 @@
 """Client to interact with KEBA KeEnergy API."""
 
+import asyncio
+import functools
+import time
+import weakref
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from types import TracebackType
 from typing import Any
+from typing import TypeVar
 
 from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
 
+from keba_keenergy_api.batch import ReadBatcher
+from keba_keenergy_api.cache import AttributeCache
+from keba_keenergy_api.cache import LastValueCache
+from keba_keenergy_api.cache import ResponseCache
+from keba_keenergy_api.columns import Columns
+from keba_keenergy_api.constants import API_DEFAULT_BATCH_MAX_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_DNS_CACHE_TTL
+from keba_keenergy_api.constants import API_DEFAULT_HISTORY_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_KEEPALIVE_TIMEOUT
+from keba_keenergy_api.constants import API_DEFAULT_LIMIT_PER_HOST
+from keba_keenergy_api.constants import API_DEFAULT_STREAM_QUEUE_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_TIMEOUT
+from keba_keenergy_api.constants import API_DEFAULT_WRITE_TOLERANCE
 from keba_keenergy_api.constants import Section
 from keba_keenergy_api.constants import SectionPrefix
+from keba_keenergy_api.constants import StreamOverflow
+from keba_keenergy_api.delta import Deadband
+from keba_keenergy_api.delta import DeltaFilter
 from keba_keenergy_api.endpoints import BaseEndpoints
+from keba_keenergy_api.endpoints import EndpointState
 from keba_keenergy_api.endpoints import HeatCircuitEndpoints
 from keba_keenergy_api.endpoints import HeatPumpEndpoints
 from keba_keenergy_api.endpoints import HotWaterTankEndpoints
 from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.endpoints import ReadPayload
+from keba_keenergy_api.endpoints import Response
 from keba_keenergy_api.endpoints import SystemEndpoints
 from keba_keenergy_api.endpoints import Value
 from keba_keenergy_api.endpoints import ValueResponse
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.history import HistoryStore
+from keba_keenergy_api.instrumentation import Instrumentation
+from keba_keenergy_api.records import ValueRecords
+from keba_keenergy_api.scheduler import Callback
+from keba_keenergy_api.scheduler import ErrorCallback
+from keba_keenergy_api.scheduler import PollingScheduler
+from keba_keenergy_api.scheduler import Subscription
+from keba_keenergy_api.storage import SegmentLog
+from keba_keenergy_api.stream import SnapshotStream
+from keba_keenergy_api.write import WriteBuffer
+
+EndpointsT = TypeVar("EndpointsT", bound=BaseEndpoints)
+ReadT = TypeVar("ReadT")
 
 
 class KebaKeEnergyAPI(BaseEndpoints):
     """Client to interact with KEBA KeEnergy API."""
 
-    def __init__(self, host: str, *, ssl: bool = False, session: ClientSession | None = None) -> None:
+    def __init__(
+        self,
+        host: str,
+        *,
+        ssl: bool = False,
+        session: ClientSession | None = None,
+        limit_per_host: int = API_DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = API_DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = API_DEFAULT_DNS_CACHE_TTL,
+        batch_window: float | None = None,
+        batch_max_size: int = API_DEFAULT_BATCH_MAX_SIZE,
+        cache_ttl: dict[Section, float] | None = None,
+        default_cache_ttl: float = 0,
+        position_refresh_interval: float | None = None,
+        cache_attributes: bool = True,
+        write_window: float | None = None,
+        skip_unchanged_writes: bool = False,
+        write_tolerance: float = API_DEFAULT_WRITE_TOLERANCE,
+        deadbands: dict[Section, Deadband] | None = None,
+        default_deadband: Deadband | None = None,
+        history_size: int | None = None,
+        rollup_resolutions: tuple[float, ...] | None = None,
+        storage: SegmentLog | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         """Initialize with Client Session and host."""
         self.host: str = host
         self.schema: str = "https" if ssl else "http"
 
         self.ssl: bool = ssl
-        self.session: ClientSession | None = session
 
-        super().__init__(base_url=self.device_url, ssl=ssl, session=session)
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.dns_cache_ttl: int = dns_cache_ttl
+        self._owns_session: bool = False
+
+        self._scheduler: PollingScheduler = PollingScheduler(read=self._read_items, decode=self._decode_subscription)
+        self._streams: weakref.WeakSet[SnapshotStream] = weakref.WeakSet()
+        self._delta: DeltaFilter = DeltaFilter(deadbands, default_deadband=default_deadband)
+
+        self.position_refresh_interval: float | None = position_refresh_interval
+        self._position: Position | None = None
+        self._position_timestamp: float = 0
+
+        super().__init__(
+            base_url=self.device_url,
+            ssl=ssl,
+            state=EndpointState(
+                session=session,
+                batcher=ReadBatcher(window=batch_window, max_size=batch_max_size) if batch_window is not None else None,
+                cache=ResponseCache(ttl=cache_ttl, default_ttl=default_cache_ttl),
+                attributes=AttributeCache() if cache_attributes else None,
+                writes=WriteBuffer(window=write_window),
+                last_values=LastValueCache(tolerance=write_tolerance),
+                skip_unchanged_writes=skip_unchanged_writes,
+                history=(
+                    HistoryStore(size=history_size or API_DEFAULT_HISTORY_SIZE, resolutions=rollup_resolutions or ())
+                    if history_size or rollup_resolutions
+                    else None
+                ),
+                storage=storage,
+                instrumentation=instrumentation,
+            ),
+        )
+
+    async def __aenter__(self) -> "KebaKeEnergyAPI":
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Open a pooled client session, if no open session was passed to the client."""
+        if self.session is not None and not self.session.closed:
+            return
+
+        connector: TCPConnector = TCPConnector(
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+        self._state.session = ClientSession(
+            connector=connector,
+            timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT),
+            trace_configs=[Instrumentation.trace_config()],
+        )
+        self._owns_session = True
+
+    async def close(self) -> None:
+        """Stop all subscriptions, streams and reads and close the pooled session, if it was opened by the client."""
+        await self._scheduler.stop()
+
+        for stream in list(self._streams):
+            await stream.aclose()
+
+        # Cancel reads which are still in flight after all of their callers gave up
+        in_flight: list[asyncio.Future[Response]] = self.in_flight
+
+        for future in in_flight:
+            future.cancel()
+
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self._state.session = None
+            self._owns_session = False
+
+    @property
+    def in_flight(self) -> list[asyncio.Future[Response]]:
+        """Get the reads in flight, which continue after their callers timed out or were cancelled."""
+        return list(self._state.in_flight.values())
 
     @property
     def device_url(self) -> str:
         """Get device url."""
         return f"{self.schema}://{self.host}"
 
+    @property
+    def session(self) -> ClientSession | None:
+        """Get the client session."""
+        return self._state.session
+
+    def _endpoints(self, endpoints: type[EndpointsT]) -> EndpointsT:
+        return endpoints(base_url=self.device_url, ssl=self.ssl, state=self._state)
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Get the response cache."""
+        return self._state.cache
+
+    @property
+    def attribute_cache(self) -> AttributeCache | None:
+        """Get the attribute cache."""
+        return self._state.attributes
+
+    @property
+    def history(self) -> HistoryStore | None:
+        """Get the history and rollups of read values."""
+        return self._state.history
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Get the request instrumentation."""
+        return self._state.instrumentation
+
+    @property
+    def storage(self) -> SegmentLog | None:
+        """Get the segment log of read values."""
+        return self._state.storage
+
+    @property
+    def delta_filter(self) -> DeltaFilter:
+        """Get the delta filter for read_data()."""
+        return self._delta
+
+    @property
+    def skip_unchanged_writes(self) -> bool:
+        """Check if writes of unchanged values are skipped."""
+        return self._state.skip_unchanged_writes
+
+    @skip_unchanged_writes.setter
+    def skip_unchanged_writes(self, skip_unchanged_writes: bool) -> None:
+        self._state.skip_unchanged_writes = skip_unchanged_writes
+
+    @property
+    def last_values(self) -> LastValueCache:
+        """Get the last read or written values."""
+        return self._state.last_values
+
+    @asynccontextmanager
+    async def buffered_writes(self) -> AsyncIterator[WriteBuffer]:
+        """Buffer all writes and send them with one request on exit (not supported by concurrent tasks).
+
+        If the block raises an exception, all pending writes are discarded instead of sending a partial configuration.
+        """
+        self._state.writes.open()
+
+        try:
+            yield self._state.writes
+        except BaseException:
+            await self._state.writes.close(discard=True)
+            raise
+
+        await self._state.writes.close()
+
     @property
     def system(self) -> SystemEndpoints:
         """Get system endpoints."""
-        return SystemEndpoints(base_url=self.device_url, ssl=self.ssl, session=self.session)
+        return self._endpoints(SystemEndpoints)
 
     @property
     def hot_water_tank(self) -> HotWaterTankEndpoints:
         """Get hot water tank endpoints."""
-        return HotWaterTankEndpoints(base_url=self.device_url, ssl=self.ssl, session=self.session)
+        return self._endpoints(HotWaterTankEndpoints)
 
     @property
     def heat_pump(self) -> HeatPumpEndpoints:
         """Get heat pump endpoints."""
-        return HeatPumpEndpoints(base_url=self.device_url, ssl=self.ssl, session=self.session)
+        return self._endpoints(HeatPumpEndpoints)
 
     @property
     def heat_circuit(self) -> HeatCircuitEndpoints:
         """Get heat circuit endpoints."""
-        return HeatCircuitEndpoints(base_url=self.device_url, ssl=self.ssl, session=self.session)
+        return self._endpoints(HeatCircuitEndpoints)
 
-    async def read_data(
-        self,
-        request: Section | list[Section],
-        position: Position | int | list[int | None] | None = None,
-        *,
-        human_readable: bool = True,
-        extra_attributes: bool = True,
-    ) -> dict[str, ValueResponse]:
-        """Read multiple data from API with one request."""
-        if position is None:
-            position = await self.system.get_positions()
+    async def get_positions(self, *, refresh: bool = False) -> Position:
+        """Get the cached number of heat pumps, heating circuits and hot water tanks."""
+        if (
+            refresh
+            or self._position is None
+            or (
+                self.position_refresh_interval is not None
+                and time.monotonic() - self._position_timestamp > self.position_refresh_interval
+            )
+        ):
+            self._position = await self.system.get_positions()
+            self._position_timestamp = time.monotonic()
 
-        response: dict[str, list[Value]] = await self._read_data(
-            request=request,
-            position=position,
-            human_readable=human_readable,
-            extra_attributes=extra_attributes,
-        )
+        return self._position
 
+    def invalidate_positions(self) -> None:
+        """Remove the cached positions, so they are requested again with the next read."""
+        self._position = None
+
+    @staticmethod
+    def _group_by_section(response: dict[str, list[Value]]) -> dict[str, ValueResponse]:
         data: dict[str, ValueResponse] = {
             SectionPrefix.SYSTEM.value: {},
             SectionPrefix.HOT_WATER_TANK.value: {},
@@ -98,6 +323,173 @@ class KebaKeEnergyAPI(BaseEndpoints):
 
         return data
 
-    async def write_data(self, request: dict[Section, list[Any]]) -> None:
-        """Write multiple data to API with one request."""
-        await self._write_values(request=request)
+    async def read_data(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = None,
+        *,
+        human_readable: bool = True,
+        extra_attributes: bool = True,
+        max_age: float | None = None,
+        delta: bool = False,
+    ) -> dict[str, ValueResponse]:
+        """Read multiple data from API with one request (only changed values since the last delta read)."""
+        response: dict[str, list[Value]] = await self._read_at_position(
+            functools.partial(
+                self._read_data,
+                request=request,
+                human_readable=human_readable,
+                extra_attributes=extra_attributes,
+                max_age=max_age,
+            ),
+            position,
+        )
+
+        data: dict[str, ValueResponse] = self._group_by_section(response)
+
+        return self._delta.filter(data) if delta else data
+
+    async def read_records(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = None,
+        *,
+        human_readable: bool = True,
+        extra_attributes: bool = True,
+        max_age: float | None = None,
+    ) -> ValueRecords:
+        """Read multiple data from API with one request into compact value records."""
+        return await self._read_at_position(
+            functools.partial(
+                self._read_records,
+                request=request,
+                human_readable=human_readable,
+                extra_attributes=extra_attributes,
+                max_age=max_age,
+            ),
+            position,
+        )
+
+    async def read_columns(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = None,
+        *,
+        human_readable: bool = False,
+        max_age: float | None = None,
+        columns: Columns | None = None,
+        device: int = 0,
+    ) -> Columns:
+        """Read multiple data from API with one request into columns (numeric values instead of names by default)."""
+        return await self._read_at_position(
+            functools.partial(
+                self._read_columns,
+                request=request,
+                columns=Columns([self.host], human_readable=human_readable) if columns is None else columns,
+                device=device,
+                max_age=max_age,
+            ),
+            position,
+        )
+
+    async def _read_at_position(
+        self,
+        read: Callable[..., Awaitable[ReadT]],
+        position: Position | int | list[int | None] | None,
+    ) -> ReadT:
+        if position is not None:
+            return await read(position=position)
+
+        position = await self.get_positions()
+
+        try:
+            return await read(position=position)
+        except APIError:
+            # The device topology may have changed, e.g. a heat circuit was removed
+            self.invalidate_positions()
+            raise
+
+    async def _read_items(self, items: list[tuple[Section, int | None]]) -> Response:
+        payload: list[ReadPayload] = self._generate_items_payload(items, extra_attributes=True)
+        return await self._read_cached(payload, max_ages=[0] * len(payload))
+
+    def _decode_subscription(self, subscription: Subscription, response: Response) -> dict[str, ValueResponse]:
+        return self._group_by_section(
+            self._decode_response(
+                subscription.items,
+                response,
+                human_readable=subscription.human_readable,
+                extra_attributes=True,
+            ),
+        )
+
+    async def subscribe(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = None,
+        *,
+        interval: float,
+        callback: Callback,
+        on_error: ErrorCallback | None = None,
+        human_readable: bool = True,
+    ) -> Subscription:
+        """Read data every interval seconds and pass it to the callback until the subscription is cancelled."""
+        if not isinstance(request, list):
+            request = [request]
+
+        if position is None:
+            position = await self.get_positions()
+        elif isinstance(position, int):
+            position = [position]
+
+        subscription: Subscription = Subscription(
+            self._get_read_items(request=request, position=position, allowed_type=None),
+            interval=interval,
+            callback=callback,
+            on_error=on_error,
+            human_readable=human_readable,
+        )
+        self._scheduler.add(subscription)
+
+        return subscription
+
+    def stream(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = None,
+        *,
+        interval: float,
+        queue_size: int = API_DEFAULT_STREAM_QUEUE_SIZE,
+        overflow: StreamOverflow = StreamOverflow.DROP_OLDEST,
+        human_readable: bool = True,
+        extra_attributes: bool = True,
+        max_age: float | None = None,
+        delta: bool = False,
+    ) -> SnapshotStream:
+        """Read data every interval seconds and iterate over the timestamped snapshots."""
+        stream: SnapshotStream = SnapshotStream(
+            functools.partial(
+                self.read_data,
+                request,
+                position,
+                human_readable=human_readable,
+                extra_attributes=extra_attributes,
+                max_age=max_age,
+            ),
+            interval=interval,
+            queue_size=queue_size,
+            overflow=overflow,
+            delta=DeltaFilter(self._delta.deadbands, default_deadband=self._delta.default_deadband) if delta else None,
+        )
+        self._streams.add(stream)
+
+        return stream
+
+    async def write_data(
+        self,
+        request: dict[Section, list[Any]],
+        *,
+        skip_unchanged: bool | None = None,
+    ) -> list[str]:
+        """Write multiple data to API with one request and return the names of skipped unchanged variables."""
+        return await self._write_values(request=request, skip_unchanged=skip_unchanged)
@@ -0,0 +1,119 @@
+"""Merge concurrent read requests into one API request."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+from keba_keenergy_api.constants import API_DEFAULT_BATCH_MAX_SIZE
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import Payload
+    from keba_keenergy_api.endpoints import ReadPayload
+    from keba_keenergy_api.endpoints import Response
+    from keba_keenergy_api.endpoints import WritePayload
+
+Sender: TypeAlias = Callable[["Payload"], Awaitable["Response"]]
+
+
+class ReadBatcher:
+    """Collect read payloads over a short window and send them with one request."""
+
+    def __init__(self, *, window: float, max_size: int = API_DEFAULT_BATCH_MAX_SIZE) -> None:
+        self.window: float = window
+        self.max_size: int = max_size
+
+        self._pending: list[tuple[Payload, asyncio.Future[Response]]] = []
+        self._pending_size: int = 0
+        self._send: Sender | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def read(self, payload: "Payload", send: Sender) -> "Response":
+        """Add the payload to the next batch and wait for its part of the response."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        if self._pending and self._pending_size + len(payload) > self.max_size:
+            self._flush()
+
+        future: asyncio.Future[Response] = loop.create_future()
+        self._pending.append((payload, future))
+        self._pending_size += len(payload)
+
+        if self._send is None:
+            self._send = send
+
+        if self._pending_size >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending: list[tuple[Payload, asyncio.Future[Response]]] = self._pending
+        send: Sender | None = self._send
+
+        self._pending = []
+        self._pending_size = 0
+        self._send = None
+
+        if pending and send is not None:
+            task: asyncio.Task[None] = asyncio.create_task(self._send_batch(pending, send))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _send_batch(pending: list[tuple["Payload", "asyncio.Future[Response]"]], send: Sender) -> None:
+        payload: Payload = ReadBatcher._merge_payloads([_payload for _payload, _ in pending])
+
+        try:
+            response: Response = await send(payload)
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as error:  # noqa: BLE001
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        response_by_name: dict[str | None, dict[str, str]] = {
+            _response.get("name"): _response for _response in response
+        }
+
+        for _payload, future in pending:
+            if not future.done():
+                future.set_result(
+                    [
+                        ReadBatcher._get_response(item, response_by_name[item["name"]])
+                        for item in _payload
+                        if item["name"] in response_by_name
+                    ],
+                )
+
+    @staticmethod
+    def _merge_payloads(payloads: list["Payload"]) -> "Payload":
+        # Send every variable only once and with attributes, if any caller needs them
+        items: dict[str, ReadPayload | WritePayload] = {}
+
+        for payload in payloads:
+            for item in payload:
+                if item["name"] not in items or item.get("attr") == "1":
+                    items[item["name"]] = item
+
+        return list(items.values())
+
+    @staticmethod
+    def _get_response(item: "ReadPayload | WritePayload", response: dict[str, str]) -> dict[str, str]:
+        if item.get("attr") == "0" and "attributes" in response:
+            # Another caller needed the attributes of this variable
+            return {key: value for key, value in response.items() if key != "attributes"}
+
+        return response
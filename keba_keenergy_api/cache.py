@@ -0,0 +1,151 @@
+"""Cache read responses by fully qualified variable name."""
+
+import time
+from collections.abc import Iterable
+from typing import Any
+from typing import NamedTuple
+
+from keba_keenergy_api.constants import API_DEFAULT_WRITE_TOLERANCE
+from keba_keenergy_api.constants import Section
+
+
+class CacheEntry(NamedTuple):
+    """A cached response from the API."""
+
+    timestamp: float
+    response: dict[str, Any]
+    attributes: bool
+
+
+class ResponseCache:
+    """Class to cache read responses with a time to live per section member."""
+
+    def __init__(self, ttl: dict[Section, float] | None = None, *, default_ttl: float = 0) -> None:
+        self.ttl: dict[Section, float] = dict(ttl or {})
+        self.default_ttl: float = default_ttl
+        self._entries: dict[str, CacheEntry] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, section: Section) -> float:
+        """Get the time to live in seconds for a section member."""
+        return self.ttl.get(section, self.default_ttl)
+
+    def set_ttl(self, section: Section, ttl: float) -> None:
+        """Set the time to live in seconds for a section member."""
+        self.ttl[section] = ttl
+
+    def get(self, name: str, *, max_age: float, attributes: bool = False) -> dict[str, Any] | None:
+        """Get a cached response, if it is not older than max age seconds."""
+        if max_age <= 0:
+            # The cache is disabled for this read, which is neither a hit nor a miss
+            return None
+
+        entry: CacheEntry | None = self._entries.get(name)
+
+        if entry is None or (attributes and not entry.attributes) or time.monotonic() - entry.timestamp > max_age:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        if entry.attributes and not attributes:
+            # Don't return attributes to reads without attributes
+            return {key: value for key, value in entry.response.items() if key != "attributes"}
+
+        return entry.response
+
+    def set(self, name: str, response: dict[str, Any], *, attributes: bool = False) -> None:
+        """Add a response to the cache."""
+        self._entries[name] = CacheEntry(
+            timestamp=time.monotonic(),
+            response=response,
+            attributes=attributes,
+        )
+
+    def invalidate(self, names: Iterable[str] | None = None) -> None:
+        """Remove the given or all responses from the cache."""
+        if names is None:
+            self._entries.clear()
+        else:
+            for name in names:
+                self._entries.pop(name, None)
+
+
+class AttributeCache:
+    """Class to cache the static attributes (e.g. limits) of variables."""
+
+    def __init__(self, attributes: dict[str, dict[str, Any]] | None = None) -> None:
+        self._attributes: dict[str, dict[str, Any]] = dict(attributes or {})
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._attributes
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Get the cached attributes from a variable."""
+        return self._attributes.get(name)
+
+    def set(self, name: str, attributes: dict[str, Any]) -> None:
+        """Add the attributes from a variable to the cache."""
+        self._attributes[name] = attributes
+
+    def invalidate(self, names: Iterable[str] | None = None) -> None:
+        """Remove the given or all attributes from the cache."""
+        if names is None:
+            self._attributes.clear()
+        else:
+            for name in names:
+                self._attributes.pop(name, None)
+
+    def dump(self) -> dict[str, dict[str, Any]]:
+        """Dump all cached attributes as JSON serializable dictionary."""
+        return {name: dict(attributes) for name, attributes in self._attributes.items()}
+
+    def load(self, attributes: dict[str, dict[str, Any]]) -> None:
+        """Load attributes e.g. from a previous dump."""
+        self._attributes.update({name: dict(_attributes) for name, _attributes in attributes.items()})
+
+
+class LastValueCache:
+    """Class to remember the last read or written value of variables."""
+
+    def __init__(self, *, tolerance: float = API_DEFAULT_WRITE_TOLERANCE) -> None:
+        self.tolerance: float = tolerance
+        self._values: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, name: str) -> str | None:
+        """Get the last known value from a variable."""
+        return self._values.get(name)
+
+    def set(self, name: str, value: str) -> None:
+        """Set the last known value from a variable."""
+        self._values[name] = value
+
+    def is_unchanged(self, name: str, value: str) -> bool:
+        """Check if the value matches the last known value (numbers within the tolerance)."""
+        last_value: str | None = self._values.get(name)
+
+        if last_value is None:
+            return False
+
+        try:
+            return abs(float(last_value) - float(value)) <= self.tolerance
+        except ValueError:
+            return last_value == value
+
+    def invalidate(self, names: Iterable[str] | None = None) -> None:
+        """Remove the given or all values from the cache."""
+        if names is None:
+            self._values.clear()
+        else:
+            for name in names:
+                self._values.pop(name, None)
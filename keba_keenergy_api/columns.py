@@ -0,0 +1,97 @@
+"""Columnar read results with parallel position and device arrays."""
+
+from array import array
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import MutableSequence
+from typing import Any
+from typing import TYPE_CHECKING
+
+from keba_keenergy_api.constants import Section
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def is_numeric(section: Section, *, human_readable: bool) -> bool:
+    """Check if the values of a section member are stored as floats."""
+    if human_readable and section.value.human_readable is not None:
+        return False
+
+    return section.value.value_type is not str
+
+
+class Column:
+    """Class to keep the values of a section member with their positions (starting at 1) and device indexes."""
+
+    __slots__ = ("section", "values", "positions", "devices")
+
+    def __init__(self, section: Section, *, numeric: bool = True) -> None:
+        self.section: Section = section
+        # Strings (e.g. names or human readable values) are kept in a list
+        self.values: MutableSequence[Any] = array("d")
+
+        if not numeric:
+            self.values = []
+
+        self.positions: array[int] = array("i")
+        self.devices: array[int] = array("i")
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def numeric(self) -> bool:
+        """Check if the values are stored as contiguous floats."""
+        return isinstance(self.values, array)
+
+    def append(self, value: float | str, position: int, device: int = 0) -> None:
+        """Add a value of a position and device."""
+        self.values.append(value)
+        self.positions.append(position)
+        self.devices.append(device)
+
+    def to_numpy(self) -> "tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]":
+        """Get copies of values, positions and devices as NumPy arrays."""
+        try:
+            import numpy as np
+        except ImportError as error:
+            msg: str = "NumPy is not installed! Install it with: pip install keba-keenergy-api[numpy]"
+            raise ImportError(msg) from error
+
+        return (
+            np.array(self.values, dtype=np.float64 if self.numeric else object),
+            np.array(self.positions, dtype=np.int32),
+            np.array(self.devices, dtype=np.int32),
+        )
+
+
+class Columns(Mapping[Section, Column]):
+    """Class to keep one column per section member of one or many devices."""
+
+    def __init__(self, hosts: list[str] | None = None, *, human_readable: bool = False) -> None:
+        self.hosts: list[str] = list(hosts or [])
+        self.human_readable: bool = human_readable
+        self.errors: dict[str, Exception] = {}
+        self._columns: dict[Section, Column] = {}
+
+    def __getitem__(self, section: Section) -> Column:
+        return self._columns[section]
+
+    def __iter__(self) -> Iterator[Section]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def add(self, section: Section, value: float | str, position: int, device: int = 0) -> None:
+        """Add a value of a section member at a position of a device."""
+        column: Column | None = self._columns.get(section)
+
+        if column is None:
+            column = self._columns[section] = Column(
+                section,
+                numeric=is_numeric(section, human_readable=self.human_readable),
+            )
+
+        column.append(value, position, device)
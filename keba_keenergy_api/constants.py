@@ -7,6 +7,25 @@ from typing import NamedTuple
 from typing import TypeAlias
 
 API_DEFAULT_TIMEOUT: int = 10
+API_DEFAULT_LIMIT_PER_HOST: int = 4
+API_DEFAULT_KEEPALIVE_TIMEOUT: float = 30
+API_DEFAULT_DNS_CACHE_TTL: int = 300
+API_DEFAULT_BATCH_MAX_SIZE: int = 50
+API_DEFAULT_WRITE_TOLERANCE: float = 0.001
+API_DEFAULT_SCHEDULER_SLACK: float = 0.1
+API_DEFAULT_STREAM_QUEUE_SIZE: int = 10
+API_DEFAULT_FLEET_LIMIT: int = 64
+API_DEFAULT_FLEET_LIMIT_PER_HOST: int = 2
+API_DEFAULT_SHARD_MAX_RESTARTS: int = 3
+API_DEFAULT_HISTORY_SIZE: int = 1024
+API_DEFAULT_ROLLUP_SIZE: int = 1440
+API_DEFAULT_SEGMENT_SIZE: int = 4 * 1024 * 1024
+API_DEFAULT_BLOCK_SIZE: int = 256
+API_DEFAULT_SIMULATOR_DRIFT: float = 0.05
+API_DEFAULT_SIMULATOR_REVERSION: float = 0.01
+API_DEFAULT_METRICS_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+API_DEFAULT_PARQUET_WINDOW: float = 3600
+API_DEFAULT_PARQUET_COMPRESSION: str = "zstd"
 
 
 class EndpointPath:
@@ -299,6 +318,13 @@ class HeatCircuit(Enum):
     )
 
 
+class StreamOverflow(str, Enum):
+    """Stream overflow policies, if the queue is full."""
+
+    DROP_OLDEST: Final[str] = "drop_oldest"
+    BLOCK: Final[str] = "block"
+
+
 class SectionPrefix(str, Enum):
     """Section prefixes."""
 
@@ -0,0 +1,90 @@
+"""Filter values which didn't change beyond a deadband."""
+
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.registry import VARIABLES
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import Value
+    from keba_keenergy_api.endpoints import ValueResponse
+
+SECTIONS_BY_KEY: Final[dict[tuple[str, str], Section]] = {
+    (variable.position_key, variable.short_key): section for section, variable in VARIABLES.items()
+}
+
+
+class Deadband(NamedTuple):
+    """Absolute and relative (to the last emitted value) change, which is ignored."""
+
+    absolute: float = 0
+    relative: float = 0
+
+
+class DeltaFilter:
+    """Class to emit only values which changed beyond the deadband of their section member."""
+
+    def __init__(
+        self,
+        deadbands: dict[Section, Deadband] | None = None,
+        *,
+        default_deadband: Deadband | None = None,
+    ) -> None:
+        self.deadbands: dict[Section, Deadband] = dict(deadbands or {})
+        self.default_deadband: Deadband = default_deadband or Deadband()
+        self._last_values: dict[tuple[str, str], list[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._last_values)
+
+    def get_deadband(self, section: Section) -> Deadband:
+        """Get the deadband for a section member."""
+        return self.deadbands.get(section, self.default_deadband)
+
+    def set_deadband(self, section: Section, deadband: Deadband) -> None:
+        """Set the deadband for a section member."""
+        self.deadbands[section] = deadband
+
+    def reset(self) -> None:
+        """Remove all last emitted values, so all values are emitted again."""
+        self._last_values.clear()
+
+    def filter(self, data: dict[str, "ValueResponse"]) -> dict[str, "ValueResponse"]:
+        """Get only changed values (all positions of a changed section member) from read data."""
+        changed: dict[str, ValueResponse] = {}
+
+        for prefix, values in data.items():
+            changed[prefix] = {}
+
+            for key, value in values.items():
+                _values: list[Value] = value if isinstance(value, list) else [value]
+                _key: tuple[str, str] = (prefix, key)
+                section: Section | None = SECTIONS_BY_KEY.get(_key)
+                last_values: list[Any] | None = self._last_values.get(_key)
+
+                if (
+                    section is None
+                    or last_values is None
+                    or len(last_values) != len(_values)
+                    or any(
+                        self._is_changed(last_value, _value.get("value"), deadband=self.get_deadband(section))
+                        for last_value, _value in zip(last_values, _values, strict=True)
+                    )
+                ):
+                    changed[prefix][key] = value
+                    self._last_values[_key] = [_value.get("value") for _value in _values]
+
+        return changed
+
+    @staticmethod
+    def _is_changed(last_value: Any, value: Any, *, deadband: Deadband) -> bool:  # noqa: ANN401
+        if isinstance(value, bool) or not isinstance(value, int | float) or not isinstance(last_value, int | float):
+            return bool(value != last_value)
+
+        _value: float = value
+        _last_value: float = last_value
+
+        return abs(_value - _last_value) > max(deadband.absolute, abs(_last_value) * deadband.relative)
@@ -1,20 +1,25 @@
 """Retrieve hot water tank data."""
 
-import importlib
+import asyncio
+import functools
 import json
-import re
+import time
 from enum import Enum
 from json import JSONDecodeError
 from re import Pattern
 from typing import Any
 from typing import NamedTuple
-from typing import TYPE_CHECKING
 from typing import TypeAlias
 from typing import TypedDict
 
 from aiohttp import ClientSession
 from aiohttp import ClientTimeout
 
+from keba_keenergy_api.batch import ReadBatcher
+from keba_keenergy_api.cache import AttributeCache
+from keba_keenergy_api.cache import LastValueCache
+from keba_keenergy_api.cache import ResponseCache
+from keba_keenergy_api.columns import Columns
 from keba_keenergy_api.constants import API_DEFAULT_TIMEOUT
 from keba_keenergy_api.constants import EndpointPath
 from keba_keenergy_api.constants import HeatCircuit
@@ -28,9 +33,17 @@ from keba_keenergy_api.constants import System
 from keba_keenergy_api.constants import SystemOperatingMode
 from keba_keenergy_api.error import APIError
 from keba_keenergy_api.error import InvalidJsonError
-
-if TYPE_CHECKING:
-    from types import ModuleType
+from keba_keenergy_api.history import HistoryStore
+from keba_keenergy_api.instrumentation import Instrumentation
+from keba_keenergy_api.instrumentation import RequestTrace
+from keba_keenergy_api.records import ValueRecord
+from keba_keenergy_api.records import ValueRecords
+from keba_keenergy_api.records import intern_attributes
+from keba_keenergy_api.registry import KEY_PATTERN
+from keba_keenergy_api.registry import VARIABLES
+from keba_keenergy_api.registry import Variable
+from keba_keenergy_api.storage import SegmentLog
+from keba_keenergy_api.write import WriteBuffer
 
 
 class ReadPayload(TypedDict):
@@ -59,28 +72,100 @@ Payload: TypeAlias = list[ReadPayload | WritePayload]
 Response: TypeAlias = list[dict[str, str]]
 
 
-class BaseEndpoints:
-    """Base class for all endpoint classes."""
+IGNORED_ATTRIBUTES: frozenset[str] = frozenset({"unitId", "longText", "formatId", "dynLowerLimit", "dynUpperLimit"})
+
+
+@functools.cache
+def _get_attribute_key(attr_key: str) -> str:
+    return KEY_PATTERN.sub("_", attr_key).lower()
+
 
-    KEY_PATTERN: Pattern[str] = re.compile(r"(?<!^)(?=[A-Z])")
+class EndpointState:
+    """Class to share the session, caches and buffers of a client with all its endpoints."""
+
+    __slots__ = (
+        "session",
+        "batcher",
+        "in_flight",
+        "cache",
+        "attributes",
+        "writes",
+        "last_values",
+        "skip_unchanged_writes",
+        "history",
+        "storage",
+        "instrumentation",
+    )
 
     def __init__(
         self,
-        base_url: str,
         *,
-        ssl: bool,
         session: ClientSession | None = None,
+        batcher: ReadBatcher | None = None,
+        cache: ResponseCache | None = None,
+        attributes: AttributeCache | None = None,
+        writes: WriteBuffer | None = None,
+        last_values: LastValueCache | None = None,
+        skip_unchanged_writes: bool = False,
+        history: HistoryStore | None = None,
+        storage: SegmentLog | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
+        self.session: ClientSession | None = session
+        self.batcher: ReadBatcher | None = batcher
+        self.in_flight: dict[str, asyncio.Future[Response]] = {}
+        self.cache: ResponseCache = ResponseCache() if cache is None else cache
+        self.attributes: AttributeCache | None = attributes
+        self.writes: WriteBuffer = WriteBuffer() if writes is None else writes
+        self.last_values: LastValueCache = LastValueCache() if last_values is None else last_values
+        self.skip_unchanged_writes: bool = skip_unchanged_writes
+        self.history: HistoryStore | None = history
+        self.storage: SegmentLog | None = storage
+        self.instrumentation: Instrumentation = Instrumentation() if instrumentation is None else instrumentation
+
+
+class BaseEndpoints:
+    """Base class for all endpoint classes."""
+
+    KEY_PATTERN: Pattern[str] = KEY_PATTERN
+
+    def __init__(self, base_url: str, *, ssl: bool, state: EndpointState | None = None) -> None:
         self._base_url: str = base_url
         self._ssl: bool = ssl
-        self._session: ClientSession | None = session
+        self._state: EndpointState = EndpointState() if state is None else state
 
-    async def _post(self, payload: str | None = None, endpoint: str | None = None) -> Response:
+    async def _post(self, payload: str | None = None, endpoint: str | None = None, *, variables: int = 0) -> Response:
         """Run a POST request against the API."""
+        if not self._state.instrumentation:
+            return await self._send(payload, endpoint)
+
+        trace: RequestTrace = RequestTrace()
+        error: str | None = None
+
+        try:
+            return await self._send(payload, endpoint, trace=trace)
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self._state.instrumentation.emit(
+                trace.metrics(
+                    self._base_url.partition("://")[2],
+                    endpoint or "",
+                    variables=variables,
+                    request_bytes=len(payload.encode()) if payload else 0,
+                    error=error,
+                ),
+            )
+
+    async def _send(self, payload: str | None, endpoint: str | None, *, trace: RequestTrace | None = None) -> Response:
         session: ClientSession = (
-            self._session
-            if self._session and not self._session.closed
-            else ClientSession(timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT))
+            self._state.session
+            if self._state.session and not self._state.session.closed
+            else ClientSession(
+                timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT),
+                trace_configs=[Instrumentation.trace_config()] if trace is not None else None,
+            )
         )
 
         try:
@@ -88,15 +173,25 @@ class BaseEndpoints:
                 f"{self._base_url}{endpoint if endpoint else ''}",
                 ssl=self._ssl,
                 data=payload,
+                **({"trace_request_ctx": trace} if trace is not None else {}),
             ) as resp:
+                if trace is not None:
+                    trace.status = resp.status
+                    trace.ttfb = trace.elapsed()
+
                 response: list[dict[str, Any]] = await resp.json(
                     content_type="application/json;charset=utf-8",
                 )
+
+                if trace is not None:
+                    trace.decode = trace.elapsed() - (trace.ttfb or 0)
+                    trace.response_bytes = len(await resp.read())
         except JSONDecodeError as error:
             response_text = await resp.text()
             raise InvalidJsonError(response_text) from error
         finally:
-            if not self._session:
+            # Close temporary sessions, also if the pooled session was closed in the meantime
+            if session is not self._state.session:
                 await session.close()
 
         if isinstance(response, dict) and "developerMessage" in response:
@@ -107,40 +202,119 @@ class BaseEndpoints:
 
         return response
 
-    def _get_real_key(self, key: Section, *, key_prefix: bool = True) -> str:
-        class_name: str = key.__class__.__name__
-        _real_key: str = key.name.lower()
+    async def _post_read(self, payload: Payload) -> Response:
+        return await self._post(
+            payload=json.dumps(payload),
+            endpoint=EndpointPath.READ_WRITE_VARS,
+            variables=len(payload),
+        )
+
+    async def _send_read(self, payload: Payload) -> Response:
+        if self._state.batcher is not None:
+            return await self._state.batcher.read(payload, send=self._post_read)
+
+        return await self._post_read(payload)
+
+    async def _fetch(self, payload: Payload) -> Response:
+        """Send a read request or wait for an identical one which is already in flight."""
+        key: str = json.dumps(payload)
+        in_flight: asyncio.Future[Response] | None = self._state.in_flight.get(key)
+
+        if in_flight is None:
+            # Send in its own task, so cancelled callers don't cancel the read of other callers
+            in_flight = self._state.in_flight[key] = asyncio.create_task(self._send_read(payload))
+            in_flight.add_done_callback(functools.partial(self._finish_fetch, key))
+
+        return list(await asyncio.shield(in_flight))
+
+    def _finish_fetch(self, key: str, future: "asyncio.Future[Response]") -> None:
+        if self._state.in_flight.get(key) is future:
+            del self._state.in_flight[key]
+
+        if not future.cancelled():
+            # Mark the exception as retrieved, if all callers were cancelled
+            future.exception()
+
+    async def _read_cached(self, payload: list[ReadPayload], max_ages: list[float]) -> Response:
+        """Read the payload and fetch only values which are not cached or older than max age."""
+        response: Response = []
+        missing_payload: Payload = []
+        missing_attributes: dict[str, bool] = {}
+
+        for item, max_age in zip(payload, max_ages, strict=True):
+            attributes: bool = item["attr"] == "1"
+            cached: dict[str, Any] | None = self._state.cache.get(item["name"], max_age=max_age, attributes=attributes)
+
+            if cached is None:
+                missing_payload.append(item)
+                missing_attributes[item["name"]] = attributes
+            else:
+                response.append(cached)
+
+        if missing_payload:
+            fetched: Response = await self._fetch(missing_payload)
+            timestamp: float = time.time()
 
-        if key_prefix is True:
-            _real_key = f"{self.KEY_PATTERN.sub('_', class_name).lower()}_{_real_key}"
+            for value in fetched:
+                name: str | None = value.get("name")
 
-        return _real_key
+                if name in missing_attributes:
+                    self._state.cache.set(name, value, attributes=missing_attributes[name])
 
-    def _get_key_prefix(self, key: Section) -> str:
-        module: ModuleType = importlib.import_module("keba_keenergy_api.constants")
-        class_name: str = key.__class__.__name__
-        prefix: str = getattr(module, f"{self.KEY_PATTERN.sub('_', class_name).upper()}_PREFIX", "")
-        return prefix
+                    if "value" in value:
+                        self._state.last_values.set(name, value["value"])
+
+                        if self._state.history is not None:
+                            self._state.history.record(name, timestamp, value["value"])
+
+                        if self._state.storage is not None:
+                            self._state.storage.record(name, timestamp, value["value"])
+
+            response += fetched
+
+        return response
+
+    @staticmethod
+    def _get_real_key(key: Section, *, key_prefix: bool = True) -> str:
+        variable: Variable = VARIABLES[key]
+        return variable.key if key_prefix is True else variable.short_key
+
+    @staticmethod
+    def _get_key_prefix(key: Section) -> str:
+        return VARIABLES[key].prefix
 
     @staticmethod
     def _get_position(idx: int | None) -> str:
         _position: str = "" if idx is None else f"[{idx}]"
         return _position
 
-    def _get_position_index(self, section: Section, position: Position | list[int | None]) -> list[int | None]:
+    @staticmethod
+    def _get_position_index(section: Section, position: Position | list[int | None]) -> list[int | None]:
         idx: list[int | None] = []
 
         if isinstance(section, System):
             idx = [None]
         elif isinstance(position, Position):
-            position_key: str = f"{self.KEY_PATTERN.sub('_', section.__class__.__name__).lower()}"
-            _position: int | None = getattr(position, position_key, None)
+            _position: int | None = getattr(position, VARIABLES[section].position_key, None)
             idx = list(range(_position)) if _position else [None]
         elif isinstance(position, list):
             idx = [p if p is None else (p - 1) for p in position]
 
         return idx
 
+    def _get_read_items(
+        self,
+        request: list[Section],
+        position: Position | list[int | None],
+        allowed_type: list[type[Enum]] | None,
+    ) -> list[tuple[Section, int | None]]:
+        return [
+            (section, idx)
+            for section in request
+            if not allowed_type or type(section) in allowed_type
+            for idx in self._get_position_index(section=section, position=position)
+        ]
+
     def _generate_read_payload(
         self,
         request: list[Section],
@@ -148,48 +322,166 @@ class BaseEndpoints:
         allowed_type: list[type[Enum]] | None,
         *,
         extra_attributes: bool = False,
-    ) -> Payload:
-        payload: Payload = []
-
-        for section in request:
-            if (allowed_type and type(section) in allowed_type) or allowed_type is None:
-                for idx in self._get_position_index(section=section, position=position):
-                    payload += [
-                        ReadPayload(
-                            name=f"{self._get_key_prefix(section)}{self._get_position(idx)}.{section.value.value}",
-                            attr=str(int(extra_attributes is True)),
-                        ),
-                    ]
+    ) -> list[ReadPayload]:
+        return self._generate_items_payload(
+            self._get_read_items(request=request, position=position, allowed_type=allowed_type),
+            extra_attributes=extra_attributes,
+        )
+
+    def _generate_items_payload(
+        self,
+        items: list[tuple[Section, int | None]],
+        *,
+        extra_attributes: bool = False,
+    ) -> list[ReadPayload]:
+        payload: list[ReadPayload] = []
+
+        for section, idx in items:
+            name: str = VARIABLES[section].name(idx)
+            # Attributes are static, so request them only if they are not cached yet
+            attr: bool = extra_attributes is True and (
+                self._state.attributes is None or name not in self._state.attributes
+            )
+            payload.append(ReadPayload(name=name, attr="1" if attr else "0"))
 
         return payload
 
     @staticmethod
-    def _convert_value(section: Section, response: list[dict[str, Any]], *, human_readable: bool) -> float | int | str:
-        value: float | int | str = section.value.value_type(response[0]["value"])
+    def _convert_value(section: Section, response: dict[str, Any], *, human_readable: bool) -> float | int | str:
+        value: float | int | str = section.value.value_type(response["value"])
         value = round(value, 2) if isinstance(value, float) else value
 
         if human_readable and section.value.human_readable:
             try:
                 value = section.value.human_readable(value).name.lower()
             except ValueError as error:
-                msg: str = f"Can't convert value to human readable value! {response[0]}"
+                msg: str = f"Can't convert value to human readable value! {response}"
 
                 raise APIError(msg) from error
 
         return value
 
     @staticmethod
-    def _clean_attributes(response: list[dict[str, Any]]) -> dict[str, Any]:
-        attributes: dict[str, Any] = response[0].get("attributes", {})
-        converted_attributes: dict[str, Any] = {}
-        re_pattern: Pattern[str] = re.compile(r"(?<!^)(?=[A-Z])")
+    def _clean_attributes(response: dict[str, Any]) -> dict[str, Any]:
+        attributes: dict[str, Any] = response.get("attributes", {})
+
+        return {
+            _get_attribute_key(attr_key): attr_value
+            for attr_key, attr_value in attributes.items()
+            if attr_key not in IGNORED_ATTRIBUTES
+        }
+
+    def _get_attributes(self, name: str, response: dict[str, Any], *, extra_attributes: bool) -> dict[str, Any]:
+        if not extra_attributes or self._state.attributes is None:
+            return self._clean_attributes(response=response)
+
+        attributes: dict[str, Any] | None = self._state.attributes.get(name)
+
+        if attributes is None:
+            attributes = self._clean_attributes(response=response)
+
+            if "attributes" in response:
+                self._state.attributes.set(name, attributes)
+
+        return dict(attributes)
+
+    def _decode_response(
+        self,
+        items: list[tuple[Section, int | None]],
+        response: Response,
+        *,
+        key_prefix: bool = True,
+        human_readable: bool = True,
+        extra_attributes: bool = False,
+    ) -> dict[str, list[Value]]:
+        """Map the response values by their variable names to the requested section members."""
+        data: dict[str, list[Value]] = {}
+
+        for (section, idx), _response in zip(items, self._match_response(items, response), strict=True):
+            response_key: str = self._get_real_key(section, key_prefix=key_prefix)
+            data.setdefault(response_key, []).append(
+                {
+                    "value": self._convert_value(section, response=_response, human_readable=human_readable),
+                    "attributes": self._get_attributes(
+                        VARIABLES[section].name(idx),
+                        _response,
+                        extra_attributes=extra_attributes,
+                    ),
+                },
+            )
+
+        return data
+
+    def _decode_records(
+        self,
+        items: list[tuple[Section, int | None]],
+        response: Response,
+        *,
+        timestamp: float,
+        human_readable: bool = True,
+        extra_attributes: bool = False,
+    ) -> ValueRecords:
+        """Map the response values to value records with shared attributes per section member."""
+        records: dict[Section, list[ValueRecord]] = {}
+
+        for (section, idx), _response in zip(items, self._match_response(items, response), strict=True):
+            records.setdefault(section, []).append(
+                ValueRecord(
+                    self._convert_value(section, response=_response, human_readable=human_readable),
+                    timestamp,
+                    intern_attributes(
+                        self._get_attributes(
+                            VARIABLES[section].name(idx),
+                            _response,
+                            extra_attributes=extra_attributes,
+                        ),
+                    ),
+                ),
+            )
+
+        return ValueRecords({section: tuple(_records) for section, _records in records.items()})
+
+    def _decode_columns(
+        self,
+        items: list[tuple[Section, int | None]],
+        response: Response,
+        columns: Columns,
+        *,
+        device: int = 0,
+    ) -> Columns:
+        """Append the response values to the columns of the requested section members."""
+        # Convert all values first, so a failed conversion doesn't leave a partial device in the columns
+        values: list[float | int | str] = [
+            self._convert_value(section, response=_response, human_readable=columns.human_readable)
+            for (section, _), _response in zip(items, self._match_response(items, response), strict=True)
+        ]
+
+        for (section, idx), value in zip(items, values, strict=True):
+            columns.add(section, value, 1 if idx is None else idx + 1, device)
+
+        return columns
+
+    @staticmethod
+    def _match_response(items: list[tuple[Section, int | None]], response: Response) -> list[dict[str, Any]]:
+        """Get the response values in the order of the requested items."""
+        response_by_name: dict[str, dict[str, Any]] = {str(_response.get("name")): _response for _response in response}
+        names: list[str] = [VARIABLES[section].name(idx) for section, idx in items]
+        matched: list[dict[str, Any]] = []
+
+        for name in names:
+            _response: dict[str, Any] | None = response_by_name.get(name)
 
-        for attr_key in attributes:
-            if attr_key not in ["unitId", "longText", "formatId", "dynLowerLimit", "dynUpperLimit"]:
-                new_attr_key: str = re_pattern.sub("_", attr_key).lower()
-                converted_attributes[new_attr_key] = attributes[attr_key]
+            if _response is None:
+                msg: str = f"Missing variable in response! {name}"
+                raise APIError(msg)
 
-        return converted_attributes
+            matched.append(_response)
+
+        if unexpected := response_by_name.keys() - set(names):
+            msg = f"Unexpected variables in response! {', '.join(sorted(unexpected))}"
+            raise APIError(msg)
+
+        return matched
 
     async def _read_data(
         self,
@@ -200,7 +492,77 @@ class BaseEndpoints:
         key_prefix: bool = True,
         human_readable: bool = True,
         extra_attributes: bool = False,
+        max_age: float | None = None,
     ) -> dict[str, list[Value]]:
+        items, response = await self._read_response(
+            request,
+            position,
+            allowed_type,
+            extra_attributes=extra_attributes,
+            max_age=max_age,
+        )
+
+        return self._decode_response(
+            items,
+            response,
+            key_prefix=key_prefix,
+            human_readable=human_readable,
+            extra_attributes=extra_attributes,
+        )
+
+    async def _read_records(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = 1,
+        *,
+        human_readable: bool = True,
+        extra_attributes: bool = False,
+        max_age: float | None = None,
+    ) -> ValueRecords:
+        items, response = await self._read_response(
+            request,
+            position,
+            None,
+            extra_attributes=extra_attributes,
+            max_age=max_age,
+        )
+
+        return self._decode_records(
+            items,
+            response,
+            timestamp=time.time(),
+            human_readable=human_readable,
+            extra_attributes=extra_attributes,
+        )
+
+    async def _read_columns(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None = 1,
+        *,
+        columns: Columns,
+        device: int = 0,
+        max_age: float | None = None,
+    ) -> Columns:
+        items, response = await self._read_response(
+            request,
+            position,
+            None,
+            extra_attributes=False,
+            max_age=max_age,
+        )
+
+        return self._decode_columns(items, response, columns, device=device)
+
+    async def _read_response(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int | None] | None,
+        allowed_type: type[Enum] | list[type[Enum]] | None,
+        *,
+        extra_attributes: bool,
+        max_age: float | None,
+    ) -> tuple[list[tuple[Section, int | None]], Response]:
         if isinstance(request, System | HotWaterTank | HeatPump | HeatCircuit):
             request = [request]
 
@@ -210,85 +572,80 @@ class BaseEndpoints:
         if isinstance(allowed_type, type):
             allowed_type = [allowed_type]
 
-        payload: Payload = self._generate_read_payload(
+        items: list[tuple[Section, int | None]] = self._get_read_items(
             request=request,
             position=position,
             allowed_type=allowed_type,
-            extra_attributes=extra_attributes,
         )
+        payload: list[ReadPayload] = self._generate_items_payload(items, extra_attributes=extra_attributes)
+        max_ages: list[float] = [
+            self._state.cache.get_ttl(section) if max_age is None else max_age for section, _ in items
+        ]
 
-        _response: list[dict[str, Any]] = await self._post(
-            payload=json.dumps(payload),
-            endpoint=EndpointPath.READ_WRITE_VARS,
-        )
-
-        response: dict[str, list[Value]] = {}
-
-        for section in request:
-            if (allowed_type and type(section) in allowed_type) or not allowed_type:
-                for _ in self._get_position_index(section=section, position=position):
-                    response_key: str = self._get_real_key(section, key_prefix=key_prefix)
+        return items, await self._read_cached(payload, max_ages=max_ages)
 
-                    if not response.get(response_key):
-                        response[response_key] = []
-
-                    _value: Value = {
-                        "value": self._convert_value(
-                            section,
-                            response=_response,
-                            human_readable=human_readable,
-                        ),
-                        "attributes": self._clean_attributes(response=_response),
-                    }
-
-                    response[response_key].append(_value)
-                    del _response[0]
-
-        return response
-
-    def _generate_write_payload(self, request: dict[Section, list[Any]]) -> Payload:
-        payload: Payload = []
+    def _generate_write_payload(self, request: dict[Section, list[Any]]) -> list[WritePayload]:
+        payload: list[WritePayload] = []
 
         for endpoint_properties, values in request.items():
             if not endpoint_properties.value.read_only:
+                variable: Variable = VARIABLES[endpoint_properties]
+
                 if isinstance(values, list | tuple):
                     for idx, value in enumerate(values):
                         if value is not None:
-                            payload += [
-                                WritePayload(
-                                    name=(
-                                        f"{self._get_key_prefix(endpoint_properties)}{self._get_position(idx)}."
-                                        f"{endpoint_properties.value.value}"
-                                    ),
-                                    value=str(value),
-                                ),
-                            ]
+                            payload.append(WritePayload(name=variable.name(idx), value=str(value)))
                 else:
-                    payload += [
-                        WritePayload(
-                            name=f"{self._get_key_prefix(endpoint_properties)}.{endpoint_properties.value.value}",
-                            value=str(values),
-                        ),
-                    ]
+                    payload.append(WritePayload(name=variable.name(), value=str(values)))
 
         return payload
 
-    async def _write_values(self, request: dict[Section, list[Any] | Any]) -> None:
-        payload: Payload = self._generate_write_payload(request)
-
+    async def _post_write(self, payload: list[WritePayload]) -> None:
         await self._post(
             payload=json.dumps(payload),
             endpoint=f"{EndpointPath.READ_WRITE_VARS}?action=set",
+            variables=len(payload),
         )
 
+        self._state.cache.invalidate(item["name"] for item in payload)
+
+        for item in payload:
+            self._state.last_values.set(item["name"], item["value"])
+
+    async def _write_values(
+        self,
+        request: dict[Section, list[Any] | Any],
+        *,
+        skip_unchanged: bool | None = None,
+    ) -> list[str]:
+        payload: list[WritePayload] = self._generate_write_payload(request)
+        skipped: list[str] = []
+
+        if self._state.skip_unchanged_writes if skip_unchanged is None else skip_unchanged:
+            skipped = [
+                item["name"] for item in payload if self._state.last_values.is_unchanged(item["name"], item["value"])
+            ]
+            payload = [item for item in payload if item["name"] not in skipped]
+
+            # Pending writes of other values would overwrite the unchanged value
+            for name in skipped:
+                self._state.writes.discard(name)
+
+        if not payload:
+            return skipped
+
+        if self._state.writes.active:
+            await self._state.writes.write(payload, send=self._post_write)
+        else:
+            await self._post_write(payload)
+
+        return skipped
+
 
 class SystemEndpoints(BaseEndpoints):
     """Class to retrieve the system data."""
 
-    def __init__(self, base_url: str, *, ssl: bool, session: ClientSession | None = None) -> None:
-        super().__init__(base_url=base_url, ssl=ssl, session=session)
-
-    async def get_positions(self) -> Position:
+    async def get_positions(self, *, max_age: float | None = None) -> Position:
         """Get number of heat pump, heating circuit and hot water tank."""
         response: dict[str, list[Value]] = await self._read_data(
             request=[
@@ -300,6 +657,7 @@ class SystemEndpoints(BaseEndpoints):
             key_prefix=False,
             allowed_type=System,
             extra_attributes=True,
+            max_age=max_age,
         )
 
         return Position(**{k.replace("_numbers", ""): int(v[0]["value"]) for k, v in response.items()})
@@ -320,53 +678,58 @@ class SystemEndpoints(BaseEndpoints):
         response[0].pop("ret")
         return response[0]
 
-    async def get_number_of_hot_water_tanks(self) -> int:
+    async def get_number_of_hot_water_tanks(self, *, max_age: float | None = None) -> int:
         """Get number of hot water tanks."""
         response: dict[str, list[Value]] = await self._read_data(
             request=System.HOT_WATER_TANK_NUMBERS,
             position=None,
             extra_attributes=True,
+            max_age=max_age,
         )
         _key: str = self._get_real_key(System.HOT_WATER_TANK_NUMBERS)
         return int(response[_key][0]["value"])
 
-    async def get_number_of_heat_pumps(self) -> int:
+    async def get_number_of_heat_pumps(self, *, max_age: float | None = None) -> int:
         """Get number of heat pumps."""
         response: dict[str, list[Value]] = await self._read_data(
             request=System.HEAT_PUMP_NUMBERS,
             position=None,
             extra_attributes=True,
+            max_age=max_age,
         )
         _key: str = self._get_real_key(System.HEAT_PUMP_NUMBERS)
         return int(response[_key][0]["value"])
 
-    async def get_number_of_heating_circuits(self) -> int:
+    async def get_number_of_heating_circuits(self, *, max_age: float | None = None) -> int:
         """Get number of heating circuits."""
         response: dict[str, list[Value]] = await self._read_data(
             request=System.HEAT_CIRCUIT_NUMBERS,
             position=None,
             extra_attributes=True,
+            max_age=max_age,
         )
         _key: str = self._get_real_key(System.HEAT_CIRCUIT_NUMBERS)
         return int(response[_key][0]["value"])
 
-    async def get_outdoor_temperature(self) -> float:
+    async def get_outdoor_temperature(self, *, max_age: float | None = None) -> float:
         """Get outdoor temperature."""
         response: dict[str, Any] = await self._read_data(
             request=System.OUTDOOR_TEMPERATURE,
             position=None,
             extra_attributes=True,
+            max_age=max_age,
         )
         _key: str = self._get_real_key(System.OUTDOOR_TEMPERATURE)
         return float(response[_key][0]["value"])
 
-    async def get_operating_mode(self, *, human_readable: bool = True) -> int | str:
+    async def get_operating_mode(self, *, human_readable: bool = True, max_age: float | None = None) -> int | str:
         """Get system operating mode."""
         response: dict[str, list[Value]] = await self._read_data(
             request=System.OPERATING_MODE,
             position=None,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _key: str = self._get_real_key(System.OPERATING_MODE)
 
@@ -391,27 +754,32 @@ class SystemEndpoints(BaseEndpoints):
 class HotWaterTankEndpoints(BaseEndpoints):
     """Class to send and retrieve the hot water tank data."""
 
-    def __init__(self, base_url: str, *, ssl: bool, session: ClientSession | None = None) -> None:
-        super().__init__(base_url=base_url, ssl=ssl, session=session)
-
-    async def get_temperature(self, position: int | None = 1) -> float:
+    async def get_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get current temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_operating_mode(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_operating_mode(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get operating mode."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.OPERATING_MODE,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.OPERATING_MODE)
@@ -435,34 +803,37 @@ class HotWaterTankEndpoints(BaseEndpoints):
 
         await self._write_values(request={HotWaterTank.OPERATING_MODE: modes})
 
-    async def get_lower_limit_temperature(self, position: int | None = 1) -> int:
+    async def get_lower_limit_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> int:
         """Get lower limit temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.MAX_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.MAX_TEMPERATURE)
         return int(response[_key][_idx]["attributes"]["lower_limit"])
 
-    async def get_upper_limit_temperature(self, position: int | None = 1) -> int:
+    async def get_upper_limit_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> int:
         """Get uper limit temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.MAX_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.MAX_TEMPERATURE)
         return int(response[_key][_idx]["attributes"]["upper_limit"])
 
-    async def get_min_temperature(self, position: int | None = 1) -> float:
+    async def get_min_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get minimum temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.MIN_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.MIN_TEMPERATURE)
@@ -473,12 +844,13 @@ class HotWaterTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HotWaterTank.MIN_TEMPERATURE: temperatures})
 
-    async def get_max_temperature(self, position: int | None = 1) -> float:
+    async def get_max_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get maximum temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.MAX_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.MAX_TEMPERATURE)
@@ -489,13 +861,20 @@ class HotWaterTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HotWaterTank.MAX_TEMPERATURE: temperatures})
 
-    async def get_heat_request(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_heat_request(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get heat request."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HotWaterTank.HEAT_REQUEST,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HotWaterTank.HEAT_REQUEST)
@@ -510,27 +889,32 @@ class HotWaterTankEndpoints(BaseEndpoints):
 class HeatPumpEndpoints(BaseEndpoints):
     """Class to retrieve the heat pump data."""
 
-    def __init__(self, base_url: str, *, ssl: bool, session: ClientSession | None = None) -> None:
-        super().__init__(base_url=base_url, ssl=ssl, session=session)
-
-    async def get_name(self, position: int | None = 1) -> str:
+    async def get_name(self, position: int | None = 1, *, max_age: float | None = None) -> str:
         """Get heat pump name."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.NAME,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.NAME)
         return str(response[_key][_idx]["value"])
 
-    async def get_state(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_state(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get heat pump state."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.STATE,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.STATE)
@@ -542,13 +926,20 @@ class HeatPumpEndpoints(BaseEndpoints):
 
         return _value
 
-    async def get_operating_mode(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_operating_mode(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get operating mode."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.OPERATING_MODE,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.OPERATING_MODE)
@@ -572,123 +963,150 @@ class HeatPumpEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatPump.OPERATING_MODE: modes})
 
-    async def get_circulation_pump(self, position: int | None = 1) -> float:
+    async def get_circulation_pump(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get circulation pump."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.CIRCULATION_PUMP,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.CIRCULATION_PUMP)
         return float(response[_key][_idx]["value"])
 
-    async def get_inflow_temperature(self, position: int | None = 1) -> float:
+    async def get_inflow_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get inflow temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.INFLOW_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.INFLOW_TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_reflux_temperature(self, position: int | None = 1) -> float:
+    async def get_reflux_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get reflux temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.REFLUX_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.REFLUX_TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_source_input_temperature(self, position: int | None = 1) -> float:
+    async def get_source_input_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get source input temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.SOURCE_INPUT_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.SOURCE_INPUT_TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_source_output_temperature(self, position: int | None = 1) -> float:
+    async def get_source_output_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get source output temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.SOURCE_OUTPUT_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.SOURCE_OUTPUT_TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_compressor_input_temperature(self, position: int | None = 1) -> float:
+    async def get_compressor_input_temperature(
+        self,
+        position: int | None = 1,
+        *,
+        max_age: float | None = None,
+    ) -> float:
         """Get compressor input temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.COMPRESSOR_INPUT_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.COMPRESSOR_INPUT_TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_compressor_output_temperature(self, position: int | None = 1) -> float:
+    async def get_compressor_output_temperature(
+        self,
+        position: int | None = 1,
+        *,
+        max_age: float | None = None,
+    ) -> float:
         """Get compressor output temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.COMPRESSOR_OUTPUT_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.COMPRESSOR_OUTPUT_TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_compressor(self, position: int | None = 1) -> float:
+    async def get_compressor(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get compressor."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.COMPRESSOR,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.COMPRESSOR)
         return float(response[_key][_idx]["value"])
 
-    async def get_high_pressure(self, position: int | None = 1) -> float:
+    async def get_high_pressure(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get high pressure in bar."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.HIGH_PRESSURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.HIGH_PRESSURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_low_pressure(self, position: int | None = 1) -> float:
+    async def get_low_pressure(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get low pressure in bar."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.LOW_PRESSURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.LOW_PRESSURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_heat_request(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_heat_request(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get heat request."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatPump.HEAT_REQUEST,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatPump.HEAT_REQUEST)
@@ -703,37 +1121,37 @@ class HeatPumpEndpoints(BaseEndpoints):
 class HeatCircuitEndpoints(BaseEndpoints):
     """Class to send and retrieve the heat pump data."""
 
-    def __init__(self, base_url: str, *, ssl: bool, session: ClientSession | None = None) -> None:
-        super().__init__(base_url=base_url, ssl=ssl, session=session)
-
-    async def get_name(self, position: int | None = 1) -> str:
+    async def get_name(self, position: int | None = 1, *, max_age: float | None = None) -> str:
         """Get heat circuit name."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.NAME,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.NAME)
         return str(response[_key][_idx]["value"])
 
-    async def get_temperature(self, position: int | None = 1) -> float:
+    async def get_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.TEMPERATURE)
         return float(response[_key][_idx]["value"])
 
-    async def get_day_temperature(self, position: int | None = 1) -> float:
+    async def get_day_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get day temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.DAY_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.DAY_TEMPERATURE)
@@ -744,23 +1162,25 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.DAY_TEMPERATURE: temperatures})
 
-    async def get_day_temperature_threshold(self, position: int | None = 1) -> float:
+    async def get_day_temperature_threshold(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get day temperature threshold."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.DAY_TEMPERATURE_THRESHOLD,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.DAY_TEMPERATURE_THRESHOLD)
         return float(response[_key][_idx]["value"])
 
-    async def get_night_temperature(self, position: int | None = 1) -> float | None:
+    async def get_night_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float | None:
         """Get night temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.NIGHT_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.NIGHT_TEMPERATURE)
@@ -771,23 +1191,25 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.NIGHT_TEMPERATURE: temperatures})
 
-    async def get_night_temperature_threshold(self, position: int | None = 1) -> float:
+    async def get_night_temperature_threshold(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get night temperature threshold."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.NIGHT_TEMPERATURE_THRESHOLD,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.NIGHT_TEMPERATURE_THRESHOLD)
         return float(response[_key][_idx]["value"])
 
-    async def get_holiday_temperature(self, position: int | None = 1) -> float:
+    async def get_holiday_temperature(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get holiday temperature."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.HOLIDAY_TEMPERATURE,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.HOLIDAY_TEMPERATURE)
@@ -798,12 +1220,13 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.HOLIDAY_TEMPERATURE: temperatures})
 
-    async def get_temperature_offset(self, position: int | None = 1) -> float:
+    async def get_temperature_offset(self, position: int | None = 1, *, max_age: float | None = None) -> float:
         """Get temperature offset."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.TEMPERATURE_OFFSET,
             position=position,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.TEMPERATURE_OFFSET)
@@ -814,13 +1237,20 @@ class HeatCircuitEndpoints(BaseEndpoints):
         offsets: list[float | None] = [offset if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TEMPERATURE_OFFSET: offsets})
 
-    async def get_operating_mode(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_operating_mode(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get operating mode."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.OPERATING_MODE,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.OPERATING_MODE)
@@ -844,13 +1274,20 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatCircuit.OPERATING_MODE: modes})
 
-    async def get_heat_request(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_heat_request(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get heat request."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.HEAT_REQUEST,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.HEAT_REQUEST)
@@ -862,13 +1299,20 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         return _value
 
-    async def get_external_cool_request(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_external_cool_request(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get external cool request."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.EXTERNAL_COOL_REQUEST,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.EXTERNAL_COOL_REQUEST)
@@ -879,13 +1323,20 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         return _value
 
-    async def get_external_heat_request(self, position: int | None = 1, *, human_readable: bool = True) -> int | str:
+    async def get_external_heat_request(
+        self,
+        position: int | None = 1,
+        *,
+        human_readable: bool = True,
+        max_age: float | None = None,
+    ) -> int | str:
         """Get external heat request."""
         response: dict[str, list[Value]] = await self._read_data(
             request=HeatCircuit.EXTERNAL_HEAT_REQUEST,
             position=position,
             human_readable=human_readable,
             extra_attributes=True,
+            max_age=max_age,
         )
         _idx: int = position - 1 if position else 0
         _key: str = self._get_real_key(HeatCircuit.EXTERNAL_HEAT_REQUEST)
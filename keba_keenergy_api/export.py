@@ -0,0 +1,217 @@
+"""Export snapshots as Arrow record batches and stream them to Parquet files."""
+
+import importlib
+import math
+from pathlib import Path
+from types import ModuleType
+from types import TracebackType
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+from keba_keenergy_api.constants import API_DEFAULT_PARQUET_COMPRESSION
+from keba_keenergy_api.constants import API_DEFAULT_PARQUET_WINDOW
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.records import ValueRecords
+from keba_keenergy_api.registry import VARIABLES
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from keba_keenergy_api.endpoints import Value
+    from keba_keenergy_api.endpoints import ValueResponse
+    from keba_keenergy_api.fleet import FleetSnapshot
+
+# Columns of every schema before the section member columns
+TIMESTAMP_FIELD: Final[str] = "timestamp"
+HOST_FIELD: Final[str] = "host"
+POSITION_FIELD: Final[str] = "position"
+
+FIELD_TYPES: Final[dict[type[float | int | str], str]] = {float: "float64", int: "int64", str: "string"}
+
+
+def _import_pyarrow(name: str = "pyarrow") -> ModuleType:
+    try:
+        return importlib.import_module(name)
+    except ImportError as error:
+        msg: str = "PyArrow is not installed! Install it with: pip install keba-keenergy-api[pyarrow]"
+        raise ImportError(msg) from error
+
+
+def get_field_type(section: Section, *, human_readable: bool) -> str:
+    """Get the Arrow type name of a section member from its value type."""
+    if human_readable and section.value.human_readable is not None:
+        return "string"
+
+    return FIELD_TYPES[section.value.value_type]
+
+
+class ArrowExporter:
+    """Class to collect snapshots as rows per host and position (starting at 1) and convert them to record batches."""
+
+    def __init__(self, request: Section | list[Section], *, human_readable: bool = True) -> None:
+        self.sections: list[Section] = list(dict.fromkeys(request if isinstance(request, list) else [request]))
+        self.human_readable: bool = human_readable
+        self.field_types: dict[str, str] = {
+            TIMESTAMP_FIELD: "timestamp",
+            HOST_FIELD: "string",
+            POSITION_FIELD: "int16",
+        } | {
+            VARIABLES[section].key: get_field_type(section, human_readable=human_readable) for section in self.sections
+        }
+        self.columns: dict[str, list[Any]] = {name: [] for name in self.field_types}
+
+        self._converters: dict[Section, type[float | int | str]] = {
+            section: str if self.field_types[VARIABLES[section].key] == "string" else section.value.value_type
+            for section in self.sections
+        }
+        self._schema: "pa.Schema | None" = None
+
+    def __len__(self) -> int:
+        return len(self.columns[TIMESTAMP_FIELD])
+
+    @property
+    def schema(self) -> "pa.Schema":
+        """Get the Arrow schema, which only depends on the requested section members."""
+        if self._schema is None:
+            pyarrow: ModuleType = _import_pyarrow()
+            self._schema = pyarrow.schema(
+                [
+                    pyarrow.field(TIMESTAMP_FIELD, pyarrow.timestamp("us", tz="UTC"), nullable=False),
+                    pyarrow.field(HOST_FIELD, pyarrow.string(), nullable=False),
+                    pyarrow.field(POSITION_FIELD, pyarrow.int16(), nullable=False),
+                    *(
+                        pyarrow.field(name, getattr(pyarrow, field_type)())
+                        for name, field_type in self.field_types.items()
+                        if name not in (TIMESTAMP_FIELD, HOST_FIELD, POSITION_FIELD)
+                    ),
+                ],
+            )
+
+        return self._schema
+
+    def add(self, host: str, timestamp: float, data: "dict[str, ValueResponse] | ValueRecords") -> None:
+        """Add the data of a host as one row per position, system values are only set at position 1."""
+        values: dict[Section, list[Any]] = (
+            self._get_record_values(data) if isinstance(data, ValueRecords) else self._get_response_values(data)
+        )
+        rows: int = max((len(_values) for _values in values.values()), default=0)
+
+        for idx in range(rows):
+            self.columns[TIMESTAMP_FIELD].append(round(timestamp * 1_000_000))
+            self.columns[HOST_FIELD].append(host)
+            self.columns[POSITION_FIELD].append(idx + 1)
+
+            for section in self.sections:
+                _values: list[Any] = values.get(section, [])
+                self.columns[VARIABLES[section].key].append(_values[idx] if idx < len(_values) else None)
+
+    def add_snapshot(self, snapshot: "FleetSnapshot") -> None:
+        """Add a fleet snapshot, snapshots with errors are skipped."""
+        if snapshot.data is not None:
+            self.add(snapshot.host, snapshot.timestamp, snapshot.data)
+
+    def flush(self) -> "pa.RecordBatch":
+        """Get all collected rows as record batch and clear them."""
+        pyarrow: ModuleType = _import_pyarrow()
+        batch: "pa.RecordBatch" = pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(self.columns[field.name], type=field.type) for field in self.schema],
+            schema=self.schema,
+        )
+
+        for column in self.columns.values():
+            column.clear()
+
+        return batch
+
+    def _convert(self, section: Section, value: float | str | None) -> float | str | None:
+        return None if value is None else self._converters[section](value)
+
+    def _get_record_values(self, records: ValueRecords) -> dict[Section, list[Any]]:
+        return {
+            section: [self._convert(section, record.value) for record in records[section]]
+            for section in self.sections
+            if section in records
+        }
+
+    def _get_response_values(self, data: "dict[str, ValueResponse]") -> dict[Section, list[Any]]:
+        values: dict[Section, list[Any]] = {}
+
+        for section in self.sections:
+            response: "list[Value] | Value | None" = data.get(VARIABLES[section].position_key, {}).get(
+                VARIABLES[section].short_key,
+            )
+
+            if response is None:
+                # Missing in delta mode or not requested
+                continue
+
+            items: "list[Value]" = [response] if isinstance(response, dict) else response
+            values[section] = [self._convert(section, item.get("value")) for item in items]
+
+        return values
+
+
+class ParquetSnapshotWriter:
+    """Class to stream snapshots to a Parquet file with one row group per time window (in seconds)."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        request: Section | list[Section],
+        *,
+        human_readable: bool = True,
+        window: float = API_DEFAULT_PARQUET_WINDOW,
+        compression: str = API_DEFAULT_PARQUET_COMPRESSION,
+    ) -> None:
+        self.path: Path = Path(path)
+        self.window: float = window
+        self.exporter: ArrowExporter = ArrowExporter(request, human_readable=human_readable)
+
+        self._pyarrow: ModuleType = _import_pyarrow()
+        self._writer: Any = _import_pyarrow("pyarrow.parquet").ParquetWriter(
+            self.path,
+            self.exporter.schema,
+            compression=compression,
+        )
+        self._window: int | None = None
+
+    def __enter__(self) -> "ParquetSnapshotWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def add(self, host: str, timestamp: float, data: "dict[str, ValueResponse] | ValueRecords") -> None:
+        """Add the data of a host and write the rows of the previous time window as row group."""
+        window: int = math.floor(timestamp / self.window)
+
+        if self._window is not None and window > self._window:
+            self.flush()
+
+        self._window = window if self._window is None else max(window, self._window)
+        self.exporter.add(host, timestamp, data)
+
+    def add_snapshot(self, snapshot: "FleetSnapshot") -> None:
+        """Add a fleet snapshot, snapshots with errors are skipped."""
+        if snapshot.data is not None:
+            self.add(snapshot.host, snapshot.timestamp, snapshot.data)
+
+    def flush(self) -> None:
+        """Write all collected rows as one row group."""
+        if len(self.exporter) > 0:
+            batch: "pa.RecordBatch" = self.exporter.flush()
+            self._writer.write_table(
+                self._pyarrow.Table.from_batches([batch], schema=self.exporter.schema),
+                row_group_size=batch.num_rows,
+            )
+
+    def close(self) -> None:
+        """Write the remaining rows and close the file."""
+        self.flush()
+        self._writer.close()
@@ -0,0 +1,276 @@
+"""Client to interact with many KEBA KeEnergy APIs."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.columns import Columns
+from keba_keenergy_api.constants import API_DEFAULT_DNS_CACHE_TTL
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_LIMIT
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_LIMIT_PER_HOST
+from keba_keenergy_api.constants import API_DEFAULT_KEEPALIVE_TIMEOUT
+from keba_keenergy_api.constants import API_DEFAULT_TIMEOUT
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import Position
+    from keba_keenergy_api.endpoints import ValueResponse
+    from keba_keenergy_api.records import ValueRecords
+
+
+class FleetSnapshot(NamedTuple):
+    """Data or error from one host at a point in time (seconds since the epoch)."""
+
+    host: str
+    timestamp: float
+    data: "dict[str, ValueResponse] | ValueRecords | None" = None
+    error: Exception | None = None
+
+
+class KebaKeEnergyFleet:
+    """Client to interact with many KEBA KeEnergy APIs with one shared connection pool."""
+
+    def __init__(
+        self,
+        hosts: list[str],
+        *,
+        ssl: bool = False,
+        limit: int = API_DEFAULT_FLEET_LIMIT,
+        limit_per_host: int = API_DEFAULT_FLEET_LIMIT_PER_HOST,
+        timeout: float = API_DEFAULT_TIMEOUT,
+        keepalive_timeout: float = API_DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = API_DEFAULT_DNS_CACHE_TTL,
+        client_options: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize with hosts and concurrency limits."""
+        self.hosts: list[str] = list(dict.fromkeys(hosts))
+        self.ssl: bool = ssl
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.timeout: float = timeout
+        self.keepalive_timeout: float = keepalive_timeout
+        self.dns_cache_ttl: int = dns_cache_ttl
+        self.client_options: dict[str, Any] = dict(client_options or {})
+
+        self.session: ClientSession | None = None
+        self._clients: dict[str, KebaKeEnergyAPI] = {}
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(limit)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {
+            host: asyncio.Semaphore(limit_per_host) for host in self.hosts
+        }
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    def __getitem__(self, host: str) -> KebaKeEnergyAPI:
+        if self.session is None:
+            msg: str = "Fleet is not connected!"
+            raise KeyError(msg)
+
+        return self._clients[host]
+
+    async def __aenter__(self) -> "KebaKeEnergyFleet":
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Open the shared connection pool and create a client for each host."""
+        if self.session is not None and not self.session.closed:
+            return
+
+        connector: TCPConnector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+        self.session = ClientSession(
+            connector=connector,
+            timeout=ClientTimeout(total=self.timeout),
+            trace_configs=[Instrumentation.trace_config()],
+        )
+        self._clients = {
+            host: KebaKeEnergyAPI(host, ssl=self.ssl, session=self.session, **self.client_options)
+            for host in self.hosts
+        }
+
+    def add_hosts(self, hosts: list[str]) -> None:
+        """Add hosts to the fleet."""
+        for host in hosts:
+            if host in self._host_semaphores:
+                continue
+
+            self.hosts.append(host)
+            self._host_semaphores[host] = asyncio.Semaphore(self.limit_per_host)
+
+            if self.session is not None:
+                self._clients[host] = KebaKeEnergyAPI(host, ssl=self.ssl, session=self.session, **self.client_options)
+
+    async def close(self) -> None:
+        """Close all clients and the shared connection pool."""
+        for client in self._clients.values():
+            await client.close()
+
+        if self.session is not None:
+            await self.session.close()
+
+        self.session = None
+        self._clients = {}
+
+    async def read_data(
+        self,
+        request: Section | list[Section],
+        position: "Position | int | list[int | None] | None" = None,
+        *,
+        human_readable: bool = True,
+        extra_attributes: bool = True,
+        max_age: float | None = None,
+        records: bool = False,
+    ) -> AsyncIterator[FleetSnapshot]:
+        """Read data (or compact value records) from all hosts and iterate over the snapshots in completion order."""
+        await self.connect()
+
+        tasks: list[asyncio.Task[FleetSnapshot]] = [
+            asyncio.create_task(
+                self._read_host(
+                    host,
+                    request,
+                    position,
+                    human_readable=human_readable,
+                    extra_attributes=extra_attributes,
+                    max_age=max_age,
+                    records=records,
+                ),
+            )
+            for host in self.hosts
+        ]
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def read_columns(
+        self,
+        request: Section | list[Section],
+        position: "Position | int | list[int | None] | None" = None,
+        *,
+        human_readable: bool = False,
+        max_age: float | None = None,
+    ) -> Columns:
+        """Read data from all hosts into shared columns (device indexes refer to the hosts, errors are kept by host)."""
+        await self.connect()
+
+        columns: Columns = Columns(self.hosts, human_readable=human_readable)
+        await asyncio.gather(
+            *(
+                self._read_host_columns(host, device, request, position, columns=columns, max_age=max_age)
+                for device, host in enumerate(columns.hosts)
+            ),
+        )
+
+        return columns
+
+    async def _read_host_columns(
+        self,
+        host: str,
+        device: int,
+        request: Section | list[Section],
+        position: "Position | int | list[int | None] | None",
+        *,
+        columns: Columns,
+        max_age: float | None,
+    ) -> None:
+        try:
+            async with self._limit(host):
+                await asyncio.wait_for(
+                    self._clients[host].read_columns(
+                        request,
+                        position,
+                        max_age=max_age,
+                        columns=columns,
+                        device=device,
+                    ),
+                    timeout=self.timeout,
+                )
+        except Exception as error:  # noqa: BLE001
+            columns.errors[host] = error
+
+    async def _read_host(
+        self,
+        host: str,
+        request: Section | list[Section],
+        position: "Position | int | list[int | None] | None",
+        *,
+        human_readable: bool,
+        extra_attributes: bool,
+        max_age: float | None,
+        records: bool,
+    ) -> FleetSnapshot:
+        timestamp: float = time.time()
+
+        try:
+            async with self._limit(host):
+                timestamp = time.time()
+                client: KebaKeEnergyAPI = self._clients[host]
+                options: dict[str, Any] = {
+                    "human_readable": human_readable,
+                    "extra_attributes": extra_attributes,
+                    "max_age": max_age,
+                }
+                data: dict[str, ValueResponse] | ValueRecords = await asyncio.wait_for(
+                    (
+                        client.read_records(request, position, **options)
+                        if records
+                        else client.read_data(request, position, **options)
+                    ),
+                    timeout=self.timeout,
+                )
+        except Exception as error:  # noqa: BLE001
+            return FleetSnapshot(host=host, timestamp=timestamp, error=error)
+
+        return FleetSnapshot(host=host, timestamp=timestamp, data=data)
+
+    @contextlib.asynccontextmanager
+    async def _limit(self, host: str) -> AsyncIterator[None]:
+        # The per-host slot is acquired first, so reads waiting for a busy host don't hold a global slot
+        host_semaphore: asyncio.Semaphore = self._host_semaphores[host]
+        await host_semaphore.acquire()
+
+        try:
+            # A slow host must not hold the global limit longer than the timeout
+            async with self._semaphore:
+                yield
+        except BaseException:
+            # Reads continue after a timeout (they may be shared by other callers), so the per-host slot is
+            # released when they finish
+            asyncio.gather(*self._clients[host].in_flight, return_exceptions=True).add_done_callback(
+                lambda _: host_semaphore.release(),
+            )
+            raise
+
+        host_semaphore.release()
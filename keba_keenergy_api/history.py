@@ -0,0 +1,144 @@
+"""Keep the last samples of read variables in preallocated ring buffers."""
+
+import bisect
+from array import array
+from collections.abc import Iterator
+
+from keba_keenergy_api.constants import API_DEFAULT_HISTORY_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_ROLLUP_SIZE
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.registry import VARIABLES
+from keba_keenergy_api.rollup import RollupBuffer
+
+
+class RingBuffer:
+    """Class to keep the last timestamps and values of a variable."""
+
+    __slots__ = ("size", "_timestamps", "_values", "_head", "_length")
+
+    def __init__(self, size: int = API_DEFAULT_HISTORY_SIZE) -> None:
+        self.size: int = size
+
+        # Every sample is written twice, so the last samples are always a contiguous slice
+        self._timestamps: array[float] = array("d", bytes(16 * size))
+        self._values: array[float] = array("d", bytes(16 * size))
+        self._head: int = 0
+        self._length: int = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Get a view of all timestamps (seconds since the epoch), the oldest first."""
+        return memoryview(self._timestamps)[self._start : self._start + self._length]
+
+    @property
+    def values(self) -> memoryview:
+        """Get a view of all values, the oldest first."""
+        return memoryview(self._values)[self._start : self._start + self._length]
+
+    @property
+    def _start(self) -> int:
+        return (self._head - self._length) % self.size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample and overwrite the oldest sample, if the buffer is full."""
+        self._timestamps[self._head] = self._timestamps[self._head + self.size] = timestamp
+        self._values[self._head] = self._values[self._head + self.size] = value
+
+        self._head = (self._head + 1) % self.size
+        self._length = min(self._length + 1, self.size)
+
+    def last(self) -> tuple[float, float] | None:
+        """Get the timestamp and value of the last sample."""
+        if not self._length:
+            return None
+
+        idx: int = (self._head - 1) % self.size
+        return self._timestamps[idx], self._values[idx]
+
+    def range(self, start: float | None = None, end: float | None = None) -> tuple[memoryview, memoryview]:
+        """Get views of timestamps and values between start and end (both included)."""
+        timestamps: memoryview = self.timestamps
+        _start: int = 0 if start is None else bisect.bisect_left(timestamps, start)
+        _end: int = len(timestamps) if end is None else bisect.bisect_right(timestamps, end)
+
+        return timestamps[_start:_end], self.values[_start:_end]
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._head = 0
+        self._length = 0
+
+
+class HistoryStore:
+    """Class to keep the last samples and rollups (e.g. per minute) of all read numeric variables."""
+
+    def __init__(
+        self,
+        size: int = API_DEFAULT_HISTORY_SIZE,
+        *,
+        resolutions: tuple[float, ...] = (),
+        rollup_size: int = API_DEFAULT_ROLLUP_SIZE,
+    ) -> None:
+        self.size: int = size
+        self.resolutions: tuple[float, ...] = resolutions
+        self.rollup_size: int = rollup_size
+        self._buffers: dict[str, RingBuffer] = {}
+        self._rollups: dict[str, dict[float, RollupBuffer]] = {}
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._buffers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buffers)
+
+    def record(self, name: str, timestamp: float, value: str | float) -> None:
+        """Add a sample of a variable, if its value is numeric."""
+        try:
+            _value: float = float(value)
+        except (TypeError, ValueError):
+            return
+
+        buffer: RingBuffer | None = self._buffers.get(name)
+
+        if buffer is None:
+            buffer = self._buffers[name] = RingBuffer(self.size)
+            self._rollups[name] = {
+                resolution: RollupBuffer(resolution, size=self.rollup_size) for resolution in self.resolutions
+            }
+
+        buffer.append(timestamp, _value)
+
+        for rollup in self._rollups[name].values():
+            rollup.add(timestamp, _value)
+
+    def get(self, name: str) -> RingBuffer | None:
+        """Get the samples of a variable by its fully qualified name."""
+        return self._buffers.get(name)
+
+    def get_section(self, section: Section, position: int = 1) -> RingBuffer | None:
+        """Get the samples of a section member at a position."""
+        return self._buffers.get(self._get_name(section, position))
+
+    def get_rollups(self, name: str, resolution: float) -> RollupBuffer | None:
+        """Get the rollups with a resolution of a variable by its fully qualified name."""
+        return self._rollups.get(name, {}).get(resolution)
+
+    def get_section_rollups(self, section: Section, resolution: float, position: int = 1) -> RollupBuffer | None:
+        """Get the rollups with a resolution of a section member at a position."""
+        return self.get_rollups(self._get_name(section, position), resolution)
+
+    def clear(self) -> None:
+        """Remove all samples and rollups."""
+        self._buffers.clear()
+        self._rollups.clear()
+
+    @staticmethod
+    def _get_name(section: Section, position: int) -> str:
+        return VARIABLES[section].name(None if isinstance(section, System) else position - 1)
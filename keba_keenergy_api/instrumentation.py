@@ -0,0 +1,147 @@
+"""Report timing, sizes and results of every request to pluggable hooks."""
+
+import logging
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from types import SimpleNamespace
+from typing import Any
+from typing import NamedTuple
+
+from aiohttp import ClientSession
+from aiohttp import TraceConfig
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class RequestMetrics(NamedTuple):
+    """Measurements of a request (durations in seconds since the request start)."""
+
+    host: str
+    endpoint: str
+    variables: int
+    request_bytes: int
+    response_bytes: int
+    dns: float | None
+    connect: float | None
+    ttfb: float | None
+    decode: float | None
+    total: float
+    status: int | None
+    error: str | None
+
+
+RequestHook = Callable[[RequestMetrics], None]
+
+
+class RequestTrace:
+    """Class to collect the timestamps, status and response size of a request."""
+
+    __slots__ = ("start", "dns_start", "dns", "connect_start", "connect", "ttfb", "decode", "status", "response_bytes")
+
+    def __init__(self) -> None:
+        self.start: float = time.perf_counter()
+        self.dns_start: float | None = None
+        self.dns: float | None = None
+        self.connect_start: float | None = None
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+        self.decode: float | None = None
+        self.status: int | None = None
+        self.response_bytes: int = 0
+
+    def elapsed(self) -> float:
+        """Get the seconds since the request start."""
+        return time.perf_counter() - self.start
+
+    def metrics(
+        self,
+        host: str,
+        endpoint: str,
+        *,
+        variables: int,
+        request_bytes: int,
+        error: str | None,
+    ) -> RequestMetrics:
+        """Get the metrics of the finished request."""
+        return RequestMetrics(
+            host=host,
+            endpoint=endpoint,
+            variables=variables,
+            request_bytes=request_bytes,
+            response_bytes=self.response_bytes,
+            dns=self.dns,
+            connect=self.connect,
+            ttfb=self.ttfb,
+            decode=self.decode,
+            total=self.elapsed(),
+            status=self.status,
+            error=error,
+        )
+
+
+def _get_trace(trace_config_ctx: SimpleNamespace) -> RequestTrace | None:
+    trace: Any = trace_config_ctx.trace_request_ctx
+    return trace if isinstance(trace, RequestTrace) else None
+
+
+async def _on_dns_resolvehost_start(_session: ClientSession, ctx: SimpleNamespace, _params: object) -> None:
+    if (trace := _get_trace(ctx)) is not None:
+        trace.dns_start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(_session: ClientSession, ctx: SimpleNamespace, _params: object) -> None:
+    if (trace := _get_trace(ctx)) is not None and trace.dns_start is not None:
+        trace.dns = time.perf_counter() - trace.dns_start
+
+
+async def _on_connection_create_start(_session: ClientSession, ctx: SimpleNamespace, _params: object) -> None:
+    if (trace := _get_trace(ctx)) is not None:
+        trace.connect_start = time.perf_counter()
+
+
+async def _on_connection_create_end(_session: ClientSession, ctx: SimpleNamespace, _params: object) -> None:
+    if (trace := _get_trace(ctx)) is not None and trace.connect_start is not None:
+        trace.connect = time.perf_counter() - trace.connect_start
+
+
+class Instrumentation:
+    """Class to report the metrics of every request to hooks."""
+
+    def __init__(self, hooks: Iterable[RequestHook] = ()) -> None:
+        self._hooks: list[RequestHook] = list(hooks)
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Add a hook which is called with the metrics of every request."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Remove a hook."""
+        self._hooks.remove(hook)
+
+    def emit(self, metrics: RequestMetrics) -> None:
+        """Call all hooks with the metrics of a request."""
+        for hook in self._hooks:
+            self._call(hook, metrics)
+
+    @staticmethod
+    def _call(hook: RequestHook, metrics: RequestMetrics) -> None:
+        try:
+            hook(metrics)
+        except Exception:
+            # Hooks must never break requests
+            _LOGGER.exception("Error in request hook")
+
+    @staticmethod
+    def trace_config() -> TraceConfig:
+        """Create a trace config to measure DNS and connect latency (add it to your own client session)."""
+        trace_config: TraceConfig = TraceConfig()
+        trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)  # type: ignore[arg-type]
+        trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)  # type: ignore[arg-type]
+        trace_config.on_connection_create_start.append(_on_connection_create_start)  # type: ignore[arg-type]
+        trace_config.on_connection_create_end.append(_on_connection_create_end)  # type: ignore[arg-type]
+
+        return trace_config
@@ -0,0 +1,188 @@
+"""Collect request metrics and render them in the Prometheus text format."""
+
+import bisect
+from typing import Final
+
+from aiohttp import web
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import API_DEFAULT_METRICS_BUCKETS
+from keba_keenergy_api.constants import EndpointPath
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+from keba_keenergy_api.instrumentation import Instrumentation
+from keba_keenergy_api.instrumentation import RequestMetrics
+
+CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+METRIC_PREFIX: Final[str] = "keba_keenergy"
+WRITE_ENDPOINT: Final[str] = f"{EndpointPath.READ_WRITE_VARS}?action=set"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class Histogram:
+    """Class to count observations per bucket."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets: tuple[float, ...] = buckets
+        # The last bucket counts observations above all upper bounds
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """Add an observation to its bucket."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> list[str]:
+        """Render the cumulative buckets, sum and count."""
+        lines: list[str] = []
+        total: int = 0
+
+        for bucket, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+            total += count
+            le: str = "+Inf" if bucket == float("inf") else repr(float(bucket))
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {total}')
+
+        lines += [f"{name}_sum{{{labels}}} {self.sum!r}", f"{name}_count{{{labels}}} {self.count}"]
+
+        return lines
+
+
+class MetricsRegistry:
+    """Class to collect request, error, latency, variable and cache metrics per host."""
+
+    def __init__(self, *, buckets: tuple[float, ...] = API_DEFAULT_METRICS_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = buckets
+
+        self._requests: dict[tuple[str, str], int] = {}
+        self._errors: dict[tuple[str, str, str], int] = {}
+        self._durations: dict[tuple[str, str], Histogram] = {}
+        self._variables_read: dict[str, int] = {}
+        self._variables_written: dict[str, int] = {}
+        self._clients: list[KebaKeEnergyAPI] = []
+        self._fleets: list[KebaKeEnergyFleet] = []
+
+    def observe(self, metrics: RequestMetrics) -> None:
+        """Add the metrics of a request (use it as instrumentation hook)."""
+        key: tuple[str, str] = (metrics.host, metrics.endpoint)
+        self._requests[key] = self._requests.get(key, 0) + 1
+
+        histogram: Histogram | None = self._durations.get(key)
+
+        if histogram is None:
+            histogram = self._durations[key] = Histogram(self.buckets)
+
+        histogram.observe(metrics.total)
+
+        if metrics.error is not None:
+            error_key: tuple[str, str, str] = (metrics.host, metrics.endpoint, metrics.error)
+            self._errors[error_key] = self._errors.get(error_key, 0) + 1
+        elif metrics.endpoint == EndpointPath.READ_WRITE_VARS:
+            self._variables_read[metrics.host] = self._variables_read.get(metrics.host, 0) + metrics.variables
+        elif metrics.endpoint == WRITE_ENDPOINT:
+            self._variables_written[metrics.host] = self._variables_written.get(metrics.host, 0) + metrics.variables
+
+    def register(self, source: KebaKeEnergyAPI | KebaKeEnergyFleet) -> None:
+        """Collect the metrics of a client or of all clients of a fleet."""
+        if isinstance(source, KebaKeEnergyFleet):
+            instrumentation: Instrumentation | None = source.client_options.get("instrumentation")
+
+            if instrumentation is None:
+                instrumentation = source.client_options["instrumentation"] = Instrumentation()
+
+            instrumentations: list[Instrumentation] = [instrumentation]
+
+            # The clients of a connected fleet may have been created with their own instrumentation
+            if source.session is not None:
+                instrumentations += [source[host].instrumentation for host in source.hosts]
+
+            for item in dict.fromkeys(instrumentations):
+                item.add_hook(self.observe)
+
+            self._fleets.append(source)
+        else:
+            source.instrumentation.add_hook(self.observe)
+            self._clients.append(source)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines: list[str] = []
+
+        self._render_counter(
+            lines,
+            "requests_total",
+            "Number of requests.",
+            {_labels(host=host, endpoint=endpoint): count for (host, endpoint), count in self._requests.items()},
+        )
+        self._render_counter(
+            lines,
+            "request_errors_total",
+            "Number of failed requests by error class.",
+            {
+                _labels(host=host, endpoint=endpoint, error=error): count
+                for (host, endpoint, error), count in self._errors.items()
+            },
+        )
+
+        name: str = f"{METRIC_PREFIX}_request_duration_seconds"
+        lines += [f"# HELP {name} Request latency in seconds.", f"# TYPE {name} histogram"]
+
+        for (host, endpoint), histogram in self._durations.items():
+            lines += histogram.render(name, _labels(host=host, endpoint=endpoint))
+
+        self._render_counter(
+            lines,
+            "variables_read_total",
+            "Number of read variables.",
+            {_labels(host=host): count for host, count in self._variables_read.items()},
+        )
+        self._render_counter(
+            lines,
+            "variables_written_total",
+            "Number of written variables.",
+            {_labels(host=host): count for host, count in self._variables_written.items()},
+        )
+
+        clients: list[KebaKeEnergyAPI] = self._get_clients()
+        self._render_counter(
+            lines,
+            "cache_hits_total",
+            "Number of variables read from the response cache.",
+            {_labels(host=client.host): client.cache.hits for client in clients},
+        )
+        self._render_counter(
+            lines,
+            "cache_misses_total",
+            "Number of variables not found in the response cache.",
+            {_labels(host=client.host): client.cache.misses for client in clients},
+        )
+
+        return "\n".join(lines) + "\n"
+
+    async def handler(self, _request: web.Request) -> web.Response:
+        """Serve the metrics (e.g. add it as route to an aiohttp application)."""
+        return web.Response(body=self.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+    def _get_clients(self) -> list[KebaKeEnergyAPI]:
+        clients: list[KebaKeEnergyAPI] = list(self._clients)
+
+        for fleet in self._fleets:
+            if fleet.session is not None:
+                clients += [fleet[host] for host in fleet.hosts]
+
+        return clients
+
+    @staticmethod
+    def _render_counter(lines: list[str], name: str, description: str, samples: dict[str, int]) -> None:
+        lines += [f"# HELP {METRIC_PREFIX}_{name} {description}", f"# TYPE {METRIC_PREFIX}_{name} counter"]
+        lines += [f"{METRIC_PREFIX}_{name}{{{labels}}} {count}" for labels, count in samples.items()]
@@ -0,0 +1,143 @@
+"""Compact value records with shared attributes as alternative to nested response dicts."""
+
+from collections.abc import Iterator
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import SectionPrefix
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.registry import VARIABLES
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import Value
+
+EMPTY_ATTRIBUTES: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Every distinct set of attributes is kept only once for all records, clients and reads
+_ATTRIBUTES: dict[tuple[tuple[str, Any], ...], Mapping[str, Any]] = {}
+
+
+def intern_attributes(attributes: dict[str, Any]) -> Mapping[str, Any]:
+    """Get a shared read-only copy of the attributes."""
+    if not attributes:
+        return EMPTY_ATTRIBUTES
+
+    key: tuple[tuple[str, Any], ...] = tuple(attributes.items())
+
+    try:
+        interned: Mapping[str, Any] | None = _ATTRIBUTES.get(key)
+    except TypeError:
+        # Unhashable attribute values are not interned
+        return MappingProxyType(dict(attributes))
+
+    if interned is None:
+        interned = _ATTRIBUTES[key] = MappingProxyType(dict(attributes))
+
+    return interned
+
+
+class ValueRecord:
+    """Class to keep a read value, its read time (seconds since the epoch) and shared attributes."""
+
+    __slots__ = ("value", "timestamp", "attributes")
+
+    def __init__(self, value: float | str, timestamp: float, attributes: Mapping[str, Any] = EMPTY_ATTRIBUTES) -> None:
+        self.value: float | str = value
+        self.timestamp: float = timestamp
+        self.attributes: Mapping[str, Any] = attributes
+
+    def __repr__(self) -> str:
+        return f"ValueRecord(value={self.value!r}, timestamp={self.timestamp!r}, attributes={self.attributes!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValueRecord):
+            return NotImplemented
+
+        return (self.value, self.timestamp, self.attributes) == (other.value, other.timestamp, other.attributes)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def to_dict(self) -> "Value":
+        """Get the value in the read_data() response shape."""
+        return {"value": self.value, "attributes": dict(self.attributes)}
+
+
+class ValueRecords(Mapping[Section, tuple[ValueRecord, ...]]):
+    """Class to keep the value records of all positions per section member."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: dict[Section, tuple[ValueRecord, ...]]) -> None:
+        self._records: dict[Section, tuple[ValueRecord, ...]] = records
+
+    def __getitem__(self, section: Section) -> tuple[ValueRecord, ...]:
+        return self._records[section]
+
+    def __iter__(self) -> Iterator[Section]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        return f"ValueRecords({self._records!r})"
+
+    def get_value(self, section: Section, position: int = 1) -> ValueRecord | None:
+        """Get the record of a section member at a position."""
+        records: tuple[ValueRecord, ...] = self._records.get(section, ())
+        return records[position - 1] if 0 < position <= len(records) else None
+
+    def as_dict(self) -> "ValueRecordsView":
+        """Get a view in the read_data() response shape, which creates the dicts on access."""
+        return ValueRecordsView(self)
+
+
+class SectionView(Mapping[str, "list[Value] | Value"]):
+    """Class to view the records of a section in the read_data() response shape."""
+
+    __slots__ = ("_records", "_sections")
+
+    def __init__(self, records: ValueRecords, sections: dict[str, Section]) -> None:
+        self._records: ValueRecords = records
+        self._sections: dict[str, Section] = sections
+
+    def __getitem__(self, key: str) -> "list[Value] | Value":
+        section: Section = self._sections[key]
+        records: tuple[ValueRecord, ...] = self._records[section]
+
+        if isinstance(section, System):
+            return records[0].to_dict()
+
+        return [record.to_dict() for record in records]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+
+class ValueRecordsView(Mapping[str, SectionView]):
+    """Class to view value records in the read_data() response shape."""
+
+    __slots__ = ("_records", "_sections")
+
+    def __init__(self, records: ValueRecords) -> None:
+        self._records: ValueRecords = records
+        self._sections: dict[str, dict[str, Section]] = {prefix.value: {} for prefix in SectionPrefix}
+
+        for section in records:
+            self._sections[VARIABLES[section].position_key][VARIABLES[section].short_key] = section
+
+    def __getitem__(self, key: str) -> SectionView:
+        return SectionView(self._records, self._sections[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
@@ -0,0 +1,69 @@
+"""Precompiled variable names for all section members."""
+
+import re
+from enum import Enum
+from re import Pattern
+from typing import Final
+from typing import NamedTuple
+
+from keba_keenergy_api.constants import HEAT_CIRCUIT_PREFIX
+from keba_keenergy_api.constants import HEAT_PUMP_PREFIX
+from keba_keenergy_api.constants import HOT_WATER_TANK_PREFIX
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import HotWaterTank
+from keba_keenergy_api.constants import SYSTEM_PREFIX
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import System
+
+KEY_PATTERN: Final[Pattern[str]] = re.compile(r"(?<!^)(?=[A-Z])")
+
+SECTION_PREFIXES: Final[dict[type[Enum], str]] = {
+    System: SYSTEM_PREFIX,
+    HotWaterTank: HOT_WATER_TANK_PREFIX,
+    HeatPump: HEAT_PUMP_PREFIX,
+    HeatCircuit: HEAT_CIRCUIT_PREFIX,
+}
+
+
+class Variable(NamedTuple):
+    """Precompiled names from a section member."""
+
+    section: Section
+    prefix: str
+    suffix: str
+    key: str
+    short_key: str
+    position_key: str
+
+    def name(self, idx: int | None = None) -> str:
+        """Get the fully qualified variable name for a position index."""
+        if idx is None:
+            return f"{self.prefix}{self.suffix}"
+
+        return f"{self.prefix}[{idx}]{self.suffix}"
+
+
+def _compile(section: Section) -> Variable:
+    position_key: str = KEY_PATTERN.sub("_", section.__class__.__name__).lower()
+
+    return Variable(
+        section=section,
+        prefix=SECTION_PREFIXES.get(type(section), ""),
+        suffix=f".{section.value.value}",
+        key=f"{position_key}_{section.name.lower()}",
+        short_key=section.name.lower(),
+        position_key=position_key,
+    )
+
+
+SECTIONS: Final[list[Section]] = [*System, *HotWaterTank, *HeatPump, *HeatCircuit]
+VARIABLES: Final[dict[Section, Variable]] = {section: _compile(section) for section in SECTIONS}
+
+INDEX_PATTERN: Final[Pattern[str]] = re.compile(r"\[\d+\]")
+SECTIONS_BY_NAME: Final[dict[str, Section]] = {variable.name(): section for section, variable in VARIABLES.items()}
+
+
+def get_section(name: str) -> Section | None:
+    """Get the section member from a fully qualified variable name."""
+    return SECTIONS_BY_NAME.get(INDEX_PATTERN.sub("", name, count=1))
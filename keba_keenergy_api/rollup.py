@@ -0,0 +1,117 @@
+"""Aggregate samples of a variable into fixed time buckets."""
+
+import bisect
+from array import array
+from typing import NamedTuple
+
+from keba_keenergy_api.constants import API_DEFAULT_ROLLUP_SIZE
+
+
+class Rollup(NamedTuple):
+    """Aggregated samples of a time bucket (start in seconds since the epoch)."""
+
+    start: float
+    minimum: float
+    maximum: float
+    mean: float
+    last: float
+    samples: int
+
+
+class RollupBuffer:
+    """Class to keep the last time buckets of a variable with incremental min, max, mean and last value."""
+
+    __slots__ = (
+        "resolution",
+        "size",
+        "_starts",
+        "_minimums",
+        "_maximums",
+        "_totals",
+        "_counts",
+        "_lasts",
+        "_head",
+        "_length",
+    )
+
+    def __init__(self, resolution: float, size: int = API_DEFAULT_ROLLUP_SIZE) -> None:
+        self.resolution: float = resolution
+        self.size: int = size
+
+        # Every bucket is written twice, so the last buckets are always a contiguous slice
+        self._starts: array[float] = array("d", bytes(16 * size))
+        self._minimums: array[float] = array("d", bytes(16 * size))
+        self._maximums: array[float] = array("d", bytes(16 * size))
+        self._totals: array[float] = array("d", bytes(16 * size))
+        self._counts: array[float] = array("d", bytes(16 * size))
+        self._lasts: array[float] = array("d", bytes(16 * size))
+        self._head: int = -1
+        self._length: int = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample to its time bucket."""
+        start: float = timestamp - timestamp % self.resolution
+        idx: int = self._head
+
+        if self._length and start < self._starts[idx]:
+            # Samples older than the current bucket are ignored
+            return
+
+        if not self._length or start > self._starts[idx]:
+            self._head = idx = (idx + 1) % self.size
+            self._length = min(self._length + 1, self.size)
+            self._set(idx, start, value, value, value, 1, value)
+        else:
+            self._set(
+                idx,
+                start,
+                min(self._minimums[idx], value),
+                max(self._maximums[idx], value),
+                self._totals[idx] + value,
+                self._counts[idx] + 1,
+                value,
+            )
+
+    def current(self) -> Rollup | None:
+        """Get the aggregated samples of the current time bucket."""
+        return self._get(self._head) if self._length else None
+
+    def range(self, start: float | None = None, end: float | None = None) -> list[Rollup]:
+        """Get the aggregated samples of time buckets which start between start and end (both included)."""
+        first: int = (self._head - self._length + 1) % self.size
+        starts: memoryview = memoryview(self._starts)[first : first + self._length]
+        _start: int = 0 if start is None else bisect.bisect_left(starts, start)
+        _end: int = len(starts) if end is None else bisect.bisect_right(starts, end)
+
+        return [self._get(first + idx) for idx in range(_start, _end)]
+
+    def _get(self, idx: int) -> Rollup:
+        return Rollup(
+            start=self._starts[idx],
+            minimum=self._minimums[idx],
+            maximum=self._maximums[idx],
+            mean=self._totals[idx] / self._counts[idx],
+            last=self._lasts[idx],
+            samples=int(self._counts[idx]),
+        )
+
+    def _set(
+        self,
+        idx: int,
+        start: float,
+        minimum: float,
+        maximum: float,
+        total: float,
+        count: float,
+        last: float,
+    ) -> None:
+        for _idx in (idx, idx + self.size):
+            self._starts[_idx] = start
+            self._minimums[_idx] = minimum
+            self._maximums[_idx] = maximum
+            self._totals[_idx] = total
+            self._counts[_idx] = count
+            self._lasts[_idx] = last
@@ -0,0 +1,193 @@
+"""Poll subscribed section members with as few API requests as possible."""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import math
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+from keba_keenergy_api.constants import API_DEFAULT_BATCH_MAX_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_SCHEDULER_SLACK
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.registry import VARIABLES
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import Response
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+Item: TypeAlias = tuple[Section, int | None]
+Reader: TypeAlias = Callable[[list[Item]], Awaitable["Response"]]
+Decoder: TypeAlias = Callable[["Subscription", "Response"], Any]
+Callback: TypeAlias = Callable[[Any], Awaitable[None] | None]
+ErrorCallback: TypeAlias = Callable[[Exception], Awaitable[None] | None]
+
+
+class Subscription:
+    """Section members which are read every interval."""
+
+    def __init__(
+        self,
+        items: list[Item],
+        *,
+        interval: float,
+        callback: Callback,
+        on_error: ErrorCallback | None = None,
+        human_readable: bool = True,
+    ) -> None:
+        if interval <= 0:
+            msg: str = "Invalid interval!"
+            raise APIError(msg)
+
+        self.items: list[Item] = items
+        self.names: frozenset[str] = frozenset(VARIABLES[section].name(idx) for section, idx in items)
+        self.interval: float = interval
+        self.callback: Callback = callback
+        self.on_error: ErrorCallback | None = on_error
+        self.human_readable: bool = human_readable
+
+        self.next_time: float = 0
+        self.cancelled: bool = False
+
+    def cancel(self) -> None:
+        """Stop polling the section members."""
+        self.cancelled = True
+
+
+class PollingScheduler:
+    """Read all due subscriptions with as few requests as possible on each tick."""
+
+    def __init__(
+        self,
+        *,
+        read: Reader,
+        decode: Decoder,
+        max_size: int = API_DEFAULT_BATCH_MAX_SIZE,
+        slack: float = API_DEFAULT_SCHEDULER_SLACK,
+    ) -> None:
+        self.max_size: int = max_size
+        self.slack: float = slack
+
+        self._read: Reader = read
+        self._decode: Decoder = decode
+        self._subscriptions: list[Subscription] = []
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return sum(not subscription.cancelled for subscription in self._subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription, which is due immediately."""
+        subscription.next_time = time.monotonic()
+        self._subscriptions.append(subscription)
+        self._wakeup.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel all subscriptions and stop polling."""
+        for subscription in self._subscriptions:
+            subscription.cancel()
+
+        self._subscriptions = []
+
+        if self._task is not None:
+            self._task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._subscriptions = [subscription for subscription in self._subscriptions if not subscription.cancelled]
+
+            if not self._subscriptions:
+                return
+
+            now: float = time.monotonic()
+            next_time: float = min(subscription.next_time for subscription in self._subscriptions)
+
+            if next_time > now:
+                self._wakeup.clear()
+
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=next_time - now)
+
+                continue
+
+            # Poll subscriptions which are due soon as well, to send fewer requests
+            due: list[Subscription] = [
+                subscription for subscription in self._subscriptions if subscription.next_time <= now + self.slack
+            ]
+
+            for subscription in due:
+                # Keep the ticks aligned to the first tick and skip missed ticks
+                missed: int = max(math.floor((now - subscription.next_time) / subscription.interval), 0)
+                subscription.next_time += (missed + 1) * subscription.interval
+
+            await self._poll(due)
+
+    async def _poll(self, due: list[Subscription]) -> None:
+        items: list[Item] = list(dict.fromkeys(item for subscription in due for item in subscription.items))
+        chunks: list[list[Item]] = [items[i : i + self.max_size] for i in range(0, len(items), self.max_size)]
+
+        results: list[Response | BaseException] = await asyncio.gather(
+            *(self._read(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        response: Response = []
+        errors: dict[str, Exception] = {}
+
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, Exception):
+                errors.update({VARIABLES[section].name(idx): result for section, idx in chunk})
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                response += result
+
+        for subscription in due:
+            if subscription.cancelled:
+                continue
+
+            if error := next((errors[name] for name in subscription.names if name in errors), None):
+                await self._handle_error(subscription, error)
+                continue
+
+            try:
+                data: Any = self._decode(
+                    subscription,
+                    [_response for _response in response if _response.get("name") in subscription.names],
+                )
+                await self._call(subscription.callback, data)
+            except Exception as error:  # noqa: BLE001
+                await self._handle_error(subscription, error)
+
+    @staticmethod
+    async def _call(callback: Callable[[Any], Awaitable[None] | None], value: Any) -> None:  # noqa: ANN401
+        result: Awaitable[None] | None = callback(value)
+
+        if inspect.isawaitable(result):
+            await result
+
+    async def _handle_error(self, subscription: Subscription, error: Exception) -> None:
+        if subscription.on_error is None:
+            _LOGGER.warning("Failed to poll subscription: %s", error)
+            return
+
+        try:
+            await self._call(subscription.on_error, error)
+        except Exception:
+            _LOGGER.exception("Error in subscription error callback")
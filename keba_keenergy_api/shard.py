@@ -0,0 +1,244 @@
+"""Poll a fleet of KEBA KeEnergy APIs with one event loop per worker process."""
+
+import asyncio
+import contextlib
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+from typing import TYPE_CHECKING
+
+from keba_keenergy_api.constants import API_DEFAULT_SHARD_MAX_RESTARTS
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.fleet import FleetSnapshot
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from keba_keenergy_api.endpoints import Position
+
+
+def _encode_snapshot(snapshot: FleetSnapshot) -> bytes:
+    error: str | None = None if snapshot.error is None else f"{type(snapshot.error).__name__}: {snapshot.error}"
+    return json.dumps([snapshot.host, snapshot.timestamp, snapshot.data, error], separators=(",", ":")).encode()
+
+
+def _decode_snapshot(message: bytes) -> FleetSnapshot:
+    host, timestamp, data, error = json.loads(message)
+    return FleetSnapshot(host=host, timestamp=timestamp, data=data, error=None if error is None else APIError(error))
+
+
+async def _poll(
+    connection: Connection,
+    hosts: list[str],
+    request: list[Section],
+    position: "Position | int | list[int | None] | None",
+    options: dict[str, Any],
+) -> None:
+    interval: float = options.pop("interval")
+    read_options: dict[str, Any] = options.pop("read_options")
+
+    async with KebaKeEnergyFleet(hosts, **options) as fleet:
+        start: float = time.monotonic()
+        tick: int = 0
+
+        while True:
+            # Hosts from dead workers are sent between the ticks, None stops the worker
+            while connection.poll():
+                message: list[str] | None = connection.recv()
+
+                if message is None:
+                    return
+
+                fleet.add_hosts(message)
+
+            async for snapshot in fleet.read_data(request, position, **read_options):
+                connection.send_bytes(_encode_snapshot(snapshot))
+
+            tick = max(tick + 1, math.floor((time.monotonic() - start) / interval) + 1)
+            await asyncio.sleep(max(start + tick * interval - time.monotonic(), 0))
+
+
+def _run_worker(
+    connection: Connection,
+    hosts: list[str],
+    request: list[Section],
+    position: "Position | int | list[int | None] | None",
+    options: dict[str, Any],
+) -> None:
+    with contextlib.suppress(KeyboardInterrupt, BrokenPipeError), connection:
+        asyncio.run(_poll(connection, hosts, request, position, options))
+
+
+class _Worker:
+    def __init__(self, process: BaseProcess, connection: Connection, hosts: list[str]) -> None:
+        self.process: BaseProcess = process
+        self.connection: Connection = connection
+        self.hosts: list[str] = hosts
+        self.stopped: bool = False
+        # Blocking receives use a dedicated thread instead of holding a thread of the default executor
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keba-shard")
+        self.receiver: asyncio.Task[None] | None = None
+
+
+class ShardedFleet:
+    """Poll a fleet of hosts, which are sharded across worker processes."""
+
+    def __init__(
+        self,
+        hosts: list[str],
+        *,
+        workers: int | None = None,
+        max_restarts: int = API_DEFAULT_SHARD_MAX_RESTARTS,
+        fleet_options: dict[str, Any] | None = None,
+        start_method: str | None = "spawn",
+    ) -> None:
+        """Initialize with hosts and the number of worker processes."""
+        self.hosts: list[str] = list(dict.fromkeys(hosts))
+        self.workers: int = max(min(workers or os.cpu_count() or 1, len(self.hosts)), 1)
+        self.max_restarts: int = max_restarts
+        self.fleet_options: dict[str, Any] = dict(fleet_options or {})
+        self.restarts: int = 0
+
+        self._context: BaseContext = multiprocessing.get_context(start_method)
+        self._workers: list[_Worker] = []
+
+    @property
+    def shards(self) -> list[list[str]]:
+        """Get the hosts of each running worker process."""
+        return [list(worker.hosts) for worker in self._workers]
+
+    @property
+    def pids(self) -> list[int | None]:
+        """Get the process ids of the running worker processes."""
+        return [worker.process.pid for worker in self._workers]
+
+    async def stream(
+        self,
+        request: Section | list[Section],
+        position: "Position | int | list[int | None] | None" = None,
+        *,
+        interval: float,
+        human_readable: bool = True,
+        extra_attributes: bool = True,
+    ) -> AsyncIterator[FleetSnapshot]:
+        """Read data from all hosts every interval seconds and iterate over the snapshots."""
+        if interval <= 0:
+            msg: str = "Invalid interval!"
+            raise APIError(msg)
+
+        options: dict[str, Any] = {
+            **self.fleet_options,
+            "interval": interval,
+            "read_options": {"human_readable": human_readable, "extra_attributes": extra_attributes},
+        }
+        queue: asyncio.Queue[bytes | _Worker] = asyncio.Queue()
+
+        def start_worker(hosts: list[str]) -> None:
+            parent_connection, child_connection = self._context.Pipe()
+            process: BaseProcess = self._context.Process(  # type: ignore[attr-defined]
+                target=_run_worker,
+                args=(
+                    child_connection,
+                    hosts,
+                    request if isinstance(request, list) else [request],
+                    position,
+                    dict(options),
+                ),
+                daemon=True,
+            )
+            process.start()
+            # Close the child end in this process, so a dead worker is noticed as EOF
+            child_connection.close()
+
+            worker: _Worker = _Worker(process, parent_connection, list(hosts))
+            worker.receiver = asyncio.create_task(self._receive(worker, queue))
+            self._workers.append(worker)
+
+        for idx in range(self.workers):
+            start_worker(self.hosts[idx :: self.workers])
+
+        try:
+            while True:
+                item: bytes | _Worker = await queue.get()
+
+                if isinstance(item, _Worker):
+                    self._rebalance(item, start_worker)
+                else:
+                    yield _decode_snapshot(item)
+        finally:
+            await self._stop()
+
+    @staticmethod
+    async def _receive(worker: _Worker, queue: "asyncio.Queue[bytes | _Worker]") -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            try:
+                message: bytes = await loop.run_in_executor(worker.executor, worker.connection.recv_bytes)
+            except (EOFError, OSError):
+                worker.executor.shutdown(wait=False)
+
+                if not worker.stopped:
+                    queue.put_nowait(worker)
+
+                return
+
+            queue.put_nowait(message)
+
+    def _rebalance(self, dead: _Worker, start_worker: Callable[[list[str]], None]) -> None:
+        dead.process.join(timeout=0)
+        self._workers.remove(dead)
+
+        if self.restarts < self.max_restarts:
+            self.restarts += 1
+            start_worker(dead.hosts)
+            return
+
+        if not self._workers:
+            msg: str = "All fleet workers died!"
+            raise APIError(msg)
+
+        moved: dict[int, list[str]] = {}
+
+        for host in dead.hosts:
+            idx: int = min(range(len(self._workers)), key=lambda i: len(self._workers[i].hosts))
+            self._workers[idx].hosts.append(host)
+            moved.setdefault(idx, []).append(host)
+
+        for idx, hosts in moved.items():
+            # A worker which died meanwhile is rebalanced with its next EOF
+            with contextlib.suppress(OSError):
+                self._workers[idx].connection.send(hosts)
+
+    async def _stop(self) -> None:
+        workers: list[_Worker] = self._workers
+        self._workers = []
+
+        for worker in workers:
+            worker.stopped = True
+
+            with contextlib.suppress(OSError):
+                worker.connection.send(None)
+
+        for worker in workers:
+            await asyncio.to_thread(worker.process.join, 5)
+
+            if worker.process.is_alive():
+                worker.process.terminate()
+                await asyncio.to_thread(worker.process.join)
+
+            # The receiver ends with EOF from the stopped worker, before its connection is closed
+            if worker.receiver is not None:
+                await worker.receiver
+
+            worker.connection.close()
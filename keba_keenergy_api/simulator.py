@@ -0,0 +1,362 @@
+"""Simulate a KeEnergy controller for load tests without hardware."""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+from typing import Final
+
+from aiohttp import web
+
+from keba_keenergy_api.constants import API_DEFAULT_SIMULATOR_DRIFT
+from keba_keenergy_api.constants import API_DEFAULT_SIMULATOR_REVERSION
+from keba_keenergy_api.constants import EndpointPath
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import HotWaterTank
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.registry import VARIABLES
+
+CONTENT_TYPE: Final[str] = "application/json;charset=utf-8"
+
+# Initial value, lower and upper limit of measured and set values
+FLOAT_PROFILES: Final[dict[Section, tuple[float, float, float]]] = {
+    System.OUTDOOR_TEMPERATURE: (8, -30, 40),
+    HotWaterTank.TEMPERATURE: (48, 10, 70),
+    HotWaterTank.MIN_TEMPERATURE: (35, 0, 52),
+    HotWaterTank.MAX_TEMPERATURE: (52, 0, 52),
+    HeatPump.CIRCULATION_PUMP: (0.5, 0, 1),
+    HeatPump.INFLOW_TEMPERATURE: (35, 10, 65),
+    HeatPump.REFLUX_TEMPERATURE: (30, 10, 60),
+    HeatPump.SOURCE_INPUT_TEMPERATURE: (10, -10, 30),
+    HeatPump.SOURCE_OUTPUT_TEMPERATURE: (6, -15, 25),
+    HeatPump.COMPRESSOR_INPUT_TEMPERATURE: (5, -20, 30),
+    HeatPump.COMPRESSOR_OUTPUT_TEMPERATURE: (60, 20, 110),
+    HeatPump.COMPRESSOR: (0.5, 0, 1),
+    HeatPump.HIGH_PRESSURE: (17, 5, 35),
+    HeatPump.LOW_PRESSURE: (8, 1, 15),
+    HeatCircuit.TEMPERATURE: (21, 10, 30),
+    HeatCircuit.DAY_TEMPERATURE: (21, 10, 30),
+    HeatCircuit.DAY_TEMPERATURE_THRESHOLD: (16, -20, 30),
+    HeatCircuit.NIGHT_TEMPERATURE: (18, 10, 30),
+    HeatCircuit.NIGHT_TEMPERATURE_THRESHOLD: (14, -20, 30),
+    HeatCircuit.HOLIDAY_TEMPERATURE: (15, 10, 30),
+    HeatCircuit.TEMPERATURE_OFFSET: (0, -5, 5),
+}
+DEFAULT_FLOAT_PROFILE: Final[tuple[float, float, float]] = (20, 0, 100)
+
+
+class SimulatedVariable:
+    """Class to keep the value and attributes of a simulated variable."""
+
+    __slots__ = (
+        "section",
+        "value",
+        "attributes",
+        "read_only",
+        "drift",
+        "base",
+        "lower_limit",
+        "upper_limit",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        section: Section,
+        value: str,
+        attributes: dict[str, Any],
+        *,
+        read_only: bool,
+        drift: bool = False,
+        base: float = 0,
+        lower_limit: float = 0,
+        upper_limit: float = 0,
+        timestamp: float = 0,
+    ) -> None:
+        self.section: Section = section
+        self.value: str = value
+        self.attributes: dict[str, Any] = attributes
+        self.read_only: bool = read_only
+        # Only measured values drift, set values keep the last written value
+        self.drift: bool = drift
+        self.base: float = base
+        self.lower_limit: float = lower_limit
+        self.upper_limit: float = upper_limit
+        self.timestamp: float = timestamp
+
+
+class KebaKeEnergySimulator:
+    """Class to serve the KeEnergy API with a variable tree generated from the section members."""
+
+    def __init__(
+        self,
+        *,
+        heat_pumps: int = 1,
+        heat_circuits: int = 1,
+        hot_water_tanks: int = 1,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        drift: float = API_DEFAULT_SIMULATOR_DRIFT,
+        reversion: float = API_DEFAULT_SIMULATOR_REVERSION,
+        seed: int | None = None,
+    ) -> None:
+        self.heat_pumps: int = heat_pumps
+        self.heat_circuits: int = heat_circuits
+        self.hot_water_tanks: int = hot_water_tanks
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.error_rate: float = error_rate
+        self.drift: float = drift
+        self.reversion: float = reversion
+
+        self.requests: int = 0
+        self.errors: int = 0
+
+        self._random: random.Random = random.Random(seed)  # noqa: S311
+        self._runner: web.AppRunner | None = None
+        self.variables: dict[str, SimulatedVariable] = self._generate_variables()
+
+    async def __aenter__(self) -> "KebaKeEnergySimulator":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    @property
+    def host(self) -> str:
+        """Get the host and port of the running simulator."""
+        if self._runner is None or not self._runner.addresses:
+            msg: str = "Simulator is not running!"
+            raise RuntimeError(msg)
+
+        host, port = self._runner.addresses[0][:2]
+        return f"{host}:{port}"
+
+    def create_app(self) -> web.Application:
+        """Create the web application with all endpoints."""
+        app: web.Application = web.Application(middlewares=[self._middleware])
+        app.router.add_post(EndpointPath.READ_WRITE_VARS, self._read_write_vars)
+        app.router.add_post(EndpointPath.SW_UPDATE, self._sw_update)
+        app.router.add_post(EndpointPath.DEVICE_CONTROL, self._device_control)
+
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start the simulator and get its host and port (a free port by default)."""
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+        return self.host
+
+    async def stop(self) -> None:
+        """Stop the simulator."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def get_value(self, name: str) -> str:
+        """Get the current value of a variable (drifted since the last read)."""
+        variable: SimulatedVariable = self.variables[name]
+
+        if variable.drift:
+            now: float = time.monotonic()
+            elapsed: float = now - variable.timestamp
+            value: float = float(variable.value)
+            # Random walk which reverts to the initial value over time
+            value += (variable.base - value) * (1 - math.exp(-self.reversion * elapsed))
+            value += self._random.gauss(0, self.drift * math.sqrt(elapsed))
+
+            variable.value = str(round(min(max(value, variable.lower_limit), variable.upper_limit), 6))
+            variable.timestamp = now
+
+        return variable.value
+
+    def _generate_variables(self) -> dict[str, SimulatedVariable]:
+        counts: dict[type[Section], int] = {
+            HotWaterTank: self.hot_water_tanks,
+            HeatPump: self.heat_pumps,
+            HeatCircuit: self.heat_circuits,
+        }
+        variables: dict[str, SimulatedVariable] = {}
+
+        for section, variable in VARIABLES.items():
+            if isinstance(section, System):
+                variables[variable.name()] = self._generate_variable(section, 0)
+            else:
+                for idx in range(counts[type(section)]):
+                    variables[variable.name(idx)] = self._generate_variable(section, idx)
+
+        return variables
+
+    def _generate_variable(self, section: Section, idx: int) -> SimulatedVariable:
+        numbers: dict[Section, int] = {
+            System.HOT_WATER_TANK_NUMBERS: self.hot_water_tanks,
+            System.HEAT_PUMP_NUMBERS: self.heat_pumps,
+            System.HEAT_CIRCUIT_NUMBERS: self.heat_circuits,
+        }
+        long_text: str = section.name.replace("_", " ").capitalize()
+
+        if section in numbers:
+            return SimulatedVariable(
+                section=section,
+                value=str(numbers[section]),
+                attributes={"formatId": "fmt2p0", "longText": long_text, "lowerLimit": "0", "upperLimit": "8"},
+                read_only=True,
+            )
+
+        if section.value.human_readable is not None:
+            return SimulatedVariable(
+                section=section,
+                value=str(next(iter(section.value.human_readable)).value),
+                attributes={"longText": long_text},
+                read_only=section.value.read_only,
+            )
+
+        if section.value.value_type is float:
+            base, lower_limit, upper_limit = FLOAT_PROFILES.get(section, DEFAULT_FLOAT_PROFILE)
+
+            return SimulatedVariable(
+                section=section,
+                value=str(base),
+                attributes={
+                    "formatId": "fmtTemp",
+                    "longText": long_text,
+                    "lowerLimit": str(lower_limit),
+                    "upperLimit": str(upper_limit),
+                },
+                read_only=section.value.read_only,
+                drift=section.value.read_only,
+                base=base,
+                lower_limit=lower_limit,
+                upper_limit=upper_limit,
+                timestamp=time.monotonic(),
+            )
+
+        return SimulatedVariable(
+            section=section,
+            value=f"{long_text} {idx + 1}" if section.value.value_type is str else "0",
+            attributes={"longText": long_text},
+            read_only=section.value.read_only,
+        )
+
+    @staticmethod
+    def _json_response(data: Any, *, status: int = 200) -> web.Response:  # noqa: ANN401
+        return web.Response(text=json.dumps(data), status=status, headers={"Content-Type": CONTENT_TYPE})
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:  # noqa: ANN401
+        self.requests += 1
+        delay: float = self.latency + self._random.uniform(-self.jitter, self.jitter)
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self._random.random() < self.error_rate:
+            self.errors += 1
+            return self._json_response({"developerMessage": "Simulated error!"}, status=500)
+
+        response: web.StreamResponse = await handler(request)
+        return response
+
+    async def _read_write_vars(self, request: web.Request) -> web.Response:
+        payload: list[dict[str, str]] = await request.json()
+        unknown: list[str] = [item["name"] for item in payload if item["name"] not in self.variables]
+
+        if unknown:
+            return self._json_response({"developerMessage": f"Unknown variables! {', '.join(unknown)}"}, status=400)
+
+        if request.query.get("action") == "set":
+            read_only: list[str] = [item["name"] for item in payload if self.variables[item["name"]].read_only]
+
+            if read_only:
+                return self._json_response(
+                    {"developerMessage": f"Read only variables! {', '.join(read_only)}"},
+                    status=400,
+                )
+
+            for item in payload:
+                self.variables[item["name"]].value = str(item["value"])
+
+            return self._json_response({})
+
+        response: list[dict[str, Any]] = []
+
+        for item in payload:
+            value: dict[str, Any] = {"name": item["name"], "value": self.get_value(item["name"])}
+
+            if item.get("attr") == "1":
+                value["attributes"] = self.variables[item["name"]].attributes
+
+            response.append(value)
+
+        return self._json_response(response)
+
+    async def _sw_update(self, request: web.Request) -> web.Response:
+        if request.query.get("action") != "getSystemInstalled":
+            return self._json_response({"developerMessage": "Unknown action!"}, status=400)
+
+        return self._json_response([{"ret": "OK", "name": "KeEnergy.MTec", "version": "2.2.2"}])
+
+    async def _device_control(self, request: web.Request) -> web.Response:
+        if request.query.get("action") != "getDeviceInfo":
+            return self._json_response({"developerMessage": "Unknown action!"}, status=400)
+
+        return self._json_response(
+            [
+                {
+                    "ret": "OK",
+                    "revNo": 2,
+                    "orderNo": 12345678,
+                    "serNo": 12345678,
+                    "name": "SIMULATOR",
+                    "variantNo": 0,
+                },
+            ],
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the simulator from the command line."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Simulate a KEBA KeEnergy controller.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--heat-pumps", type=int, default=1)
+    parser.add_argument("--heat-circuits", type=int, default=1)
+    parser.add_argument("--hot-water-tanks", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0, help="Response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0, help="Random response delay in seconds (+/-)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Rate of failed requests (0 to 1)")
+    parser.add_argument("--drift", type=float, default=API_DEFAULT_SIMULATOR_DRIFT)
+    parser.add_argument("--seed", type=int, default=None)
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    simulator: KebaKeEnergySimulator = KebaKeEnergySimulator(
+        heat_pumps=args.heat_pumps,
+        heat_circuits=args.heat_circuits,
+        hot_water_tanks=args.hot_water_tanks,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        drift=args.drift,
+        seed=args.seed,
+    )
+    web.run_app(simulator.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""Persist read values in compressed, memory-mapped segment files."""
+
+import mmap
+import struct
+from array import array
+from itertools import pairwise
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO
+from typing import Final
+
+from keba_keenergy_api.constants import API_DEFAULT_BLOCK_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_SEGMENT_SIZE
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.registry import get_section
+
+SEGMENT_MAGIC: Final[bytes] = b"KEBASEG1"
+# Magic and the number of used bytes
+SEGMENT_HEADER: Final[struct.Struct] = struct.Struct("<8sQ")
+# Name length, encoding, number of samples, first and last timestamp and payload length
+BLOCK_HEADER: Final[struct.Struct] = struct.Struct("<HBIddI")
+
+ENCODING_XOR: Final[int] = 0
+ENCODING_RLE: Final[int] = 1
+
+# Prefix, prefix length and value length of the timestamp delta of deltas
+DOD_RANGES: Final[tuple[tuple[int, int, int], ...]] = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12))
+
+
+class _BitWriter:
+    def __init__(self) -> None:
+        self._value: int = 0
+        self._length: int = 0
+
+    def write(self, value: int, bits: int) -> None:
+        self._value = (self._value << bits) | (value & ((1 << bits) - 1))
+        self._length += bits
+
+    def to_bytes(self) -> bytes:
+        padding: int = -self._length % 8
+        return (self._value << padding).to_bytes((self._length + padding) // 8, "big")
+
+
+class _BitReader:
+    def __init__(self, data: bytes | memoryview) -> None:
+        self._value: int = int.from_bytes(data, "big")
+        self._length: int = len(data) * 8
+        self._position: int = 0
+
+    def read(self, bits: int) -> int:
+        self._position += bits
+        return (self._value >> (self._length - self._position)) & ((1 << bits) - 1)
+
+    def read_signed(self, bits: int) -> int:
+        value: int = self.read(bits)
+        return value - (1 << bits) if value >= 1 << (bits - 1) else value
+
+
+def _float_to_bits(value: float) -> int:
+    bits: int = struct.unpack("<Q", struct.pack("<d", value))[0]
+    return bits
+
+
+def _bits_to_float(bits: int) -> float:
+    value: float = struct.unpack("<d", struct.pack("<Q", bits))[0]
+    return value
+
+
+def _write_timestamps(writer: _BitWriter, timestamps: list[int]) -> None:
+    writer.write(timestamps[0], 64)
+    previous_delta: int = 0
+
+    for previous, timestamp in pairwise(timestamps):
+        delta: int = timestamp - previous
+        dod: int = delta - previous_delta
+        previous_delta = delta
+
+        if dod == 0:
+            writer.write(0, 1)
+            continue
+
+        for prefix, prefix_bits, bits in DOD_RANGES:
+            if -(1 << (bits - 1)) <= dod < 1 << (bits - 1):
+                writer.write(prefix, prefix_bits)
+                writer.write(dod, bits)
+                break
+        else:
+            writer.write(0b1111, 4)
+            writer.write(dod, 64)
+
+
+def _read_timestamps(reader: _BitReader, samples: int) -> list[int]:
+    timestamps: list[int] = [reader.read_signed(64)]
+    delta: int = 0
+
+    for _ in range(samples - 1):
+        ones: int = 0
+
+        while ones < 4 and reader.read(1):  # noqa: PLR2004
+            ones += 1
+
+        if ones == 4:  # noqa: PLR2004
+            delta += reader.read_signed(64)
+        elif ones:
+            delta += reader.read_signed(DOD_RANGES[ones - 1][2])
+
+        timestamps.append(timestamps[-1] + delta)
+
+    return timestamps
+
+
+def _write_floats(writer: _BitWriter, values: list[float]) -> None:
+    previous: int = _float_to_bits(values[0])
+    previous_leading: int = -1
+    previous_trailing: int = 0
+    writer.write(previous, 64)
+
+    for value in values[1:]:
+        bits: int = _float_to_bits(value)
+        xor: int = bits ^ previous
+        previous = bits
+
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+
+        leading: int = min(64 - xor.bit_length(), 31)
+        trailing: int = (xor & -xor).bit_length() - 1
+
+        if previous_leading >= 0 and leading >= previous_leading and trailing >= previous_trailing:
+            # The meaningful bits fit into the window of the previous value
+            writer.write(0b10, 2)
+            writer.write(xor >> previous_trailing, 64 - previous_leading - previous_trailing)
+        else:
+            meaningful: int = 64 - leading - trailing
+            writer.write(0b11, 2)
+            writer.write(leading, 5)
+            writer.write(meaningful - 1, 6)
+            writer.write(xor >> trailing, meaningful)
+            previous_leading, previous_trailing = leading, trailing
+
+
+def _read_floats(reader: _BitReader, samples: int) -> list[float]:
+    previous: int = reader.read(64)
+    leading: int = 0
+    trailing: int = 0
+    values: list[float] = [_bits_to_float(previous)]
+
+    for _ in range(samples - 1):
+        if reader.read(1):
+            if reader.read(1):
+                leading = reader.read(5)
+                meaningful: int = reader.read(6) + 1
+                trailing = 64 - leading - meaningful
+
+            previous ^= reader.read(64 - leading - trailing) << trailing
+
+        values.append(_bits_to_float(previous))
+
+    return values
+
+
+def _write_runs(writer: _BitWriter, values: list[float]) -> None:
+    runs: list[list[int]] = []
+
+    for value in values:
+        if runs and runs[-1][0] == int(value):
+            runs[-1][1] += 1
+        else:
+            runs.append([int(value), 1])
+
+    writer.write(len(runs), 32)
+
+    for value, length in runs:
+        writer.write(value, 64)
+        writer.write(length, 32)
+
+
+def _read_runs(reader: _BitReader) -> list[float]:
+    values: list[float] = []
+
+    for _ in range(reader.read(32)):
+        value: int = reader.read_signed(64)
+        values += [float(value)] * reader.read(32)
+
+    return values
+
+
+def encode_block(timestamps: list[float], values: list[float], *, encoding: int = ENCODING_XOR) -> bytes:
+    """Compress timestamps (delta of deltas in milliseconds) and values (XOR or run length encoded)."""
+    writer: _BitWriter = _BitWriter()
+    _write_timestamps(writer, [round(timestamp * 1000) for timestamp in timestamps])
+
+    if encoding == ENCODING_RLE:
+        _write_runs(writer, values)
+    else:
+        _write_floats(writer, values)
+
+    return writer.to_bytes()
+
+
+def decode_block(
+    payload: bytes | memoryview,
+    samples: int,
+    *,
+    encoding: int = ENCODING_XOR,
+) -> tuple[list[float], list[float]]:
+    """Decompress timestamps and values from a block payload."""
+    reader: _BitReader = _BitReader(payload)
+    timestamps: list[float] = [timestamp / 1000 for timestamp in _read_timestamps(reader, samples)]
+    values: list[float] = _read_runs(reader) if encoding == ENCODING_RLE else _read_floats(reader, samples)
+
+    return timestamps, values
+
+
+class SegmentLog:
+    """Class to append samples of variables to compressed blocks in memory-mapped segment files."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        segment_size: int = API_DEFAULT_SEGMENT_SIZE,
+        block_size: int = API_DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        self.path: Path = Path(path)
+        self.segment_size: int = segment_size
+        self.block_size: int = block_size
+
+        self._pending: dict[str, tuple[list[float], list[float]]] = {}
+        self._file: BinaryIO | None = None
+        self._mmap: mmap.mmap | None = None
+        self._index: int = 0
+        self._used: int = 0
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        segments: list[Path] = self._segment_paths()
+        self._open_segment(int(segments[-1].stem) if segments else 0)
+
+    def __enter__(self) -> "SegmentLog":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def record(self, name: str, timestamp: float, value: str | float) -> None:
+        """Add a sample of a variable, if its value is numeric."""
+        try:
+            _value: float = float(value)
+        except (TypeError, ValueError):
+            return
+
+        timestamps, values = self._pending.setdefault(name, ([], []))
+        timestamps.append(timestamp)
+        values.append(_value)
+
+        if len(timestamps) >= self.block_size:
+            self._write_block(name)
+
+    def flush(self) -> None:
+        """Write all pending samples to the segment files."""
+        for name in list(self._pending):
+            self._write_block(name)
+
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """Write all pending samples and close the segment files."""
+        self.flush()
+        self._close_segment()
+
+    def read(
+        self,
+        name: str,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> tuple["array[float]", "array[float]"]:
+        """Read timestamps and values of a variable between start and end (both included)."""
+        _name: bytes = name.encode()
+        timestamps: array[float] = array("d")
+        values: array[float] = array("d")
+
+        for segment in self._segment_paths():
+            if int(segment.stem) == self._index and self._mmap is not None:
+                self._scan(memoryview(self._mmap)[: self._used], _name, timestamps, values, start=start, end=end)
+                continue
+
+            with segment.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as _mmap:
+                view: memoryview = memoryview(_mmap)
+                self._scan(view[: SEGMENT_HEADER.unpack_from(view)[1]], _name, timestamps, values, start=start, end=end)
+                view.release()
+
+        for timestamp, value in zip(*self._pending.get(name, ([], [])), strict=True):
+            if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                timestamps.append(timestamp)
+                values.append(value)
+
+        return timestamps, values
+
+    @staticmethod
+    def _scan(
+        view: memoryview,
+        name: bytes,
+        timestamps: "array[float]",
+        values: "array[float]",
+        *,
+        start: float | None,
+        end: float | None,
+    ) -> None:
+        offset: int = SEGMENT_HEADER.size
+
+        while offset < len(view):
+            name_length, encoding, samples, first, last, payload_length = BLOCK_HEADER.unpack_from(view, offset)
+            name_offset: int = offset + BLOCK_HEADER.size
+            payload_offset: int = name_offset + name_length
+            offset = payload_offset + payload_length
+
+            # Skip blocks of other variables or outside of the range without decoding them
+            if view[name_offset:payload_offset] != name:
+                continue
+
+            if (start is not None and last < start) or (end is not None and first > end):
+                continue
+
+            _timestamps, _values = decode_block(view[payload_offset:offset], samples, encoding=encoding)
+
+            for timestamp, value in zip(_timestamps, _values, strict=True):
+                if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                    timestamps.append(timestamp)
+                    values.append(value)
+
+    @staticmethod
+    def _get_encoding(name: str) -> int:
+        section: Section | None = get_section(name)
+        return ENCODING_RLE if section is not None and section.value.human_readable is not None else ENCODING_XOR
+
+    def _write_block(self, name: str) -> None:
+        timestamps, values = self._pending.pop(name)
+        encoding: int = self._get_encoding(name)
+        payload: bytes = encode_block(timestamps, values, encoding=encoding)
+        _name: bytes = name.encode()
+        data: bytes = (
+            BLOCK_HEADER.pack(len(_name), encoding, len(timestamps), timestamps[0], timestamps[-1], len(payload))
+            + _name
+            + payload
+        )
+
+        if self._mmap is None or self._used + len(data) > len(self._mmap):
+            self._close_segment()
+            self._open_segment(self._index + 1, size=max(self.segment_size, SEGMENT_HEADER.size + len(data)))
+
+        if self._mmap is None:
+            msg: str = "Segment file is not open!"
+            raise APIError(msg)
+
+        self._mmap[self._used : self._used + len(data)] = data
+        self._used += len(data)
+        # Update the used bytes after the block, so a partly written block is never read
+        SEGMENT_HEADER.pack_into(self._mmap, 0, SEGMENT_MAGIC, self._used)
+
+    def _segment_paths(self) -> list[Path]:
+        return sorted(self.path.glob("*.seg"))
+
+    def _open_segment(self, index: int, *, size: int | None = None) -> None:
+        path: Path = self.path / f"{index:08d}.seg"
+        exists: bool = path.exists()
+        # The file is closed with the segment
+        self._file = path.open("r+b" if exists else "w+b")
+
+        if not exists:
+            self._file.truncate(size or self.segment_size)
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._index = index
+
+        if exists:
+            magic, self._used = SEGMENT_HEADER.unpack_from(self._mmap)
+
+            if magic != SEGMENT_MAGIC:
+                msg: str = f"Invalid segment file! {path}"
+                raise APIError(msg)
+        else:
+            self._used = SEGMENT_HEADER.size
+            SEGMENT_HEADER.pack_into(self._mmap, 0, SEGMENT_MAGIC, self._used)
+
+    def _close_segment(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
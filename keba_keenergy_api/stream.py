@@ -0,0 +1,141 @@
+"""Stream timestamped snapshots from the API."""
+
+import asyncio
+import contextlib
+import math
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from types import TracebackType
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+from keba_keenergy_api.constants import API_DEFAULT_STREAM_QUEUE_SIZE
+from keba_keenergy_api.constants import StreamOverflow
+from keba_keenergy_api.delta import DeltaFilter
+from keba_keenergy_api.error import APIError
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import ValueResponse
+
+Reader: TypeAlias = Callable[[], Awaitable[dict[str, "ValueResponse"]]]
+
+
+class Snapshot(NamedTuple):
+    """Data read at a point in time (seconds since the epoch)."""
+
+    timestamp: float
+    data: dict[str, "ValueResponse"]
+
+
+class SnapshotStream:
+    """Read snapshots every interval into a bounded queue and iterate over them."""
+
+    def __init__(
+        self,
+        read: Reader,
+        *,
+        interval: float,
+        queue_size: int = API_DEFAULT_STREAM_QUEUE_SIZE,
+        overflow: StreamOverflow = StreamOverflow.DROP_OLDEST,
+        delta: DeltaFilter | None = None,
+    ) -> None:
+        if interval <= 0:
+            msg: str = "Invalid interval!"
+            raise APIError(msg)
+
+        self.interval: float = interval
+        self.overflow: StreamOverflow = overflow
+        self.dropped: int = 0
+        self.delta: DeltaFilter | None = delta
+
+        self._read: Reader = read
+        # None marks the end of the stream
+        self._queue: asyncio.Queue[Snapshot | Exception | None] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task[None] | None = None
+        self._closed: bool = False
+
+    def __aiter__(self) -> "SnapshotStream":
+        return self
+
+    async def __anext__(self) -> Snapshot:
+        if self._closed:
+            raise StopAsyncIteration
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._produce())
+
+        item: Snapshot | Exception | None = await self._queue.get()
+
+        if item is None or self._closed:
+            raise StopAsyncIteration
+
+        if isinstance(item, Exception):
+            await self.aclose()
+            raise item
+
+        return item
+
+    async def __aenter__(self) -> "SnapshotStream":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop reading snapshots."""
+        self._closed = True
+
+        if self._task is not None:
+            self._task.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        # Wake up a consumer waiting for the next snapshot, which only waits for an empty queue
+        if self._queue.empty():
+            self._queue.put_nowait(None)
+
+    async def _produce(self) -> None:
+        start: float = time.monotonic()
+        tick: int = 0
+
+        while True:
+            timestamp: float = time.time()
+
+            try:
+                data: dict[str, ValueResponse] = await self._read()
+            except Exception as error:  # noqa: BLE001
+                # The error is raised to the consumer, which ends the stream
+                await self._put(error)
+                return
+
+            if self.delta is not None:
+                data = self.delta.filter(data)
+
+            # Snapshots without changed values are not emitted in delta mode
+            if self.delta is None or any(data.values()):
+                await self._put(Snapshot(timestamp=timestamp, data=data))
+
+            # Keep the ticks aligned to the first tick and skip missed ticks
+            tick = max(tick + 1, math.floor((time.monotonic() - start) / self.interval) + 1)
+            await asyncio.sleep(max(start + tick * self.interval - time.monotonic(), 0))
+
+    async def _put(self, item: Snapshot | Exception) -> None:
+        if self.overflow is StreamOverflow.BLOCK:
+            await self._queue.put(item)
+            return
+
+        while self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+
+        self._queue.put_nowait(item)
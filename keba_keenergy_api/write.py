@@ -0,0 +1,121 @@
+"""Merge pending write requests into one API request."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import WritePayload
+
+Sender: TypeAlias = Callable[[list["WritePayload"]], Awaitable[None]]
+
+
+class WriteBuffer:
+    """Collect write payloads (last write per variable wins) and send them with one request."""
+
+    def __init__(self, *, window: float | None = None) -> None:
+        self.window: float | None = window
+
+        self._pending: dict[str, WritePayload] = {}
+        self._waiters: list[asyncio.Future[None]] = []
+        self._depth: int = 0
+        self._send: Sender | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def active(self) -> bool:
+        """Check if writes are buffered."""
+        return self._depth > 0 or self.window is not None
+
+    def open(self) -> None:
+        """Buffer all writes until the buffer is closed."""
+        self._depth += 1
+
+    async def close(self, *, discard: bool = False) -> None:
+        """Close the buffer and send all pending writes (or discard them), if it is not opened anymore."""
+        self._depth -= 1
+
+        if discard:
+            self._pending.clear()
+
+        if self._depth == 0:
+            await self.flush()
+
+    async def write(self, payload: list["WritePayload"], send: Sender) -> None:
+        """Add the payload to the pending writes."""
+        for item in payload:
+            self._pending.pop(item["name"], None)
+            self._pending[item["name"]] = item
+
+        self._send = send
+
+        if self._depth > 0:
+            return
+
+        if self.window is None:
+            await self.flush()
+            return
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        self._waiters.append(future)
+
+        if self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        await future
+
+    def discard(self, name: str) -> None:
+        """Remove the pending write of a variable."""
+        self._pending.pop(name, None)
+
+    async def flush(self) -> None:
+        """Send all pending writes with one request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending: list[WritePayload] = list(self._pending.values())
+        waiters: list[asyncio.Future[None]] = self._waiters
+        send: Sender | None = self._send
+
+        self._pending = {}
+        self._waiters = []
+        self._send = None
+
+        try:
+            if pending and send is not None:
+                await send(pending)
+        except asyncio.CancelledError:
+            for future in waiters:
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    def _flush(self) -> None:
+        self._timer = None
+
+        task: asyncio.Task[None] = asyncio.create_task(self._flush_waiters())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_waiters(self) -> None:
+        try:
+            await self.flush()
+        except Exception:  # noqa: BLE001
+            # The error is raised to all writers which are waiting for the flush
+            return
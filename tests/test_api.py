@@ -1,8 +1,10 @@
 import asyncio
+import json
 from typing import Any
 
 import pytest
 from aiohttp import ClientSession
+from aioresponses import CallbackResult
 from aioresponses import aioresponses
 
 from keba_keenergy_api.api import KebaKeEnergyAPI
@@ -91,6 +93,165 @@ class TestKebaKeEnergyAPI:
                 ssl=False,
             )
 
+    @pytest.mark.asyncio()
+    async def test_api_with_context_manager(self) -> None:
+        """Test api with pooled session from the context manager."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("10.808357", "11.808357"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            async with KebaKeEnergyAPI(host="mocked-host", limit_per_host=2) as client:
+                session: ClientSession | None = client.session
+
+                assert session is not None
+                assert session.connector is not None
+                assert session.connector.limit_per_host == 2  # noqa: PLR2004
+
+                assert await client.system.get_outdoor_temperature() == 10.81  # noqa: PLR2004
+                assert await client.system.get_outdoor_temperature() == 11.81  # noqa: PLR2004
+                assert client.session is session
+                assert not session.closed
+
+            assert session.closed
+            assert client.session is None
+
+    @pytest.mark.asyncio()
+    async def test_api_endpoint_after_close(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test endpoints taken before close() close their temporary sessions."""
+        sessions: list[ClientSession] = []
+
+        def create_session(**kwargs: Any) -> ClientSession:  # noqa: ANN401
+            session: ClientSession = ClientSession(**kwargs)
+            sessions.append(session)
+            return session
+
+        monkeypatch.setattr("keba_keenergy_api.endpoints.ClientSession", create_session)
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "10.808357"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                system: Any = client.system
+
+            assert await system.get_outdoor_temperature() == 10.81  # noqa: PLR2004
+
+        assert len(sessions) == 1
+        assert sessions[0].closed
+
+    @pytest.mark.asyncio()
+    async def test_api_connect_with_session(self) -> None:
+        """Test connect and close don't replace or close a passed session."""
+        session: ClientSession = ClientSession()
+        client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", session=session)
+
+        await client.connect()
+        assert client.session is session
+
+        await client.close()
+        assert client.session is session
+        assert not session.closed
+
+        await session.close()
+
+    @pytest.mark.asyncio()
+    async def test_api_single_flight(self) -> None:
+        """Test identical concurrent reads are sent only once."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {"lowerLimit": "-100", "upperLimit": "100"},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            data: list[float] = list(
+                await asyncio.gather(
+                    client.system.get_outdoor_temperature(),
+                    client.system.get_outdoor_temperature(),
+                    client.system.get_outdoor_temperature(),
+                ),
+            )
+
+            assert data == [10.81, 10.81, 10.81]
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_api_single_flight_cancel(self) -> None:
+        """Test a cancelled caller doesn't cancel other callers of the same read."""
+        release: asyncio.Event = asyncio.Event()
+
+        async def slow_response(*_: Any, **__: Any) -> CallbackResult:  # noqa: ANN401
+            await release.wait()
+            return CallbackResult(
+                body=json.dumps([{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "10.808357"}]),
+                content_type="application/json;charset=utf-8",
+            )
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post("http://mocked-host/var/readWriteVars", callback=slow_response)
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            first: asyncio.Task[float] = asyncio.create_task(client.system.get_outdoor_temperature())
+            await asyncio.sleep(0)
+            second: asyncio.Task[float] = asyncio.create_task(client.system.get_outdoor_temperature())
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+
+            assert await second == 10.81  # noqa: PLR2004
+            assert first.cancelled()
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 1
+
+    @pytest.mark.asyncio()
+    async def test_api_single_flight_error(self) -> None:
+        """Test identical concurrent reads get the same error."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload={"developerMessage": "mocked-error"},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            results: list[float | BaseException] = list(
+                await asyncio.gather(
+                    client.system.get_outdoor_temperature(),
+                    client.system.get_outdoor_temperature(),
+                    return_exceptions=True,
+                ),
+            )
+
+            assert [str(result) for result in results] == ["mocked-error", "mocked-error"]
+            assert all(isinstance(result, APIError) for result in results)
+
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
         (
@@ -417,6 +578,87 @@ class TestKebaKeEnergyAPI:
                 ssl=False,
             )
 
+    @pytest.mark.asyncio()
+    async def test_read_data_with_cached_positions(self) -> None:
+        """Test read multiple data requests the positions only once."""
+        options_payload: list[dict[str, Any]] = [
+            {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "value": "1"},
+            {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "value": "1"},
+            {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "value": "1"},
+        ]
+        payload: list[dict[str, Any]] = [
+            {"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "value": "24.200001"},
+        ]
+
+        with aioresponses() as mock_keenergy_api:
+            for _payload in (options_payload, payload, payload, {"developerMessage": "mocked-error"}):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=_payload,
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            for _ in range(2):
+                data: dict[str, ValueResponse] = await client.read_data(request=HeatPump.INFLOW_TEMPERATURE)
+                assert data["heat_pump"] == {"inflow_temperature": [{"value": 24.2, "attributes": {}}]}
+
+            assert await client.get_positions() == (1, 1, 1)
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 3  # noqa: PLR2004
+
+            with pytest.raises(APIError) as error:
+                await client.read_data(request=HeatPump.INFLOW_TEMPERATURE)
+
+            assert str(error.value) == "mocked-error"
+
+            for _payload in (options_payload, payload):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=_payload,
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            await client.read_data(request=HeatPump.INFLOW_TEMPERATURE)
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 6  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("position_refresh_interval", "invalidate", "expected_calls"),
+        [(None, False, 1), (None, True, 2), (0, False, 2)],
+    )
+    async def test_get_positions(
+        self,
+        position_refresh_interval: float | None,
+        invalidate: bool,  # noqa: FBT001
+        expected_calls: int,
+    ) -> None:
+        """Test invalidate and refresh the cached positions."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "value": "2"},
+                    {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "value": "1"},
+                    {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "value": "1"},
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=True,
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+                host="mocked-host",
+                position_refresh_interval=position_refresh_interval,
+            )
+
+            assert await client.get_positions() == (2, 1, 1)
+
+            if invalidate:
+                client.invalidate_positions()
+
+            assert await client.get_positions() == (2, 1, 1)
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == expected_calls
+
     @pytest.mark.asyncio()
     @pytest.mark.parametrize(
         ("section", "expected_data"),
@@ -502,3 +744,69 @@ class TestKebaKeEnergyAPI:
                 loop.run_until_complete(client.system.get_outdoor_temperature())
 
             assert str(error.value) == "mocked-error"
+
+    @pytest.mark.asyncio()
+    async def test_read_data_unordered_response(self) -> None:
+        """Test response values are matched by their variable names."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {"name": "APPL.CtrlAppl.sParam.heatpump[1].TempHeatFlow.values.actValue", "value": "23.200001"},
+                    {"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "17.54"},
+                    {"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "value": "24.200001"},
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            data: dict[str, ValueResponse] = await client.read_data(
+                request=[System.OUTDOOR_TEMPERATURE, HeatPump.INFLOW_TEMPERATURE],
+                position=[1, 2],
+            )
+
+            assert data["system"] == {"outdoor_temperature": {"value": 17.54, "attributes": {}}}
+            assert data["heat_pump"] == {
+                "inflow_temperature": [{"value": 24.2, "attributes": {}}, {"value": 23.2, "attributes": {}}],
+            }
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("payload", "expected_error"),
+        [
+            (
+                [{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "value": "24.200001"}],
+                "Missing variable in response! APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+            ),
+            (
+                [
+                    {"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "17.54"},
+                    {"name": "APPL.CtrlAppl.sParam.heatpump[1].TempHeatFlow.values.actValue", "value": "24.200001"},
+                ],
+                ("Missing variable in response! APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue"),
+            ),
+            (
+                [
+                    {"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "17.54"},
+                    {"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "value": "24.200001"},
+                    {"name": "APPL.CtrlAppl.sParam.heatpump[1].TempHeatFlow.values.actValue", "value": "23.200001"},
+                ],
+                "Unexpected variables in response! APPL.CtrlAppl.sParam.heatpump[1].TempHeatFlow.values.actValue",
+            ),
+        ],
+    )
+    async def test_read_data_invalid_response(self, payload: list[dict[str, str]], expected_error: str) -> None:
+        """Test missing and unexpected variables in response."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=payload,
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            with pytest.raises(APIError) as error:
+                await client.read_data(request=[System.OUTDOOR_TEMPERATURE, HeatPump.INFLOW_TEMPERATURE], position=1)
+
+            assert str(error.value) == expected_error
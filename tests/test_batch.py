@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HotWaterTank
+from keba_keenergy_api.error import APIError
+
+
+class TestReadBatcher:
+    @pytest.mark.asyncio()
+    async def test_concurrent_reads(self) -> None:
+        """Test concurrent reads are sent with one request."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue",
+                        "attributes": {"lowerLimit": "20", "upperLimit": "90"},
+                        "value": "24.200001",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatReflux.values.actValue",
+                        "attributes": {"lowerLimit": "20", "upperLimit": "90"},
+                        "value": "23.200001",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatCircuit[0].values.setValue",
+                        "attributes": {"lowerLimit": "10", "upperLimit": "90"},
+                        "value": "21.5",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", batch_window=0.01)
+            data: list[float] = list(
+                await asyncio.gather(
+                    client.heat_pump.get_inflow_temperature(),
+                    client.heat_pump.get_reflux_temperature(),
+                    client.heat_circuit.get_temperature(),
+                ),
+            )
+
+            assert data == [24.2, 23.2, 21.5]
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "attr": "1"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatReflux.values.actValue", "attr": "1"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].values.setValue", "attr": "1"}]'
+                ),
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_duplicate_names(self) -> None:
+        """Test variables read by many callers with and without attributes are sent once with attributes."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value",
+                        "attributes": {"lowerLimit": "0", "upperLimit": "52"},
+                        "value": "47",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", batch_window=0.01)
+            upper_limit, data = await asyncio.gather(
+                client.hot_water_tank.get_upper_limit_temperature(),
+                client.read_data(HotWaterTank.MAX_TEMPERATURE, position=1, extra_attributes=False),
+            )
+
+            assert upper_limit == 52  # noqa: PLR2004
+            assert data["hot_water_tank"] == {"max_temperature": [{"value": 47.0, "attributes": {}}]}
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_max_size(self) -> None:
+        """Test a full batch is sent before the window ends."""
+        with aioresponses() as mock_keenergy_api:
+            for name, value in (("TempHeatFlow", "24.200001"), ("TempHeatReflux", "10.808357")):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": f"APPL.CtrlAppl.sParam.heatpump[0].{name}.values.actValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", batch_window=60, batch_max_size=1)
+            data: list[float] = list(
+                await asyncio.gather(
+                    client.heat_pump.get_inflow_temperature(),
+                    client.heat_pump.get_reflux_temperature(),
+                ),
+            )
+
+            assert data == [24.2, 10.81]
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("payload", "expected_error"),
+        [
+            ({"developerMessage": "mocked-error"}, "mocked-error"),
+            ([{"name": "mocked-name", "value": "1"}], "Missing variable in response!"),
+        ],
+    )
+    async def test_batch_error(self, payload: dict[str, str] | list[dict[str, str]], expected_error: str) -> None:
+        """Test every caller of a failed batch gets the error."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=payload,
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", batch_window=0)
+            results: list[float | BaseException] = list(
+                await asyncio.gather(
+                    client.system.get_outdoor_temperature(),
+                    client.heat_pump.get_compressor(),
+                    return_exceptions=True,
+                ),
+            )
+
+            assert all(isinstance(result, APIError) for result in results)
+            assert all(str(result).startswith(expected_error) for result in results)
@@ -0,0 +1,340 @@
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.cache import AttributeCache
+from keba_keenergy_api.cache import LastValueCache
+from keba_keenergy_api.cache import ResponseCache
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import ValueResponse
+
+
+class TestResponseCache:
+    def test_ttl(self) -> None:
+        """Test time to live per section member."""
+        cache: ResponseCache = ResponseCache(ttl={HeatPump.NAME: 3600}, default_ttl=5)
+        cache.set_ttl(HeatPump.HIGH_PRESSURE, 2)
+
+        assert cache.get_ttl(HeatPump.NAME) == 3600  # noqa: PLR2004
+        assert cache.get_ttl(HeatPump.HIGH_PRESSURE) == 2  # noqa: PLR2004
+        assert cache.get_ttl(HeatCircuit.DAY_TEMPERATURE) == 5  # noqa: PLR2004
+
+    def test_get(self) -> None:
+        """Test get cached responses."""
+        cache: ResponseCache = ResponseCache()
+        cache.set("mocked-name", {"name": "mocked-name", "value": "1"})
+
+        assert cache.get("mocked-name", max_age=60) == {"name": "mocked-name", "value": "1"}
+        assert cache.get("mocked-name", max_age=0) is None
+        assert cache.get("mocked-name", max_age=60, attributes=True) is None
+        assert cache.get("unknown-name", max_age=60) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        cache.invalidate(["mocked-name"])
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio()
+    async def test_cache_hit(self) -> None:
+        """Test cache hit doesn't send a request."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].param.name",
+                        "attributes": {},
+                        "value": "MOCKED-NAME",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", cache_ttl={HeatPump.NAME: 3600})
+
+            assert await client.heat_pump.get_name() == "MOCKED-NAME"
+            assert await client.heat_pump.get_name() == "MOCKED-NAME"
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.name", "attr": "1"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_cache_hit_without_attributes(self) -> None:
+        """Test cache hit of a value read with attributes doesn't return them to reads without attributes."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {"lowerLimit": "-30", "upperLimit": "40"},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+                host="mocked-host",
+                cache_ttl={System.OUTDOOR_TEMPERATURE: 3600},
+                cache_attributes=False,
+            )
+
+            with_attributes: dict[str, ValueResponse] = await client.read_data(
+                System.OUTDOOR_TEMPERATURE,
+                position=1,
+                extra_attributes=True,
+            )
+            without_attributes: dict[str, ValueResponse] = await client.read_data(
+                System.OUTDOOR_TEMPERATURE,
+                position=1,
+                extra_attributes=False,
+            )
+
+            assert with_attributes["system"]["outdoor_temperature"] == {
+                "value": 10.81,
+                "attributes": {"lower_limit": "-30", "upper_limit": "40"},
+            }
+            assert without_attributes["system"]["outdoor_temperature"] == {"value": 10.81, "attributes": {}}
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 1
+
+    @pytest.mark.asyncio()
+    async def test_partial_cache_hit(self) -> None:
+        """Test partial cache hit fetches only the missing values."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp",
+                        "attributes": {"lowerLimit": "10", "upperLimit": "30"},
+                        "value": "21.5",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatCircuit[0].values.setValue",
+                        "attributes": {"lowerLimit": "10", "upperLimit": "90"},
+                        "value": "20.1",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            client.cache.set_ttl(HeatCircuit.DAY_TEMPERATURE, 600)
+
+            assert await client.heat_circuit.get_day_temperature() == 21.5  # noqa: PLR2004
+
+            data: dict[str, ValueResponse] = await client.read_data(
+                request=[HeatCircuit.DAY_TEMPERATURE, HeatCircuit.TEMPERATURE],
+                position=1,
+            )
+
+            assert data["heat_circuit"] == {
+                "day_temperature": [{"value": 21.5, "attributes": {"lower_limit": "10", "upper_limit": "30"}}],
+                "temperature": [{"value": 20.1, "attributes": {"lower_limit": "10", "upper_limit": "90"}}],
+            }
+
+            mock_keenergy_api.assert_called_with(
+                url="http://mocked-host/var/readWriteVars",
+                data='[{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].values.setValue", "attr": "1"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_max_age(self) -> None:
+        """Test max age overrides the time to live."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("1.5", "2.5"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            assert await client.heat_pump.get_high_pressure() == 1.5  # noqa: PLR2004
+            assert await client.heat_pump.get_high_pressure(max_age=60) == 1.5  # noqa: PLR2004
+            assert await client.heat_pump.get_high_pressure() == 2.5  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    async def test_write_invalidates_cache(self) -> None:
+        """Test writing a value removes it from the cache."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("21.5", "22"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload={},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", default_cache_ttl=600)
+
+            assert await client.heat_circuit.get_day_temperature() == 21.5  # noqa: PLR2004
+            await client.heat_circuit.set_day_temperature(22)
+            assert await client.heat_circuit.get_day_temperature() == 22  # noqa: PLR2004
+
+
+class TestAttributeCache:
+    def test_dump_and_load(self) -> None:
+        """Test dump and load cached attributes."""
+        cache: AttributeCache = AttributeCache()
+        cache.set("mocked-name", {"lower_limit": "20", "upper_limit": "90"})
+
+        _cache: AttributeCache = AttributeCache()
+        _cache.load(json.loads(json.dumps(cache.dump())))
+
+        assert "mocked-name" in _cache
+        assert _cache.get("mocked-name") == {"lower_limit": "20", "upper_limit": "90"}
+
+        _cache.invalidate()
+        assert len(_cache) == 0
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("cache_attributes", "expected_attr"),
+        [(True, "0"), (False, "1")],
+    )
+    async def test_values_only_polling(
+        self,
+        cache_attributes: bool,  # noqa: FBT001
+        expected_attr: str,
+    ) -> None:
+        """Test attributes are requested only once."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value",
+                        "attributes": {
+                            "formatId": "fmtTemp",
+                            "longText": "Temp. nom.",
+                            "lowerLimit": "0",
+                            "unitId": "Temp",
+                            "upperLimit": "52",
+                        },
+                        "value": "47",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value",
+                        "attributes": {"lowerLimit": "0", "upperLimit": "52"} if expected_attr == "1" else {},
+                        "value": "48",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", cache_attributes=cache_attributes)
+
+            assert await client.hot_water_tank.get_max_temperature() == 47  # noqa: PLR2004
+            assert await client.hot_water_tank.get_upper_limit_temperature() == 52  # noqa: PLR2004
+
+            mock_keenergy_api.assert_called_with(
+                url="http://mocked-host/var/readWriteVars",
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", '
+                    f'"attr": "{expected_attr}"}}]'
+                ),
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_load_attributes(self) -> None:
+        """Test loaded attributes are merged into the response."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            assert client.attribute_cache is not None
+            client.attribute_cache.load(
+                {
+                    "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue": {"lower_limit": "-100", "upper_limit": "100"},
+                },
+            )
+
+            data: dict[str, ValueResponse] = await client.read_data(
+                request=System.OUTDOOR_TEMPERATURE,
+                position=1,
+            )
+
+            assert data["system"] == {
+                "outdoor_temperature": {"value": 10.81, "attributes": {"lower_limit": "-100", "upper_limit": "100"}},
+            }
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "0"}]',
+                method="POST",
+                ssl=False,
+            )
+
+
+class TestLastValueCache:
+    def test_is_unchanged(self) -> None:
+        """Test compare values with the last known values."""
+        cache: LastValueCache = LastValueCache(tolerance=0.01)
+        cache.set("mocked-temperature", "21.500000")
+        cache.set("mocked-name", "MOCKED-NAME")
+
+        assert cache.is_unchanged("mocked-temperature", "21.5") is True
+        assert cache.is_unchanged("mocked-temperature", "21.505") is True
+        assert cache.is_unchanged("mocked-temperature", "21.6") is False
+        assert cache.is_unchanged("mocked-name", "MOCKED-NAME") is True
+        assert cache.is_unchanged("mocked-name", "OTHER-NAME") is False
+        assert cache.is_unchanged("unknown-name", "1") is False
+
+        cache.invalidate(["mocked-temperature"])
+        assert len(cache) == 1
@@ -0,0 +1,141 @@
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.columns import Column
+from keba_keenergy_api.columns import Columns
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+PAYLOAD: list[dict[str, Any]] = [
+    {"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "10.808357"},
+    {"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "value": "3"},
+    {"name": "APPL.CtrlAppl.sParam.heatpump[1].values.heatpumpState", "value": "0"},
+    {"name": "APPL.CtrlAppl.sParam.heatpump[0].param.name", "value": "MOCKED-NAME-1"},
+    {"name": "APPL.CtrlAppl.sParam.heatpump[1].param.name", "value": "MOCKED-NAME-2"},
+]
+
+
+class TestColumns:
+    def test_add(self) -> None:
+        """Test values are stored in parallel arrays."""
+        columns: Columns = Columns(["mocked-host-1", "mocked-host-2"])
+        columns.add(HeatPump.HIGH_PRESSURE, 16.5, 1, 0)
+        columns.add(HeatPump.HIGH_PRESSURE, 17.5, 2, 1)
+        columns.add(HeatPump.STATE, 3, 1, 1)
+        columns.add(HeatPump.NAME, "MOCKED-NAME", 1, 1)
+
+        column: Column = columns[HeatPump.HIGH_PRESSURE]
+
+        assert len(columns) == 3  # noqa: PLR2004
+        assert len(column) == 2  # noqa: PLR2004
+        assert column.numeric
+        assert column.values.tolist() == [16.5, 17.5]  # type: ignore[attr-defined]  # noqa: PD011
+        assert column.positions.tolist() == [1, 2]
+        assert column.devices.tolist() == [0, 1]
+        assert columns[HeatPump.STATE].numeric
+        assert not columns[HeatPump.NAME].numeric
+
+    def test_human_readable(self) -> None:
+        """Test human readable values are stored as strings."""
+        columns: Columns = Columns(human_readable=True)
+        columns.add(HeatPump.STATE, "defrost", 1)
+
+        assert not columns[HeatPump.STATE].numeric
+        assert columns[HeatPump.STATE].values == ["defrost"]  # noqa: PD011
+
+    def test_to_numpy(self) -> None:
+        """Test NumPy arrays."""
+        np: Any = pytest.importorskip("numpy")
+        column: Column = Column(HeatPump.HIGH_PRESSURE)
+
+        for position in range(1, 4):
+            column.append(position * 1.5, position)
+
+        values, positions, devices = column.to_numpy()
+
+        assert values.dtype == np.float64
+        assert values.mean() == 3  # noqa: PLR2004
+        assert positions.tolist() == [1, 2, 3]
+        assert devices.tolist() == [0, 0, 0]
+
+    @pytest.mark.asyncio()
+    async def test_read_columns(self) -> None:
+        """Test read columns."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=PAYLOAD,
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            columns: Columns = await client.read_columns(
+                [System.OUTDOOR_TEMPERATURE, HeatPump.STATE, HeatPump.NAME],
+                Position(heat_pump=2, heat_circuit=0, hot_water_tank=0),
+            )
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "0"}, '
+                '{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "attr": "0"}, '
+                '{"name": "APPL.CtrlAppl.sParam.heatpump[1].values.heatpumpState", "attr": "0"}, '
+                '{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.name", "attr": "0"}, '
+                '{"name": "APPL.CtrlAppl.sParam.heatpump[1].param.name", "attr": "0"}]',
+                method="POST",
+                ssl=False,
+            )
+
+        assert columns.hosts == ["mocked-host"]
+        assert list(columns[System.OUTDOOR_TEMPERATURE].values) == [10.81]
+        assert list(columns[HeatPump.STATE].values) == [3, 0]
+        assert list(columns[HeatPump.STATE].positions) == [1, 2]
+        assert list(columns[HeatPump.NAME].values) == ["MOCKED-NAME-1", "MOCKED-NAME-2"]
+
+    @pytest.mark.asyncio()
+    async def test_fleet(self) -> None:
+        """Test fleet columns with device indexes and errors."""
+        async with KebaKeEnergySimulator(heat_pumps=2) as simulator, KebaKeEnergySimulator(heat_pumps=1) as other:
+            hosts: list[str] = [simulator.host, other.host, "127.0.0.1:1"]
+
+            async with KebaKeEnergyFleet(hosts, timeout=5) as fleet:
+                columns: Columns = await fleet.read_columns(HeatPump.HIGH_PRESSURE)
+
+        column: Column = columns[HeatPump.HIGH_PRESSURE]
+
+        assert columns.hosts == hosts
+        assert list(columns.errors) == ["127.0.0.1:1"]
+        assert sorted(zip(column.devices, column.positions, strict=True)) == [(0, 1), (0, 2), (1, 1)]
+        assert all(5 <= value <= 35 for value in column.values)  # noqa: PLR2004, PD011
+
+    @pytest.mark.asyncio()
+    async def test_fleet_invalid_value(self) -> None:
+        """Test a host with an invalid value adds no values to the columns."""
+        with aioresponses() as mock_keenergy_api:
+            for host, value in (("mocked-host-1", "0"), ("mocked-host-2", "mocked-invalid-value")):
+                mock_keenergy_api.post(
+                    f"http://{host}/var/readWriteVars",
+                    payload=[
+                        {"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "value": "3"},
+                        {"name": "APPL.CtrlAppl.sParam.heatpump[1].values.heatpumpState", "value": value},
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            async with KebaKeEnergyFleet(["mocked-host-1", "mocked-host-2"]) as fleet:
+                columns: Columns = await fleet.read_columns(
+                    HeatPump.STATE,
+                    Position(heat_pump=2, heat_circuit=0, hot_water_tank=0),
+                )
+
+        column: Column = columns[HeatPump.STATE]
+
+        assert list(columns.errors) == ["mocked-host-2"]
+        assert isinstance(columns.errors["mocked-host-2"], ValueError)
+        assert list(column.values) == [3, 0]
+        assert list(column.devices) == [0, 0]
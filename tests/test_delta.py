@@ -0,0 +1,143 @@
+from typing import Any
+from typing import TYPE_CHECKING
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import HotWaterTank
+from keba_keenergy_api.delta import Deadband
+from keba_keenergy_api.delta import DeltaFilter
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import ValueResponse
+    from keba_keenergy_api.stream import Snapshot
+
+
+def get_data(temperature: float, operating_mode: str, heat_circuit_temperatures: list[float]) -> dict[str, Any]:
+    """Get read data with the given values."""
+    return {
+        "system": {},
+        "hot_water_tank": {
+            "temperature": [{"value": temperature, "attributes": {}}],
+            "operating_mode": [{"value": operating_mode, "attributes": {}}],
+        },
+        "heat_pump": {},
+        "heat_circuit": {
+            "temperature": [{"value": value, "attributes": {}} for value in heat_circuit_temperatures],
+        },
+    }
+
+
+class TestDeltaFilter:
+    @pytest.mark.parametrize(
+        ("data", "expected_keys"),
+        [
+            (get_data(47.2, "auto", [21.0, 20.0]), {}),
+            (get_data(47.6, "auto", [21.0, 20.0]), {}),
+            (get_data(48.1, "auto", [21.0, 20.0]), {"hot_water_tank": ["temperature"]}),
+            (get_data(47.2, "heat_up", [21.0, 20.0]), {"hot_water_tank": ["operating_mode"]}),
+            (get_data(47.2, "auto", [21.0, 20.3]), {"heat_circuit": ["temperature"]}),
+            (get_data(47.2, "auto", [21.0, 20.1]), {}),
+        ],
+    )
+    def test_filter(self, data: dict[str, Any], expected_keys: dict[str, list[str]]) -> None:
+        """Test filter values which changed beyond the deadband."""
+        delta: DeltaFilter = DeltaFilter(
+            {HotWaterTank.TEMPERATURE: Deadband(absolute=0.5)},
+            default_deadband=Deadband(relative=0.01),
+        )
+
+        assert delta.filter(get_data(47.2, "auto", [21.0, 20.0])) == get_data(47.2, "auto", [21.0, 20.0])
+
+        changed: dict[str, ValueResponse] = delta.filter(data)
+
+        assert {prefix: list(values) for prefix, values in changed.items() if values} == expected_keys
+
+        for prefix, keys in expected_keys.items():
+            for key in keys:
+                assert changed[prefix][key] == data[prefix][key]
+
+    def test_reset(self) -> None:
+        """Test reset emits all values again."""
+        delta: DeltaFilter = DeltaFilter()
+
+        assert delta.filter(get_data(47.2, "auto", [21.0])) == get_data(47.2, "auto", [21.0])
+        assert not any(delta.filter(get_data(47.2, "auto", [21.0])).values())
+
+        delta.reset()
+
+        assert len(delta) == 0
+        assert delta.filter(get_data(47.2, "auto", [21.0])) == get_data(47.2, "auto", [21.0])
+
+    @pytest.mark.asyncio()
+    async def test_read_data_delta(self) -> None:
+        """Test read only changed data."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("20.5", "20.6", "21.5"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatCircuit[0].values.setValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+                host="mocked-host",
+                deadbands={HeatCircuit.TEMPERATURE: Deadband(absolute=0.5)},
+            )
+
+            for expected_data in (
+                {"temperature": [{"value": 20.5, "attributes": {}}]},
+                {},
+                {"temperature": [{"value": 21.5, "attributes": {}}]},
+            ):
+                data: dict[str, ValueResponse] = await client.read_data(
+                    request=HeatCircuit.TEMPERATURE,
+                    position=1,
+                    delta=True,
+                )
+
+                assert data["heat_circuit"] == expected_data
+
+    @pytest.mark.asyncio()
+    async def test_stream_delta(self) -> None:
+        """Test stream only snapshots with changed data."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("20.5", "20.6", "21.5"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatCircuit[0].values.setValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+                host="mocked-host",
+                default_deadband=Deadband(absolute=0.5),
+            )
+            snapshots: list[Snapshot] = []
+
+            async with client.stream(HeatCircuit.TEMPERATURE, position=1, interval=0.01, delta=True) as stream:
+                async for snapshot in stream:
+                    snapshots.append(snapshot)
+
+                    if len(snapshots) == 2:  # noqa: PLR2004
+                        break
+
+            assert [snapshot.data["heat_circuit"] for snapshot in snapshots] == [
+                {"temperature": [{"value": 20.5, "attributes": {}}]},
+                {"temperature": [{"value": 21.5, "attributes": {}}]},
+            ]
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 3  # noqa: PLR2004
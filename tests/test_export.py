@@ -0,0 +1,125 @@
+import sys
+from pathlib import Path
+from typing import Any
+from typing import TYPE_CHECKING
+
+import pytest
+
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.export import ArrowExporter
+from keba_keenergy_api.export import ParquetSnapshotWriter
+from keba_keenergy_api.export import get_field_type
+from keba_keenergy_api.fleet import FleetSnapshot
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import ValueResponse
+
+REQUEST: list[Any] = [System.OUTDOOR_TEMPERATURE, HeatPump.STATE, HeatPump.NAME, HeatPump.HIGH_PRESSURE]
+
+DATA: "dict[str, ValueResponse]" = {
+    "system": {"outdoor_temperature": {"value": 10.81}},
+    "heat_pump": {
+        "state": [{"value": "defrost"}, {"value": "standby"}],
+        "name": [{"value": "MOCKED-NAME-1"}, {"value": "MOCKED-NAME-2"}],
+        "high_pressure": [{"value": 16.5}, {"value": 17.5}],
+    },
+}
+
+
+class TestArrowExporter:
+    def test_field_types(self) -> None:
+        """Test field types from value types."""
+        assert get_field_type(HeatPump.HIGH_PRESSURE, human_readable=True) == "float64"
+        assert get_field_type(HeatPump.STATE, human_readable=False) == "int64"
+        assert get_field_type(HeatPump.STATE, human_readable=True) == "string"
+        assert get_field_type(HeatPump.NAME, human_readable=False) == "string"
+
+    def test_add(self) -> None:
+        """Test one row per host and position."""
+        exporter: ArrowExporter = ArrowExporter(REQUEST)
+        exporter.add("mocked-host", 1.5, DATA)
+        exporter.add_snapshot(FleetSnapshot("mocked-host-2", 2, error=TimeoutError()))
+
+        assert len(exporter) == 2  # noqa: PLR2004
+        assert exporter.columns == {
+            "timestamp": [1_500_000, 1_500_000],
+            "host": ["mocked-host", "mocked-host"],
+            "position": [1, 2],
+            "system_outdoor_temperature": [10.81, None],
+            "heat_pump_state": ["defrost", "standby"],
+            "heat_pump_name": ["MOCKED-NAME-1", "MOCKED-NAME-2"],
+            "heat_pump_high_pressure": [16.5, 17.5],
+        }
+
+    def test_missing_values(self) -> None:
+        """Test missing section members (e.g. in delta mode) are null."""
+        exporter: ArrowExporter = ArrowExporter(REQUEST, human_readable=False)
+        exporter.add("mocked-host", 1, {"heat_pump": {"state": [{"value": 3}]}})
+
+        assert exporter.columns["heat_pump_state"] == [3]
+        assert exporter.columns["heat_pump_high_pressure"] == [None]
+
+    def test_missing_pyarrow(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test error without PyArrow."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(ImportError, match="pip install keba-keenergy-api\\[pyarrow\\]"):
+            ArrowExporter(REQUEST).schema  # noqa: B018
+
+    def test_flush(self) -> None:
+        """Test record batches with a stable schema."""
+        pa: Any = pytest.importorskip("pyarrow")
+        exporter: ArrowExporter = ArrowExporter(REQUEST, human_readable=False)
+
+        exporter.add("mocked-host", 1, {"heat_pump": {"state": [{"value": 3}]}})
+        batch: Any = exporter.flush()
+
+        assert len(exporter) == 0
+        assert batch.num_rows == 1
+        assert batch.schema.field("heat_pump_state").type == pa.int64()
+        assert batch.schema.field("heat_pump_name").type == pa.string()
+        assert batch.column("heat_pump_high_pressure").null_count == 1
+
+
+class TestParquetSnapshotWriter:
+    def test_row_groups(self, tmp_path: Path) -> None:
+        """Test one row group per time window."""
+        pq: Any = pytest.importorskip("pyarrow.parquet")
+        path: Path = tmp_path / "snapshots.parquet"
+
+        with ParquetSnapshotWriter(path, REQUEST, window=60) as writer:
+            writer.add("mocked-host-1", 0, DATA)
+            writer.add("mocked-host-2", 30, DATA)
+            writer.add("mocked-host-1", 61, DATA)
+
+        parquet_file: Any = pq.ParquetFile(path)
+
+        assert parquet_file.metadata.num_row_groups == 2  # noqa: PLR2004
+        assert parquet_file.metadata.num_rows == 6  # noqa: PLR2004
+        assert parquet_file.read().column("host").to_pylist()[::2] == [
+            "mocked-host-1",
+            "mocked-host-2",
+            "mocked-host-1",
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_fleet(self, tmp_path: Path) -> None:
+        """Test fleet snapshots."""
+        pq: Any = pytest.importorskip("pyarrow.parquet")
+        path: Path = tmp_path / "fleet.parquet"
+
+        async with KebaKeEnergySimulator(heat_pumps=2) as simulator:
+            hosts: list[str] = [simulator.host, "127.0.0.1:1"]
+
+            async with KebaKeEnergyFleet(hosts, timeout=5) as fleet:
+                with ParquetSnapshotWriter(path, REQUEST) as writer:
+                    async for snapshot in fleet.read_data(REQUEST, records=True):
+                        writer.add_snapshot(snapshot)
+
+        table: Any = pq.read_table(path)
+
+        assert table.column("host").to_pylist() == [hosts[0], hosts[0]]
+        assert table.column("position").to_pylist() == [1, 2]
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from typing import Any
+from typing import TYPE_CHECKING
+
+import pytest
+from aioresponses import CallbackResult
+from aioresponses import aioresponses
+
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.fleet import FleetSnapshot
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.constants import Section
+
+OUTDOOR_TEMPERATURE_PAYLOAD: list[dict[str, Any]] = [
+    {
+        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+        "attributes": {},
+        "value": "10.808357",
+    },
+]
+
+
+class TestKebaKeEnergyFleet:
+    @pytest.mark.asyncio()
+    async def test_read_data(self) -> None:
+        """Test read data from all hosts with failure isolation."""
+        with aioresponses() as mock_keenergy_api:
+            for host in ("mocked-host-1", "mocked-host-2"):
+                mock_keenergy_api.post(
+                    f"http://{host}/var/readWriteVars",
+                    payload=OUTDOOR_TEMPERATURE_PAYLOAD,
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            mock_keenergy_api.post(
+                "http://mocked-host-3/var/readWriteVars",
+                payload={"developerMessage": "mocked-error"},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyFleet(["mocked-host-1", "mocked-host-2", "mocked-host-3"]) as fleet:
+                snapshots: list[FleetSnapshot] = [
+                    snapshot async for snapshot in fleet.read_data(request=System.OUTDOOR_TEMPERATURE, position=1)
+                ]
+
+            snapshots_by_host: dict[str, FleetSnapshot] = {snapshot.host: snapshot for snapshot in snapshots}
+
+            assert len(snapshots) == 3  # noqa: PLR2004
+            assert snapshots_by_host["mocked-host-1"].data == {
+                "system": {"outdoor_temperature": {"value": 10.81, "attributes": {}}},
+                "hot_water_tank": {},
+                "heat_pump": {},
+                "heat_circuit": {},
+            }
+            assert snapshots_by_host["mocked-host-2"].error is None
+            assert snapshots_by_host["mocked-host-3"].data is None
+            assert isinstance(snapshots_by_host["mocked-host-3"].error, APIError)
+
+    @pytest.mark.asyncio()
+    async def test_slow_host(self) -> None:
+        """Test a slow host doesn't stall the other hosts."""
+
+        async def slow_response(*_: Any, **__: Any) -> CallbackResult:  # noqa: ANN401
+            await asyncio.sleep(10)
+            return CallbackResult(
+                body=json.dumps(OUTDOOR_TEMPERATURE_PAYLOAD),
+                content_type="application/json;charset=utf-8",
+            )
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post("http://mocked-slow-host/var/readWriteVars", callback=slow_response)
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=OUTDOOR_TEMPERATURE_PAYLOAD,
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyFleet(["mocked-slow-host", "mocked-host"], limit=1, timeout=0.1) as fleet:
+                snapshots: list[FleetSnapshot] = [
+                    snapshot async for snapshot in fleet.read_data(request=System.OUTDOOR_TEMPERATURE, position=1)
+                ]
+
+            assert [snapshot.host for snapshot in snapshots] == ["mocked-slow-host", "mocked-host"]
+            assert isinstance(snapshots[0].error, asyncio.TimeoutError)
+            assert snapshots[1].error is None
+
+    @pytest.mark.asyncio()
+    async def test_slow_host_limit(self) -> None:
+        """Test reads which continue after a timeout hold the per-host slot until they finish."""
+        in_flight: int = 0
+        max_in_flight: int = 0
+
+        async def slow_response(*_: Any, **__: Any) -> CallbackResult:  # noqa: ANN401
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.2)
+            in_flight -= 1
+            return CallbackResult(
+                body=json.dumps(OUTDOOR_TEMPERATURE_PAYLOAD),
+                content_type="application/json;charset=utf-8",
+            )
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post("http://mocked-slow-host/var/readWriteVars", callback=slow_response, repeat=True)
+
+            async with KebaKeEnergyFleet(["mocked-slow-host"], limit_per_host=1, timeout=0.05) as fleet:
+                requests: list[Section] = [System.OUTDOOR_TEMPERATURE, HeatPump.HIGH_PRESSURE]
+
+                for request in requests:
+                    snapshots: list[FleetSnapshot] = [
+                        snapshot async for snapshot in fleet.read_data(request=request, position=1)
+                    ]
+
+                    assert isinstance(snapshots[0].error, asyncio.TimeoutError)
+
+            assert max_in_flight == 1
+
+    @pytest.mark.asyncio()
+    async def test_completion_order(self) -> None:
+        """Test snapshots are yielded in completion order."""
+
+        async def slow_response(*_: Any, **__: Any) -> CallbackResult:  # noqa: ANN401
+            await asyncio.sleep(0.05)
+            return CallbackResult(
+                body=json.dumps(OUTDOOR_TEMPERATURE_PAYLOAD),
+                content_type="application/json;charset=utf-8",
+            )
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post("http://mocked-slow-host/var/readWriteVars", callback=slow_response)
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=OUTDOOR_TEMPERATURE_PAYLOAD,
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            fleet: KebaKeEnergyFleet = KebaKeEnergyFleet(["mocked-slow-host", "mocked-host"])
+
+            assert len(fleet) == 2  # noqa: PLR2004
+
+            snapshots: list[FleetSnapshot] = [
+                snapshot async for snapshot in fleet.read_data(request=System.OUTDOOR_TEMPERATURE, position=1)
+            ]
+            await fleet.close()
+
+            assert [snapshot.host for snapshot in snapshots] == ["mocked-host", "mocked-slow-host"]
+            assert all(snapshot.error is None for snapshot in snapshots)
@@ -0,0 +1,97 @@
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.history import HistoryStore
+from keba_keenergy_api.history import RingBuffer
+
+
+class TestRingBuffer:
+    def test_append(self) -> None:
+        """Test the oldest samples are overwritten."""
+        buffer: RingBuffer = RingBuffer(3)
+
+        assert buffer.last() is None
+
+        for timestamp in range(5):
+            buffer.append(timestamp, timestamp * 10)
+
+        assert len(buffer) == 3  # noqa: PLR2004
+        assert buffer.timestamps.tolist() == [2, 3, 4]
+        assert buffer.values.tolist() == [20, 30, 40]  # noqa: PD011
+        assert buffer.last() == (4, 40)
+
+        buffer.clear()
+        assert len(buffer) == 0
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected_values"),
+        [
+            (None, None, [20, 30, 40, 50]),
+            (3, None, [30, 40, 50]),
+            (None, 3.5, [20, 30]),
+            (2.5, 4, [30, 40]),
+            (6, None, []),
+        ],
+    )
+    def test_range(self, start: float | None, end: float | None, expected_values: list[float]) -> None:
+        """Test range reads."""
+        buffer: RingBuffer = RingBuffer(4)
+
+        for timestamp in range(6):
+            buffer.append(timestamp, timestamp * 10)
+
+        timestamps, values = buffer.range(start, end)
+
+        assert values.tolist() == expected_values
+        assert timestamps.tolist() == [value / 10 for value in expected_values]
+
+
+class TestHistoryStore:
+    def test_record(self) -> None:
+        """Test record only numeric values."""
+        history: HistoryStore = HistoryStore(size=2)
+        history.record("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", 1, "10.808357")
+        history.record("APPL.CtrlAppl.sParam.heatpump[0].param.name", 1, "MOCKED-NAME")
+
+        assert len(history) == 1
+        assert "APPL.CtrlAppl.sParam.heatpump[0].param.name" not in history
+
+        buffer: RingBuffer | None = history.get_section(System.OUTDOOR_TEMPERATURE)
+
+        assert buffer is not None
+        assert buffer.last() == (1, 10.808357)
+
+    @pytest.mark.asyncio()
+    async def test_read_history(self) -> None:
+        """Test read values are recorded."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("16.5", "17.5"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", history_size=10)
+
+            await client.heat_pump.get_high_pressure()
+            await client.heat_pump.get_high_pressure()
+            # Cached values are not recorded again
+            await client.heat_pump.get_high_pressure(max_age=60)
+
+            assert client.history is not None
+
+            buffer: RingBuffer | None = client.history.get_section(HeatPump.HIGH_PRESSURE, position=1)
+
+            assert buffer is not None
+            assert buffer.values.tolist() == [16.5, 17.5]  # noqa: PD011
+            assert buffer.timestamps[0] <= buffer.timestamps[1]
@@ -0,0 +1,75 @@
+import pytest
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.instrumentation import Instrumentation
+from keba_keenergy_api.instrumentation import RequestMetrics
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+
+class TestInstrumentation:
+    @pytest.mark.asyncio()
+    async def test_metrics(self) -> None:
+        """Test metrics are reported for every request."""
+        metrics: list[RequestMetrics] = []
+
+        async with KebaKeEnergySimulator(latency=0.01) as simulator:
+            port: str = simulator.host.rsplit(":", 1)[1]
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+                host=f"localhost:{port}",
+                instrumentation=Instrumentation([metrics.append]),
+            )
+
+            await client.system.get_outdoor_temperature()
+            await client.system.get_info()
+
+            async with client:
+                await client.heat_pump.set_operating_mode("on")
+
+        assert [(metric.endpoint, metric.variables, metric.status, metric.error) for metric in metrics] == [
+            ("/var/readWriteVars", 1, 200, None),
+            ("/swupdate?action=getSystemInstalled", 0, 200, None),
+            ("/var/readWriteVars?action=set", 1, 200, None),
+        ]
+
+        metric: RequestMetrics = metrics[0]
+
+        assert metric.host == f"localhost:{port}"
+        assert metric.request_bytes == len(
+            b'[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
+        )
+        assert metric.response_bytes > 0
+        assert metric.dns is not None
+        assert metric.connect is not None
+        assert metric.ttfb is not None
+        assert metric.decode is not None
+        assert metric.connect <= metric.ttfb <= metric.total
+        assert metric.ttfb >= 0.01  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    async def test_error(self) -> None:
+        """Test metrics of failed requests and failing hooks."""
+        metrics: list[RequestMetrics] = []
+
+        def failing_hook(_metrics: RequestMetrics) -> None:
+            msg: str = "mocked-error"
+            raise RuntimeError(msg)
+
+        instrumentation: Instrumentation = Instrumentation([failing_hook])
+        instrumentation.add_hook(metrics.append)
+
+        async with (
+            KebaKeEnergySimulator(error_rate=1) as simulator,
+            KebaKeEnergyAPI(host=simulator.host, instrumentation=instrumentation) as client,
+        ):
+            with pytest.raises(APIError):
+                await client.system.get_outdoor_temperature()
+
+        assert len(metrics) == 1
+        assert metrics[0].status == 500  # noqa: PLR2004
+        assert metrics[0].error == "APIError"
+
+        instrumentation.remove_hook(metrics.append)
+        instrumentation.remove_hook(failing_hook)
+
+        assert not instrumentation
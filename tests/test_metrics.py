@@ -0,0 +1,149 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+from keba_keenergy_api.instrumentation import RequestMetrics
+from keba_keenergy_api.metrics import Histogram
+from keba_keenergy_api.metrics import MetricsRegistry
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+
+def _metrics(endpoint: str, total: float, *, variables: int = 1, error: str | None = None) -> RequestMetrics:
+    """Create request metrics."""
+    return RequestMetrics(
+        host="mocked-host",
+        endpoint=endpoint,
+        variables=variables,
+        request_bytes=0,
+        response_bytes=0,
+        dns=None,
+        connect=None,
+        ttfb=None,
+        decode=None,
+        total=total,
+        status=200,
+        error=error,
+    )
+
+
+class TestHistogram:
+    def test_render(self) -> None:
+        """Test cumulative buckets."""
+        histogram: Histogram = Histogram((0.1, 1))
+
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+
+        assert histogram.render("mocked", 'host="mocked-host"') == [
+            'mocked_bucket{host="mocked-host",le="0.1"} 2',
+            'mocked_bucket{host="mocked-host",le="1.0"} 3',
+            'mocked_bucket{host="mocked-host",le="+Inf"} 4',
+            'mocked_sum{host="mocked-host"} 2.65',
+            'mocked_count{host="mocked-host"} 4',
+        ]
+
+
+class TestMetricsRegistry:
+    def test_observe(self) -> None:
+        """Test counters per host and endpoint."""
+        registry: MetricsRegistry = MetricsRegistry(buckets=(1,))
+        registry.observe(_metrics("/var/readWriteVars", 0.5, variables=10))
+        registry.observe(_metrics("/var/readWriteVars", 2, error="TimeoutError"))
+        registry.observe(_metrics("/var/readWriteVars?action=set", 0.5, variables=2))
+        registry.observe(_metrics('/mocked"endpoint', 0.5))
+
+        lines: list[str] = registry.render().splitlines()
+
+        assert 'keba_keenergy_requests_total{host="mocked-host",endpoint="/var/readWriteVars"} 2' in lines
+        assert (
+            'keba_keenergy_request_errors_total{host="mocked-host",endpoint="/var/readWriteVars",'
+            'error="TimeoutError"} 1'
+        ) in lines
+        assert (
+            'keba_keenergy_request_duration_seconds_bucket{host="mocked-host",endpoint="/var/readWriteVars",'
+            'le="1.0"} 1'
+        ) in lines
+        assert 'keba_keenergy_variables_read_total{host="mocked-host"} 10' in lines
+        assert 'keba_keenergy_variables_written_total{host="mocked-host"} 2' in lines
+        assert 'keba_keenergy_requests_total{host="mocked-host",endpoint="/mocked\\"endpoint"} 1' in lines
+        assert "# TYPE keba_keenergy_request_duration_seconds histogram" in lines
+
+    @pytest.mark.asyncio()
+    async def test_client(self) -> None:
+        """Test metrics of a registered client."""
+        registry: MetricsRegistry = MetricsRegistry()
+
+        async with KebaKeEnergySimulator() as simulator:
+            host: str = simulator.host
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host=host, cache_ttl={System.OUTDOOR_TEMPERATURE: 60})
+            registry.register(client)
+
+            async with client:
+                await client.system.get_outdoor_temperature()
+                await client.system.get_outdoor_temperature()
+                await client.system.set_operating_mode("standby")
+
+                simulator.error_rate = 1
+
+                with pytest.raises(APIError):
+                    await client.system.get_operating_mode()
+
+        lines: list[str] = registry.render().splitlines()
+
+        assert f'keba_keenergy_cache_hits_total{{host="{host}"}} 1' in lines
+        assert f'keba_keenergy_cache_misses_total{{host="{host}"}} 1' in lines
+        assert f'keba_keenergy_variables_read_total{{host="{host}"}} 1' in lines
+        assert f'keba_keenergy_variables_written_total{{host="{host}"}} 1' in lines
+        assert (
+            f'keba_keenergy_request_errors_total{{host="{host}",endpoint="/var/readWriteVars",error="APIError"}} 1'
+        ) in lines
+
+        response: web.Response = await registry.handler(make_mocked_request("GET", "/metrics"))
+
+        assert response.content_type == "text/plain"
+        assert response.body == registry.render().encode()
+
+    @pytest.mark.asyncio()
+    async def test_fleet(self) -> None:
+        """Test metrics of all clients of a registered fleet."""
+        registry: MetricsRegistry = MetricsRegistry()
+
+        async with KebaKeEnergySimulator() as simulator:
+            host: str = simulator.host
+            fleet: KebaKeEnergyFleet = KebaKeEnergyFleet([host])
+            registry.register(fleet)
+
+            async with fleet:
+                async for _ in fleet.read_data(System.OUTDOOR_TEMPERATURE, position=1):
+                    pass
+
+                lines: list[str] = registry.render().splitlines()
+
+        assert f'keba_keenergy_requests_total{{host="{host}",endpoint="/var/readWriteVars"}} 1' in lines
+        assert f'keba_keenergy_cache_misses_total{{host="{host}"}} 0' in lines
+
+    @pytest.mark.asyncio()
+    async def test_fleet_connected(self) -> None:
+        """Test metrics of all clients of a fleet, which is registered after connecting."""
+        registry: MetricsRegistry = MetricsRegistry()
+
+        async with KebaKeEnergySimulator() as simulator:
+            host: str = simulator.host
+
+            async with KebaKeEnergyFleet([host]) as fleet:
+                registry.register(fleet)
+
+                async for _ in fleet.read_data(System.OUTDOOR_TEMPERATURE, position=1):
+                    pass
+
+                lines: list[str] = registry.render().splitlines()
+
+        assert f'keba_keenergy_requests_total{{host="{host}",endpoint="/var/readWriteVars"}} 1' in lines
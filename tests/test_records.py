@@ -0,0 +1,111 @@
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.fleet import FleetSnapshot
+from keba_keenergy_api.fleet import KebaKeEnergyFleet
+from keba_keenergy_api.records import EMPTY_ATTRIBUTES
+from keba_keenergy_api.records import ValueRecord
+from keba_keenergy_api.records import ValueRecords
+from keba_keenergy_api.records import intern_attributes
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import ValueResponse
+
+PAYLOAD: list[dict[str, Any]] = [
+    {
+        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+        "attributes": {"formatId": "fmtTemp", "upperLimit": "40", "lowerLimit": "-30"},
+        "value": "10.808357",
+    },
+    {
+        "name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState",
+        "attributes": {"upperLimit": "32767", "lowerLimit": "0"},
+        "value": "3",
+    },
+    {
+        "name": "APPL.CtrlAppl.sParam.heatpump[1].values.heatpumpState",
+        "attributes": {"upperLimit": "32767", "lowerLimit": "0"},
+        "value": "0",
+    },
+]
+
+
+class TestValueRecords:
+    def test_intern_attributes(self) -> None:
+        """Test equal attributes are shared and read-only."""
+        attributes: dict[str, Any] = {"upper_limit": "40", "lower_limit": "-30"}
+
+        assert intern_attributes(attributes) is intern_attributes(dict(attributes))
+        assert intern_attributes(attributes) == attributes
+        assert intern_attributes({}) is EMPTY_ATTRIBUTES
+        assert intern_attributes({"mocked": ["unhashable"]}) == {"mocked": ["unhashable"]}
+
+        with pytest.raises(TypeError):
+            intern_attributes(attributes)["upper_limit"] = "50"  # type: ignore[index]
+
+    def test_records(self) -> None:
+        """Test get records by section member and position."""
+        record: ValueRecord = ValueRecord(10.81, 1)
+        records: ValueRecords = ValueRecords({System.OUTDOOR_TEMPERATURE: (record,)})
+
+        assert records.get_value(System.OUTDOOR_TEMPERATURE) is record
+        assert records.get_value(System.OUTDOOR_TEMPERATURE, position=2) is None
+        assert records.get_value(HeatPump.STATE) is None
+        assert record.to_dict() == {"value": 10.81, "attributes": {}}
+        assert not hasattr(record, "__dict__")
+
+    @pytest.mark.asyncio()
+    async def test_read_records(self) -> None:
+        """Test the records view has the read_data() response shape."""
+        with aioresponses() as mock_keenergy_api:
+            for _ in range(2):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=PAYLOAD,
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", cache_attributes=False)
+            position: Position = Position(heat_pump=2, heat_circuit=0, hot_water_tank=0)
+            request: list[Any] = [System.OUTDOOR_TEMPERATURE, HeatPump.STATE]
+
+            records: ValueRecords = await client.read_records(request, position)
+            data: dict[str, ValueResponse] = await client.read_data(request, position)
+
+        assert records.as_dict() == data
+        assert (
+            records.as_dict()["heat_pump"]["state"]
+            == [
+                {"value": "standby", "attributes": {"upper_limit": "32767", "lower_limit": "0"}},
+                {"value": "standby", "attributes": {"upper_limit": "32767", "lower_limit": "0"}},
+            ]
+            or records.as_dict()["heat_pump"]["state"] == data["heat_pump"]["state"]
+        )
+
+        states: tuple[ValueRecord, ...] = records[HeatPump.STATE]
+
+        assert states[0].attributes is states[1].attributes
+        assert states[0].timestamp == states[1].timestamp
+        assert list(records) == [System.OUTDOOR_TEMPERATURE, HeatPump.STATE]
+
+    @pytest.mark.asyncio()
+    async def test_fleet(self) -> None:
+        """Test fleet snapshots with value records."""
+        async with KebaKeEnergySimulator() as simulator:
+            host: str = simulator.host
+
+            async with KebaKeEnergyFleet([host]) as fleet:
+                snapshots: list[FleetSnapshot] = [
+                    snapshot async for snapshot in fleet.read_data(System.OUTDOOR_TEMPERATURE, records=True)
+                ]
+
+        assert isinstance(snapshots[0].data, ValueRecords)
+        assert snapshots[0].data.get_value(System.OUTDOOR_TEMPERATURE) is not None
@@ -0,0 +1,65 @@
+import pytest
+
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import HotWaterTank
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.registry import SECTIONS
+from keba_keenergy_api.registry import VARIABLES
+from keba_keenergy_api.registry import get_section
+
+
+class TestVariableRegistry:
+    def test_all_sections(self) -> None:
+        """Test all section members are compiled."""
+        assert len(SECTIONS) == len(System) + len(HotWaterTank) + len(HeatPump) + len(HeatCircuit)
+        assert set(VARIABLES) == set(SECTIONS)
+
+    @pytest.mark.parametrize(
+        ("section", "idx", "expected_name", "expected_key"),
+        [
+            (
+                System.OUTDOOR_TEMPERATURE,
+                None,
+                "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                "system_outdoor_temperature",
+            ),
+            (
+                HotWaterTank.TEMPERATURE,
+                1,
+                "APPL.CtrlAppl.sParam.hotWaterTank[1].topTemp.values.actValue",
+                "hot_water_tank_temperature",
+            ),
+            (
+                HeatPump.INFLOW_TEMPERATURE,
+                0,
+                "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue",
+                "heat_pump_inflow_temperature",
+            ),
+            (
+                HeatCircuit.DAY_TEMPERATURE,
+                2,
+                "APPL.CtrlAppl.sParam.heatCircuit[2].param.normalSetTemp",
+                "heat_circuit_day_temperature",
+            ),
+        ],
+    )
+    def test_variable(self, section: Section, idx: int | None, expected_name: str, expected_key: str) -> None:
+        """Test precompiled variable names."""
+        assert VARIABLES[section].name(idx) == expected_name
+        assert VARIABLES[section].key == expected_key
+        assert VARIABLES[section].short_key == section.name.lower()
+
+    @pytest.mark.parametrize(
+        ("name", "expected_section"),
+        [
+            ("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", System.OUTDOOR_TEMPERATURE),
+            ("APPL.CtrlAppl.sParam.heatpump[1].values.heatpumpState", HeatPump.STATE),
+            ("APPL.CtrlAppl.sParam.heatCircuit[2].param.normalSetTemp", HeatCircuit.DAY_TEMPERATURE),
+            ("APPL.CtrlAppl.sParam.unknown[0].values.actValue", None),
+        ],
+    )
+    def test_get_section(self, name: str, expected_section: Section | None) -> None:
+        """Test get section members from variable names."""
+        assert get_section(name) == expected_section
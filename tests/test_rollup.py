@@ -0,0 +1,101 @@
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.history import HistoryStore
+from keba_keenergy_api.rollup import Rollup
+from keba_keenergy_api.rollup import RollupBuffer
+
+
+class TestRollupBuffer:
+    def test_add(self) -> None:
+        """Test samples are aggregated per time bucket."""
+        rollups: RollupBuffer = RollupBuffer(60, size=2)
+
+        assert rollups.current() is None
+
+        for timestamp, value in ((0, 2), (30, 4), (59, 3), (60, 10), (10, 100), (150, 5), (170, 7)):
+            rollups.add(timestamp, value)
+
+        assert len(rollups) == 2  # noqa: PLR2004
+        assert rollups.current() == Rollup(start=120, minimum=5, maximum=7, mean=6, last=7, samples=2)
+        assert rollups.range() == [
+            Rollup(start=60, minimum=10, maximum=10, mean=10, last=10, samples=1),
+            Rollup(start=120, minimum=5, maximum=7, mean=6, last=7, samples=2),
+        ]
+
+    @pytest.mark.parametrize(
+        ("start", "end", "expected_starts"),
+        [
+            (None, None, [60, 120, 180]),
+            (100, None, [120, 180]),
+            (None, 120, [60, 120]),
+            (200, None, []),
+        ],
+    )
+    def test_range(self, start: float | None, end: float | None, expected_starts: list[float]) -> None:
+        """Test range reads."""
+        rollups: RollupBuffer = RollupBuffer(60, size=3)
+
+        for timestamp in range(0, 240, 20):
+            rollups.add(timestamp, timestamp)
+
+        assert [rollup.start for rollup in rollups.range(start, end)] == expected_starts
+
+
+class TestHistoryRollups:
+    def test_record(self) -> None:
+        """Test samples are aggregated for all resolutions."""
+        history: HistoryStore = HistoryStore(size=10, resolutions=(60, 3600))
+
+        for timestamp, value in ((0, "1"), (60, "3"), (120, "5")):
+            history.record("mocked-name", timestamp, value)
+
+        minutes: RollupBuffer | None = history.get_rollups("mocked-name", 60)
+        hours: RollupBuffer | None = history.get_rollups("mocked-name", 3600)
+
+        assert minutes is not None
+        assert len(minutes) == 3  # noqa: PLR2004
+        assert hours is not None
+        assert hours.current() == Rollup(start=0, minimum=1, maximum=5, mean=3, last=5, samples=3)
+        assert history.get_rollups("mocked-name", 900) is None
+
+    @pytest.mark.asyncio()
+    async def test_read_rollups(self) -> None:
+        """Test read values are aggregated."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("16.5", "17.5"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", rollup_resolutions=(86400 * 365,))
+
+            await client.heat_pump.get_high_pressure()
+            await client.heat_pump.get_high_pressure()
+
+            assert client.history is not None
+
+            rollups: RollupBuffer | None = client.history.get_section_rollups(HeatPump.HIGH_PRESSURE, 86400 * 365)
+
+            assert rollups is not None
+
+            rollup: Rollup | None = rollups.current()
+
+            assert rollup is not None
+            assert (rollup.minimum, rollup.maximum, rollup.mean, rollup.last, rollup.samples) == (
+                16.5,
+                17.5,
+                17,
+                17.5,
+                2,
+            )
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.error import APIError
+
+
+class TestPollingScheduler:
+    @pytest.mark.asyncio()
+    async def test_subscribe(self) -> None:
+        """Test due subscriptions are read with one request."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                        "attributes": {},
+                        "value": "16.5",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].param.name",
+                        "attributes": {},
+                        "value": "MOCKED-NAME",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            received: list[dict[str, Any]] = []
+            done: asyncio.Event = asyncio.Event()
+
+            def callback(data: dict[str, Any]) -> None:
+                received.append(data)
+
+                if len(received) == 2:  # noqa: PLR2004
+                    done.set()
+
+            await client.subscribe(HeatPump.HIGH_PRESSURE, position=1, interval=60, callback=callback)
+            await client.subscribe(HeatPump.NAME, position=1, interval=3600, callback=callback)
+            await asyncio.wait_for(done.wait(), timeout=1)
+            await client.close()
+
+            assert received == [
+                {
+                    "system": {},
+                    "hot_water_tank": {},
+                    "heat_pump": {"high_pressure": [{"value": 16.5, "attributes": {}}]},
+                    "heat_circuit": {},
+                },
+                {
+                    "system": {},
+                    "hot_water_tank": {},
+                    "heat_pump": {"name": [{"value": "MOCKED-NAME", "attributes": {}}]},
+                    "heat_circuit": {},
+                },
+            ]
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue", "attr": "1"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.name", "attr": "1"}]'
+                ),
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_intervals(self) -> None:
+        """Test subscriptions are read every interval."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                        "attributes": {},
+                        "value": "16.5",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].param.name",
+                        "attributes": {},
+                        "value": "MOCKED-NAME",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=True,
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            fast: list[dict[str, Any]] = []
+            slow: list[dict[str, Any]] = []
+            done: asyncio.Event = asyncio.Event()
+
+            async def fast_callback(data: dict[str, Any]) -> None:
+                fast.append(data)
+
+                if len(fast) == 3:  # noqa: PLR2004
+                    done.set()
+
+            fast_subscription = await client.subscribe(
+                HeatPump.HIGH_PRESSURE,
+                position=1,
+                interval=0.02,
+                callback=fast_callback,
+            )
+            await client.subscribe(HeatPump.NAME, position=1, interval=3600, callback=slow.append)
+            await asyncio.wait_for(done.wait(), timeout=1)
+
+            fast_subscription.cancel()
+            await client.close()
+
+            assert len(slow) == 1
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == len(fast)
+
+    @pytest.mark.asyncio()
+    async def test_on_error(self) -> None:
+        """Test errors are passed to the error callback."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload={"developerMessage": "mocked-error"},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            errors: asyncio.Queue[Exception] = asyncio.Queue()
+
+            await client.subscribe(
+                HeatPump.HIGH_PRESSURE,
+                position=1,
+                interval=60,
+                callback=print,
+                on_error=errors.put_nowait,
+            )
+            error: Exception = await asyncio.wait_for(errors.get(), timeout=1)
+            await client.close()
+
+            assert isinstance(error, APIError)
+            assert str(error) == "mocked-error"
+
+    @pytest.mark.asyncio()
+    async def test_invalid_interval(self) -> None:
+        """Test invalid interval."""
+        client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+        with pytest.raises(APIError) as error:
+            await client.subscribe(HeatPump.HIGH_PRESSURE, position=1, interval=0, callback=print)
+
+        assert str(error.value) == "Invalid interval!"
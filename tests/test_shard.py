@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import signal
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.fleet import FleetSnapshot
+from keba_keenergy_api.shard import ShardedFleet
+
+
+async def read_write_vars(request: web.Request) -> web.Response:
+    """Return a value for each requested variable."""
+    payload: list[dict[str, str]] = await request.json()
+
+    return web.Response(
+        text=json.dumps([{"name": item["name"], "attributes": {}, "value": "10.808357"} for item in payload]),
+        headers={"Content-Type": "application/json;charset=utf-8"},
+    )
+
+
+@pytest_asyncio.fixture()
+async def hosts() -> AsyncIterator[list[str]]:
+    """Start a device server on four ports."""
+    app: web.Application = web.Application()
+    app.router.add_post("/var/readWriteVars", read_write_vars)
+
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+
+    sites: list[web.TCPSite] = [web.TCPSite(runner, "127.0.0.1", 0) for _ in range(4)]
+
+    for site in sites:
+        await site.start()
+
+    yield [f"127.0.0.1:{site._server.sockets[0].getsockname()[1]}" for site in sites]  # type: ignore[union-attr]  # noqa: SLF001
+
+    await runner.cleanup()
+
+
+async def collect(stream: AsyncIterator[FleetSnapshot], hosts: list[str]) -> list[FleetSnapshot]:
+    """Collect snapshots until every host was read."""
+    snapshots: list[FleetSnapshot] = []
+
+    async for snapshot in stream:
+        snapshots.append(snapshot)
+
+        if {snapshot.host for snapshot in snapshots} == set(hosts):
+            return snapshots
+
+    return snapshots
+
+
+class TestShardedFleet:
+    @pytest.mark.asyncio()
+    async def test_stream(self, hosts: list[str]) -> None:
+        """Test stream snapshots from all worker processes."""
+        fleet: ShardedFleet = ShardedFleet(hosts, workers=2)
+        stream: AsyncIterator[FleetSnapshot] = fleet.stream(System.OUTDOOR_TEMPERATURE, position=1, interval=0.1)
+
+        snapshots: list[FleetSnapshot] = await asyncio.wait_for(collect(stream, hosts), timeout=60)
+
+        assert sorted(host for shard in fleet.shards for host in shard) == sorted(hosts)
+        assert len(fleet.shards) == 2  # noqa: PLR2004
+
+        await stream.aclose()  # type: ignore[attr-defined]
+
+        assert fleet.shards == []
+        assert all(snapshot.error is None for snapshot in snapshots)
+        assert snapshots[0].data == {
+            "system": {"outdoor_temperature": {"value": 10.81, "attributes": {}}},
+            "hot_water_tank": {},
+            "heat_pump": {},
+            "heat_circuit": {},
+        }
+
+    @pytest.mark.asyncio()
+    async def test_default_executor(self, hosts: list[str]) -> None:
+        """Test receiving snapshots doesn't hold threads of the default executor."""
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+
+        fleet: ShardedFleet = ShardedFleet(hosts, workers=2)
+        stream: AsyncIterator[FleetSnapshot] = fleet.stream(System.OUTDOOR_TEMPERATURE, position=1, interval=5)
+
+        await asyncio.wait_for(collect(stream, hosts), timeout=60)
+        await asyncio.wait_for(asyncio.to_thread(os.getpid), timeout=2)
+        await asyncio.wait_for(stream.aclose(), timeout=60)  # type: ignore[attr-defined]
+
+        assert fleet.shards == []
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(("max_restarts", "expected_workers"), [(1, 2), (0, 1)])
+    async def test_rebalance(self, hosts: list[str], max_restarts: int, expected_workers: int) -> None:
+        """Test hosts of a dead worker process are polled again."""
+        fleet: ShardedFleet = ShardedFleet(hosts, workers=2, max_restarts=max_restarts)
+        stream: AsyncIterator[FleetSnapshot] = fleet.stream(System.OUTDOOR_TEMPERATURE, position=1, interval=0.1)
+
+        await asyncio.wait_for(collect(stream, hosts), timeout=60)
+
+        pid: int | None = fleet.pids[0]
+        assert pid is not None
+        os.kill(pid, signal.SIGKILL)
+
+        # Drain snapshots which were sent before the worker process was killed
+        while pid in fleet.pids:
+            await asyncio.wait_for(anext(stream), timeout=60)
+
+        snapshots: list[FleetSnapshot] = await asyncio.wait_for(collect(stream, hosts), timeout=60)
+
+        assert len(fleet.shards) == expected_workers
+        assert sorted(host for shard in fleet.shards for host in shard) == sorted(hosts)
+        assert {snapshot.host for snapshot in snapshots} == set(hosts)
+
+        await stream.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,81 @@
+import time
+from typing import Any
+
+import pytest
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.simulator import KebaKeEnergySimulator
+
+
+class TestKebaKeEnergySimulator:
+    def test_variables(self) -> None:
+        """Test the variable tree is generated for all positions."""
+        simulator: KebaKeEnergySimulator = KebaKeEnergySimulator(heat_pumps=2, heat_circuits=3, hot_water_tanks=0)
+
+        assert "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue" in simulator.variables
+        assert "APPL.CtrlAppl.sParam.heatpump[1].values.heatpumpState" in simulator.variables
+        assert "APPL.CtrlAppl.sParam.heatCircuit[2].param.normalSetTemp" in simulator.variables
+        assert "APPL.CtrlAppl.sParam.heatCircuit[3].param.normalSetTemp" not in simulator.variables
+        assert "APPL.CtrlAppl.sParam.hotWaterTank[0].topTemp.values.actValue" not in simulator.variables
+
+    def test_drift(self) -> None:
+        """Test measured values drift within their limits and set values do not."""
+        simulator: KebaKeEnergySimulator = KebaKeEnergySimulator(drift=100, seed=1)
+
+        for variable in simulator.variables.values():
+            variable.timestamp = time.monotonic() - 60
+
+        values: set[str] = {simulator.get_value("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue") for _ in range(5)}
+
+        assert len(values) > 1
+        assert all(-30 <= float(value) <= 40 for value in values)  # noqa: PLR2004
+        assert simulator.get_value("APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp") == "21"
+
+    @pytest.mark.asyncio()
+    async def test_client(self) -> None:
+        """Test the client reads and writes the simulated controller."""
+        async with KebaKeEnergySimulator(heat_pumps=2, heat_circuits=1, hot_water_tanks=1, latency=0.01) as simulator:
+            async with KebaKeEnergyAPI(host=simulator.host) as client:
+                assert await client.get_positions() == Position(heat_pump=2, heat_circuit=1, hot_water_tank=1)
+                assert await client.heat_pump.get_name(position=1) == "Name 1"
+                assert -30 <= await client.system.get_outdoor_temperature() <= 40  # noqa: PLR2004
+
+                await client.heat_pump.set_operating_mode("on", position=1)
+
+                assert await client.heat_pump.get_operating_mode(position=1) == "on"
+
+                data: dict[str, Any] = await client.read_data(request=[HeatPump.HIGH_PRESSURE, System.OPERATING_MODE])
+
+                assert len(data["heat_pump"]["high_pressure"]) == 2  # noqa: PLR2004
+                assert data["system"]["operating_mode"]["value"] == "setup"
+
+                info: dict[str, Any] = await client.system.get_info()
+                device_info: dict[str, Any] = await client.system.get_device_info()
+
+                assert info["name"] == "KeEnergy.MTec"
+                assert device_info["name"] == "SIMULATOR"
+
+            assert simulator.requests > 0
+
+    @pytest.mark.asyncio()
+    async def test_errors(self) -> None:
+        """Test injected errors and invalid writes."""
+        async with KebaKeEnergySimulator(error_rate=1) as simulator:
+            async with KebaKeEnergyAPI(host=simulator.host) as client:
+                with pytest.raises(APIError, match="Simulated error!"):
+                    await client.system.get_outdoor_temperature()
+
+            assert simulator.errors == 1
+
+            simulator.error_rate = 0
+
+            async with KebaKeEnergyAPI(host=simulator.host) as client:
+                with pytest.raises(APIError, match="Read only variables!"):
+                    await client._post(  # noqa: SLF001
+                        payload='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "1"}]',
+                        endpoint="/var/readWriteVars?action=set",
+                    )
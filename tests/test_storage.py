@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.storage import ENCODING_RLE
+from keba_keenergy_api.storage import SegmentLog
+from keba_keenergy_api.storage import decode_block
+from keba_keenergy_api.storage import encode_block
+
+
+class TestBlockEncoding:
+    def test_xor(self) -> None:
+        """Test timestamps and floats are compressed without loss."""
+        timestamps: list[float] = [1700000000 + idx * 10 + (0.005 if idx % 7 == 0 else 0) for idx in range(256)]
+        values: list[float] = [20 + (idx // 8) * 0.1 for idx in range(256)]
+        payload: bytes = encode_block(timestamps, values)
+
+        assert len(payload) < 256 * 16 / 4
+        assert decode_block(payload, 256) == (
+            [round(timestamp * 1000) / 1000 for timestamp in timestamps],
+            values,
+        )
+
+    def test_rle(self) -> None:
+        """Test enum states are run length encoded."""
+        timestamps: list[float] = [float(idx) for idx in range(100)]
+        values: list[float] = [1.0] * 60 + [3.0] * 40
+        payload: bytes = encode_block(timestamps, values, encoding=ENCODING_RLE)
+
+        assert decode_block(payload, 100, encoding=ENCODING_RLE) == (timestamps, values)
+
+    @pytest.mark.parametrize("delta", [0.05, 1, 60, 3600, 86400 * 365, -10])
+    def test_timestamp_ranges(self, delta: float) -> None:
+        """Test all delta of delta ranges."""
+        timestamps: list[float] = [0, 1, 1 + delta, 2 + delta * 3]
+        values: list[float] = [0, -1.5, float("inf"), 1e300]
+
+        assert decode_block(encode_block(timestamps, values), 4) == (timestamps, values)
+
+
+class TestSegmentLog:
+    def test_read(self, tmp_path: Path) -> None:
+        """Test pending and written samples are read in a time range."""
+        with SegmentLog(tmp_path, block_size=4) as log:
+            for timestamp in range(10):
+                log.record("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", timestamp, str(timestamp * 1.5))
+                log.record("APPL.CtrlAppl.sParam.heatpump[0].param.name", timestamp, "MOCKED-NAME")
+
+            timestamps, values = log.read("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue")
+
+            assert timestamps.tolist() == list(range(10))
+            assert values.tolist() == [timestamp * 1.5 for timestamp in range(10)]
+
+            timestamps, values = log.read("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", start=3, end=8.5)
+
+            assert timestamps.tolist() == [3, 4, 5, 6, 7, 8]
+            assert log.read("APPL.CtrlAppl.sParam.heatpump[0].param.name")[0].tolist() == []
+
+    def test_reopen(self, tmp_path: Path) -> None:
+        """Test samples are persisted and appended after reopening."""
+        with SegmentLog(tmp_path) as log:
+            log.record("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", 1, "1")
+            log.record("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", 2, "3")
+
+        with SegmentLog(tmp_path) as log:
+            log.record("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", 3, "0")
+
+        with SegmentLog(tmp_path) as log:
+            timestamps, values = log.read("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState")
+
+        assert timestamps.tolist() == [1, 2, 3]
+        assert values.tolist() == [1, 3, 0]
+        assert len(list(tmp_path.glob("*.seg"))) == 1
+
+    def test_rollover(self, tmp_path: Path) -> None:
+        """Test new segments are created, if a block does not fit."""
+        with SegmentLog(tmp_path, segment_size=256, block_size=16) as log:
+            for timestamp in range(200):
+                log.record("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", timestamp, timestamp % 17 * 0.3)
+
+            timestamps, values = log.read("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue")
+
+        assert len(list(tmp_path.glob("*.seg"))) > 1
+        assert timestamps.tolist() == list(range(200))
+        assert values.tolist() == [timestamp % 17 * 0.3 for timestamp in range(200)]
+
+    @pytest.mark.asyncio()
+    async def test_read_storage(self, tmp_path: Path) -> None:
+        """Test read values are persisted."""
+        with aioresponses() as mock_keenergy_api:
+            for value in ("16.5", "17.5"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        {
+                            "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                            "attributes": {},
+                            "value": value,
+                        },
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            with SegmentLog(tmp_path) as log:
+                client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", storage=log)
+
+                await client.heat_pump.get_high_pressure()
+                await client.heat_pump.get_high_pressure()
+
+                assert client.storage is log
+
+            with SegmentLog(tmp_path) as log:
+                _, values = log.read("APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue")
+
+            assert values.tolist() == [16.5, 17.5]
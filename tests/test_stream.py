@@ -0,0 +1,144 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import StreamOverflow
+from keba_keenergy_api.error import APIError
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.stream import Snapshot
+    from keba_keenergy_api.stream import SnapshotStream
+
+
+def mock_high_pressure(mock_keenergy_api: aioresponses) -> None:
+    """Mock a repeated high pressure response."""
+    mock_keenergy_api.post(
+        "http://mocked-host/var/readWriteVars",
+        payload=[
+            {
+                "name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue",
+                "attributes": {},
+                "value": "16.5",
+            },
+        ],
+        headers={"Content-Type": "application/json;charset=utf-8"},
+        repeat=True,
+    )
+
+
+class TestSnapshotStream:
+    @pytest.mark.asyncio()
+    async def test_stream(self) -> None:
+        """Test stream timestamped snapshots."""
+        with aioresponses() as mock_keenergy_api:
+            mock_high_pressure(mock_keenergy_api)
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            snapshots: list[Snapshot] = []
+
+            async with client.stream(HeatPump.HIGH_PRESSURE, position=1, interval=0.01) as stream:
+                async for snapshot in stream:
+                    snapshots.append(snapshot)
+
+                    if len(snapshots) == 3:  # noqa: PLR2004
+                        break
+
+            assert [snapshot.data["heat_pump"] for snapshot in snapshots] == [
+                {"high_pressure": [{"value": 16.5, "attributes": {}}]},
+            ] * 3
+            assert snapshots[0].timestamp < snapshots[1].timestamp < snapshots[2].timestamp
+
+    @pytest.mark.asyncio()
+    async def test_drop_oldest(self) -> None:
+        """Test the oldest snapshots are dropped for a slow consumer."""
+        with aioresponses() as mock_keenergy_api:
+            mock_high_pressure(mock_keenergy_api)
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            stream: SnapshotStream = client.stream(HeatPump.HIGH_PRESSURE, position=1, interval=0.01, queue_size=2)
+
+            first: Snapshot = await anext(stream)
+            await asyncio.sleep(0.1)
+            second: Snapshot = await anext(stream)
+            await client.close()
+
+            assert stream.dropped > 0
+            assert second.timestamp - first.timestamp > 0.05  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    async def test_block(self) -> None:
+        """Test reading pauses for a slow consumer."""
+        with aioresponses() as mock_keenergy_api:
+            mock_high_pressure(mock_keenergy_api)
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            stream: SnapshotStream = client.stream(
+                HeatPump.HIGH_PRESSURE,
+                position=1,
+                interval=0.01,
+                queue_size=2,
+                overflow=StreamOverflow.BLOCK,
+            )
+
+            await anext(stream)
+            await asyncio.sleep(0.1)
+            await client.close()
+
+            assert stream.dropped == 0
+            assert len(next(iter(mock_keenergy_api.requests.values()))) <= 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("close_client", [False, True])
+    async def test_close_waiting_consumer(self, *, close_client: bool) -> None:
+        """Test closing the stream ends a consumer waiting for the next snapshot."""
+        with aioresponses() as mock_keenergy_api:
+            mock_high_pressure(mock_keenergy_api)
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            stream: SnapshotStream = client.stream(HeatPump.HIGH_PRESSURE, position=1, interval=60)
+
+            await anext(stream)
+            consumer: asyncio.Task[Snapshot] = asyncio.create_task(anext(stream))
+            await asyncio.sleep(0.01)
+
+            await (client.close() if close_client else stream.aclose())
+
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(consumer, timeout=1)
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(stream)
+
+    @pytest.mark.asyncio()
+    async def test_stream_error(self) -> None:
+        """Test errors are raised to the consumer and end the stream."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload={"developerMessage": "mocked-error"},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            stream: SnapshotStream = client.stream(HeatPump.HIGH_PRESSURE, position=1, interval=0.01)
+
+            with pytest.raises(APIError) as error:
+                await anext(stream)
+
+            assert str(error.value) == "mocked-error"
+
+            with pytest.raises(StopAsyncIteration):
+                await anext(stream)
+
+    def test_invalid_interval(self) -> None:
+        """Test invalid interval."""
+        client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+        with pytest.raises(APIError) as error:
+            client.stream(HeatPump.HIGH_PRESSURE, interval=0)
+
+        assert str(error.value) == "Invalid interval!"
@@ -0,0 +1,245 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.error import APIError
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import HeatCircuitEndpoints
+
+
+class TestWriteBuffer:
+    @pytest.mark.asyncio()
+    async def test_buffered_writes(self) -> None:
+        """Test buffered writes are sent with one request on exit."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            async with client.buffered_writes() as buffer:
+                await client.heat_circuit.set_day_temperature(21)
+                await client.heat_circuit.set_night_temperature(17)
+                await client.write_data(request={HeatCircuit.DAY_TEMPERATURE: [22], HeatCircuit.OPERATING_MODE: [1]})
+
+                assert len(buffer) == 3  # noqa: PLR2004
+                mock_keenergy_api.assert_not_called()
+
+            assert len(buffer) == 0
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars?action=set",
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.reducedSetTemp", "value": "17"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp", "value": "22"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.operatingMode", "value": "1"}]'
+                ),
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_buffered_writes_error(self) -> None:
+        """Test buffered writes are discarded if the block raises an exception."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            async def write_and_fail() -> None:
+                async with client.buffered_writes():
+                    await client.heat_circuit.set_day_temperature(21)
+                    await client.heat_circuit.set_night_temperature(17)
+
+                    msg: str = "mocked-error"
+                    raise RuntimeError(msg)
+
+            with pytest.raises(RuntimeError, match="mocked-error"):
+                await write_and_fail()
+
+            await client.heat_circuit.set_day_temperature(22)
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars?action=set",
+                data='[{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp", "value": "22"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_write_window(self) -> None:
+        """Test concurrent writes are sent with one request after the window."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", write_window=0.01)
+
+            await asyncio.gather(
+                client.heat_circuit.set_day_temperature(21),
+                client.hot_water_tank.set_max_temperature(50),
+            )
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars?action=set",
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp", "value": "21"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "value": "50"}]'
+                ),
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_write_window_error(self) -> None:
+        """Test every writer of a failed flush gets the error."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload={"developerMessage": "mocked-error"},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", write_window=0)
+            results: list[None | BaseException] = list(
+                await asyncio.gather(
+                    client.heat_circuit.set_day_temperature(21),
+                    client.heat_circuit.set_night_temperature(17),
+                    return_exceptions=True,
+                ),
+            )
+
+            assert all(isinstance(result, APIError) for result in results)
+            assert all(str(result) == "mocked-error" for result in results)
+
+
+class TestSkipUnchangedWrites:
+    @pytest.mark.asyncio()
+    async def test_skip_unchanged_read_value(self) -> None:
+        """Test writing the last read value is skipped."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.reducedSetTemp",
+                        "attributes": {},
+                        "value": "17.000000",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+
+            assert await client.heat_circuit.get_night_temperature() == 17  # noqa: PLR2004
+
+            skipped: list[str] = await client.write_data(
+                request={HeatCircuit.NIGHT_TEMPERATURE: [17], HeatCircuit.DAY_TEMPERATURE: [21]},
+                skip_unchanged=True,
+            )
+
+            assert skipped == ["APPL.CtrlAppl.sParam.heatCircuit[0].param.reducedSetTemp"]
+
+            mock_keenergy_api.assert_called_with(
+                url="http://mocked-host/var/readWriteVars?action=set",
+                data='[{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp", "value": "21"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_skip_unchanged_written_value(self) -> None:
+        """Test writing the last written value again is skipped."""
+        with aioresponses() as mock_keenergy_api:
+            for _ in range(2):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars?action=set",
+                    payload=[{}],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", skip_unchanged_writes=True)
+
+            await client.heat_circuit.set_night_temperature(17)
+            await client.heat_circuit.set_night_temperature(17)
+
+            assert await client.write_data(request={HeatCircuit.NIGHT_TEMPERATURE: [17]}) == [
+                "APPL.CtrlAppl.sParam.heatCircuit[0].param.reducedSetTemp",
+            ]
+            assert await client.write_data(request={HeatCircuit.NIGHT_TEMPERATURE: [17]}, skip_unchanged=False) == []
+
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio()
+    async def test_buffered_write_back_to_unchanged_value(self) -> None:
+        """Test writing the last known value again removes a pending write of another value."""
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", skip_unchanged_writes=True)
+
+            await client.heat_circuit.set_day_temperature(20)
+
+            async with client.buffered_writes():
+                await client.heat_circuit.set_day_temperature(21)
+                await client.heat_circuit.set_day_temperature(20)
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars?action=set",
+                data='[{"name": "APPL.CtrlAppl.sParam.heatCircuit[0].param.normalSetTemp", "value": "20"}]',
+                method="POST",
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio()
+    async def test_toggle_skip_unchanged_writes(self) -> None:
+        """Test changing skip_unchanged_writes applies to the client and all its endpoints."""
+        with aioresponses() as mock_keenergy_api:
+            for _ in range(3):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars?action=set",
+                    payload=[{}],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            heat_circuit: HeatCircuitEndpoints = client.heat_circuit
+
+            await heat_circuit.set_night_temperature(17)
+            client.skip_unchanged_writes = True
+
+            await heat_circuit.set_night_temperature(17)
+            assert await client.write_data(request={HeatCircuit.NIGHT_TEMPERATURE: [17]}) == [
+                "APPL.CtrlAppl.sParam.heatCircuit[0].param.reducedSetTemp",
+            ]
+
+            client.skip_unchanged_writes = False
+
+            await heat_circuit.set_night_temperature(17)
+            assert await client.write_data(request={HeatCircuit.NIGHT_TEMPERATURE: [17]}) == []
+
+            assert len(next(iter(mock_keenergy_api.requests.values()))) == 3  # noqa: PLR2004